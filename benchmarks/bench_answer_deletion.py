@@ -0,0 +1,65 @@
+"""
+Compares answer deletion through SELECT followed by ORM delete
+with single DELETE ... RETURNING statement used by repository.
+"""
+import asyncio
+from argparse import Namespace
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from common import make_parser, make_session_maker, measure_concurrently, print_report
+from qna_server.storage.sqla_implementation import AnswerRepositorySQLA, TransactionManagerSQLA
+from qna_server.storage.sqla_implementation.tables import AnswerTable, QuestionTable
+
+
+async def seed_answers(session_maker: async_sessionmaker[AsyncSession], amount: int) -> list[int]:
+    async with session_maker() as session:
+        question_id: int = (
+            await session.execute(
+                insert(QuestionTable).values(text="Deletion benchmark").returning(QuestionTable.id)
+            )
+        ).scalar_one()
+        answer_ids: list[int] = list(
+            (
+                await session.execute(
+                    insert(AnswerTable).returning(AnswerTable.id),
+                    [
+                        {"question_id": question_id, "user_id": "bench", "text": f"Answer {i}"}
+                        for i in range(amount)
+                    ]
+                )
+            ).scalars()
+        )
+        await session.commit()
+
+    return answer_ids
+
+
+async def main(args: Namespace) -> None:
+    engine, session_maker = make_session_maker(args.config)
+
+    async def select_then_delete(answer_id: int) -> None:
+        async with session_maker() as session:
+            answer: AnswerTable = await session.get_one(AnswerTable, answer_id)
+            await session.delete(answer)
+            await session.commit()
+
+    async def delete_returning(answer_id: int) -> None:
+        await AnswerRepositorySQLA(TransactionManagerSQLA(session_maker)).delete_answer(answer_id)
+
+    for name, operation in (
+        ("SELECT + ORM delete", select_then_delete),
+        ("DELETE ... RETURNING", delete_returning),
+    ):
+        answer_ids: list[int] = await seed_answers(session_maker, args.answers)
+        elapsed, latencies = await measure_concurrently(operation, answer_ids, args.concurrency)
+        print_report(name, elapsed, latencies)
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = make_parser(__doc__ or "")
+    parser.add_argument("--answers", type=int, default=2000, help="Amount of answers to delete")
+    asyncio.run(main(parser.parse_args()))
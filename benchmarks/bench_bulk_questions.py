@@ -0,0 +1,48 @@
+"""
+Compares creating questions one by one with creating them in bulk.
+"""
+import asyncio
+import time
+from argparse import Namespace
+
+from common import make_parser, make_session_maker, measure_concurrently, print_report
+from qna_server.dto import CreateQuestion
+from qna_server.storage.sqla_implementation import QuestionsRepositorySQLA, TransactionManagerSQLA
+
+
+async def main(args: Namespace) -> None:
+    engine, session_maker = make_session_maker(args.config)
+    questions_content: list[CreateQuestion] = [
+        CreateQuestion(text=f"Bulk benchmark question {i}") for i in range(args.questions)
+    ]
+
+    async def create_one(question_content: CreateQuestion) -> None:
+        await QuestionsRepositorySQLA(
+            TransactionManagerSQLA(session_maker)
+        ).create_new_question(question_content)
+
+    elapsed, latencies = await measure_concurrently(create_one, questions_content, args.concurrency)
+    print_report("Per item create", elapsed, latencies)
+
+    async def create_batch(batch: list[CreateQuestion]) -> None:
+        await QuestionsRepositorySQLA(
+            TransactionManagerSQLA(session_maker)
+        ).create_questions_bulk(batch)
+
+    batches: list[list[CreateQuestion]] = [
+        questions_content[i:i + args.batch_size]
+        for i in range(0, len(questions_content), args.batch_size)
+    ]
+    started_at: float = time.perf_counter()
+    elapsed, latencies = await measure_concurrently(create_batch, batches, args.concurrency)
+    print_report(f"Bulk create by {args.batch_size} (batches)", elapsed, latencies)
+    print(f"{'Bulk create rows':<32} {len(questions_content) / (time.perf_counter() - started_at):>10.1f} rows/s")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = make_parser(__doc__ or "")
+    parser.add_argument("--questions", type=int, default=5000, help="Amount of questions to create")
+    parser.add_argument("--batch-size", type=int, default=500, help="Amount of questions in one bulk request")
+    asyncio.run(main(parser.parse_args()))
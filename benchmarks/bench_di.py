@@ -0,0 +1,62 @@
+"""
+Measures cost of resolving dependencies of hot endpoints for every request
+with dependency container made the same way server does.
+
+Database is not queried, but engine is made from configuration file.
+"""
+import asyncio
+import time
+from argparse import Namespace
+
+from dishka import AsyncContainer
+
+from common import make_parser
+from qna_server.api.server import make_container
+from qna_server.storage.cache import QuestionsCache
+from qna_server.use_cases import AnswersUseCases, QuestionsUseCases
+from qna_server.utils.config_schema import AppConfig, load_config
+from qna_server.utils.engine_factory import create_engine_from_settings
+
+
+async def measure_resolution(
+    name: str,
+    container: AsyncContainer,
+    dependencies: list[type],
+    requests: int
+) -> None:
+    started_at: float = time.perf_counter()
+    for _ in range(requests):
+        async with container() as request_container:
+            for dependency in dependencies:
+                await request_container.get(dependency)
+
+    elapsed: float = time.perf_counter() - started_at
+    print(f"{name:<40} {elapsed / requests * 1_000_000:>8.2f} us/request")
+
+
+async def main(args: Namespace) -> None:
+    config: AppConfig = load_config(args.config)
+    engine = create_engine_from_settings(config.db_settings)
+    questions_cache: QuestionsCache = QuestionsCache(
+        max_size=config.cache.max_size,
+        ttl=config.cache.ttl_seconds,
+        negative_ttl=config.cache.negative_ttl_seconds
+    )
+    container: AsyncContainer = make_container(config, engine, questions_cache)
+
+    await measure_resolution("request scope only", container, [], args.requests)
+    await measure_resolution(
+        "questions endpoints (QuestionsUseCases)", container, [QuestionsUseCases], args.requests
+    )
+    await measure_resolution(
+        "answers endpoints (AnswersUseCases)", container, [AnswersUseCases], args.requests
+    )
+
+    await container.close()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = make_parser(__doc__ or "")
+    parser.add_argument("--requests", type=int, default=50_000, help="Amount of measured requests")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,78 @@
+"""
+Measures cost of encoding list and detail responses through FastAPI response model
+and through bytes serialized by pydantic at once.
+
+Data is kept in memory, so only serialization of responses is measured.
+"""
+import asyncio
+from argparse import Namespace
+from datetime import datetime, timezone
+
+import httpx
+from fastapi import FastAPI, Response
+
+from common import make_parser, measure_concurrently, print_report
+from qna_server.api.endpoints.json_responses import DTOJSONResponse
+from qna_server.api.endpoints.questions_endpoints import question_with_answers_adapter, questions_adapter
+from qna_server.dto import Answer, Question, QuestionWithAnswers
+
+
+def make_app(questions: list[Question], question: QuestionWithAnswers) -> FastAPI:
+    app: FastAPI = FastAPI()
+
+    @app.get("/model/questions", response_model=list[Question])
+    async def list_through_model() -> list[Question]:
+        return questions
+
+    @app.get("/bytes/questions", response_model=list[Question])
+    async def list_as_bytes() -> Response:
+        return DTOJSONResponse(questions, questions_adapter)
+
+    @app.get("/model/question", response_model=QuestionWithAnswers)
+    async def detail_through_model() -> QuestionWithAnswers:
+        return question
+
+    @app.get("/bytes/question", response_model=QuestionWithAnswers)
+    async def detail_as_bytes() -> Response:
+        return DTOJSONResponse(question, question_with_answers_adapter)
+
+    return app
+
+
+async def main(args: Namespace) -> None:
+    now: datetime = datetime.now(timezone.utc)
+    questions: list[Question] = [
+        Question(id=i, text=f"Serialization benchmark question {i}", created_at=now)
+        for i in range(args.questions)
+    ]
+    question: QuestionWithAnswers = QuestionWithAnswers(
+        id=0,
+        text="Serialization benchmark question with answers",
+        created_at=now,
+        answers=[
+            Answer(id=i, question_id=0, user_id="bench", text=f"Answer {i}", created_at=now)
+            for i in range(args.answers)
+        ],
+        answers_total=args.answers
+    )
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=make_app(questions, question)),
+        base_url="http://bench"
+    ) as client:
+        for path in ("/model/questions", "/bytes/questions", "/model/question", "/bytes/question"):
+            async def request(_: int) -> None:
+                response: httpx.Response = await client.get(path)
+                response.raise_for_status()
+
+            await request(0)  # Warm up serializers
+            elapsed, latencies = await measure_concurrently(request, range(args.requests), args.concurrency)
+            print_report(path, elapsed, latencies)
+
+
+if __name__ == "__main__":
+    parser = make_parser(__doc__ or "")
+    parser.add_argument("--questions", type=int, default=5_000, help="Amount of questions in list response")
+    parser.add_argument("--answers", type=int, default=1_000, help="Amount of answers in detail response")
+    parser.add_argument("--requests", type=int, default=100, help="Amount of measured requests per endpoint")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,99 @@
+"""
+Measures time event loop spends in logging calls: for disabled debug records
+built with f-strings and with lazy formatting, and for records written
+by handler in the event loop and by background logging.
+
+Records are written to a file, in the format used by server.
+Output that can not keep up, such as a pipe to a busy log collector,
+is simulated by waiting after every written record.
+"""
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+from argparse import Namespace
+from datetime import datetime, timezone
+from typing import Callable
+
+from qna_server.custom_types import current_context_id, generate_context_id
+from qna_server.dto import Question
+from qna_server.utils.background_logging import BackgroundLogging
+
+LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)-8s :: Context ID [%(context_id)s] : %(message)s"
+
+
+class SlowFileHandler(logging.FileHandler):
+    def __init__(self, filename: str, write_delay: float):
+        super().__init__(filename, mode="w")
+        self.write_delay: float = write_delay
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        if self.write_delay:
+            time.sleep(self.write_delay)
+
+
+async def measure_in_loop(name: str, log: Callable[[int], None], records: int) -> None:
+    started_at: float = time.perf_counter()
+    for i in range(records):
+        log(i)
+
+    elapsed: float = time.perf_counter() - started_at
+    print(f"{name:<48} {elapsed / records * 1_000_000:>8.2f} us/record in event loop")
+
+
+async def main(args: Namespace) -> None:
+    logger: logging.Logger = logging.getLogger("qna_bench_logger")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    handler: logging.Handler = SlowFileHandler(args.output, args.write_delay_us / 1_000_000)
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    logger.addHandler(handler)
+
+    current_context_id.set(generate_context_id())
+    question: Question = Question(
+        id=1, text="Logging benchmark question", created_at=datetime.now(timezone.utc)
+    )
+
+    await measure_in_loop(
+        "disabled debug, f-string with DTO",
+        lambda i: logger.debug(f"Processed {question}"),
+        args.records
+    )
+    await measure_in_loop(
+        "disabled debug, lazy formatting",
+        lambda i: logger.debug("Processed %s", question),
+        args.records
+    )
+    await measure_in_loop(
+        "info, handler in event loop",
+        lambda i: logger.info("Fetched question with ID=%s", i),
+        args.records
+    )
+
+    background_logging: BackgroundLogging = BackgroundLogging()
+    background_logging.start()
+    await measure_in_loop(
+        "info, background logging",
+        lambda i: logger.info("Fetched question with ID=%s", i),
+        args.records
+    )
+
+    started_at: float = time.perf_counter()
+    background_logging.stop()
+    print(f"{'writing queued records on shutdown':<48} {time.perf_counter() - started_at:>8.2f} s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=100_000, help="Amount of records of each kind")
+    parser.add_argument(
+        "--write-delay-us", type=float, default=0.0,
+        help="Time output is blocked for after every written record"
+    )
+    parser.add_argument(
+        "--output", default=tempfile.NamedTemporaryFile(suffix=".log", delete=False).name,
+        help="File records are written to"
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,95 @@
+"""
+Measures overhead of collecting metrics: time metrics middleware adds to a request
+to an endpoint doing nothing, and time statement timers add to executing a trivial query.
+"""
+import asyncio
+import time
+from argparse import Namespace
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from common import make_parser
+from qna_server.metrics import AppMetrics, MetricsMiddleware, instrument_engine
+from qna_server.storage.sqla_implementation.tables import QuestionTable
+from qna_server.utils.config_schema import AppConfig, load_config
+from qna_server.utils.engine_factory import create_engine_from_settings
+
+
+class Route:
+    path: str = "/api/questions/{question_id}"
+
+
+async def empty_endpoint(scope: Scope, receive: Receive, send: Send) -> None:
+    scope["route"] = Route
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def receive() -> Message:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message: Message) -> None:
+    pass
+
+
+async def measure_requests(name: str, app: ASGIApp, requests: int) -> float:
+    started_at: float = time.perf_counter()
+    for _ in range(requests):
+        scope: Scope = {"type": "http", "method": "GET", "path": "/api/questions/1"}
+        await app(scope, receive, send)
+
+    per_request: float = (time.perf_counter() - started_at) / requests * 1_000_000
+    print(f"{name:<40} {per_request:>8.2f} us/request")
+    return per_request
+
+
+async def measure_statements(name: str, engine: AsyncEngine, statements: int) -> float:
+    query = select(QuestionTable.id).where(QuestionTable.id == 1)
+    async with engine.connect() as connection:
+        # Warms up statement caches of SQLAlchemy and driver
+        await connection.execute(query)
+
+        started_at: float = time.perf_counter()
+        for _ in range(statements):
+            await connection.execute(query)
+
+        per_statement: float = (time.perf_counter() - started_at) / statements * 1_000_000
+
+    print(f"{name:<40} {per_statement:>8.2f} us/statement")
+    return per_statement
+
+
+async def main(args: Namespace) -> None:
+    metrics: AppMetrics = AppMetrics()
+
+    bare: float = await measure_requests("request without metrics", empty_endpoint, args.requests)
+    measured: float = await measure_requests(
+        "request with metrics middleware", MetricsMiddleware(empty_endpoint, metrics), args.requests
+    )
+    print(f"{'middleware overhead':<40} {measured - bare:>8.2f} us/request")
+
+    config: AppConfig = load_config(args.config)
+    plain_engine: AsyncEngine = create_engine_from_settings(config.db_settings)
+    instrumented_engine: AsyncEngine = create_engine_from_settings(config.db_settings)
+    instrument_engine(instrumented_engine, metrics, "primary")
+
+    bare = await measure_statements("statement without metrics", plain_engine, args.statements)
+    measured = await measure_statements(
+        "statement with metrics", instrumented_engine, args.statements
+    )
+    print(f"{'statement timers overhead':<40} {measured - bare:>8.2f} us/statement")
+
+    await plain_engine.dispose()
+    await instrumented_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = make_parser(__doc__ or "")
+    parser.add_argument("--requests", type=int, default=200_000, help="Amount of measured requests")
+    parser.add_argument(
+        "--statements", type=int, default=5_000, help="Amount of measured statements"
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,77 @@
+"""
+Measures per-row cost of reads through ORM objects and through plain rows.
+"""
+import asyncio
+import time
+from argparse import Namespace
+from typing import Awaitable, Callable
+
+from common import make_parser, make_session_maker
+from qna_server.custom_types import ReadMode
+from qna_server.dto import CreateAnswer, CreateQuestion, Question
+from qna_server.storage.sqla_implementation import (
+    AnswerRepositorySQLA,
+    QuestionsRepositorySQLA,
+    TransactionManagerSQLA,
+)
+
+
+async def measure_per_row(
+    name: str,
+    read: Callable[[], Awaitable[int]],
+    repeats: int
+) -> None:
+    await read()  # Warm up connections and statement caches
+
+    rows: int = 0
+    started_at: float = time.perf_counter()
+    for _ in range(repeats):
+        rows += await read()
+
+    elapsed: float = time.perf_counter() - started_at
+    print(f"{name:<40} {elapsed / rows * 1_000_000:>8.2f} us/row  ({rows // repeats} rows per call)")
+
+
+async def main(args: Namespace) -> None:
+    engine, session_maker = make_session_maker(args.config)
+    seeding_transaction: TransactionManagerSQLA = TransactionManagerSQLA(session_maker)
+
+    await QuestionsRepositorySQLA(seeding_transaction).create_questions_bulk(
+        [CreateQuestion(text=f"Read benchmark question {i}") for i in range(args.questions)]
+    )
+    question: Question = await QuestionsRepositorySQLA(seeding_transaction).create_new_question(
+        CreateQuestion(text="Read benchmark question with answers")
+    )
+    await AnswerRepositorySQLA(seeding_transaction).create_answers_bulk(
+        [
+            (question.id, CreateAnswer(text=f"Answer {i}", user_id="bench"))
+            for i in range(args.answers)
+        ]
+    )
+
+    for read_mode in ReadMode:
+        repo: QuestionsRepositorySQLA = QuestionsRepositorySQLA(
+            TransactionManagerSQLA(session_maker),
+            read_mode=read_mode
+        )
+
+        async def read_all_questions() -> int:
+            return len(await repo.get_all_questions())
+
+        async def read_question_answers() -> int:
+            question_data = await repo.fetch_specific_question(question.id)
+            assert question_data is not None
+            return len(question_data.answers)
+
+        await measure_per_row(f"get_all_questions [{read_mode}]", read_all_questions, args.repeats)
+        await measure_per_row(f"fetch_specific_question [{read_mode}]", read_question_answers, args.repeats)
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = make_parser(__doc__ or "")
+    parser.add_argument("--questions", type=int, default=10_000, help="Amount of questions to seed")
+    parser.add_argument("--answers", type=int, default=10_000, help="Amount of answers to one question")
+    parser.add_argument("--repeats", type=int, default=5, help="Amount of measured calls")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,89 @@
+"""
+Measures memory allocated while reading all questions in every read mode:
+peak of traced allocations, amount of memory blocks kept by the result
+and growth of resident set size of the process.
+
+Every read mode is measured in a separate process, so they do not reuse memory of each other.
+"""
+import asyncio
+import gc
+import multiprocessing
+import resource
+import tracemalloc
+from argparse import Namespace
+from pathlib import Path
+
+from common import make_parser, make_session_maker
+from qna_server.custom_types import ReadMode
+from qna_server.dto import CreateQuestion, Question
+from qna_server.storage.sqla_implementation import QuestionsRepositorySQLA, TransactionManagerSQLA
+
+
+def max_rss_kib() -> int:
+    # Linux reports maximum resident set size in kibibytes
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+async def read_all_questions(config_path: Path, read_mode: ReadMode) -> None:
+    engine, session_maker = make_session_maker(config_path)
+    repo: QuestionsRepositorySQLA = QuestionsRepositorySQLA(
+        TransactionManagerSQLA(session_maker),
+        read_mode=read_mode
+    )
+    await repo.get_question_version(0)  # Warm up connection and statement caches
+    gc.collect()
+
+    rss_before: int = max_rss_kib()
+    questions: list[Question] = await repo.get_all_questions()
+    rss_growth: int = max_rss_kib() - rss_before
+    del questions
+    gc.collect()
+
+    tracemalloc.start()
+    questions = await repo.get_all_questions()
+    kept: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    kept_blocks: int = sum(stat.count for stat in kept.statistics("filename"))
+    print(
+        f"get_all_questions [{read_mode}] {len(questions)} rows:"
+        f"  peak={peak / 2 ** 20:.1f}MiB"
+        f"  kept={kept_blocks / len(questions):.1f} blocks/row"
+        f"  rss_growth={rss_growth / 2 ** 10:.1f}MiB"
+    )
+    await engine.dispose()
+
+
+def measure_in_process(config_path: Path, read_mode: ReadMode) -> None:
+    asyncio.run(read_all_questions(config_path, read_mode))
+
+
+async def seed(config_path: Path, questions: int) -> None:
+    engine, session_maker = make_session_maker(config_path)
+    repo: QuestionsRepositorySQLA = QuestionsRepositorySQLA(TransactionManagerSQLA(session_maker))
+    for offset in range(0, questions, 1000):
+        await repo.create_questions_bulk(
+            [
+                CreateQuestion(text=f"Memory benchmark question {i}")
+                for i in range(offset, min(offset + 1000, questions))
+            ]
+        )
+
+    await engine.dispose()
+
+
+def main(args: Namespace) -> None:
+    asyncio.run(seed(args.config, args.questions))
+
+    context = multiprocessing.get_context("spawn")
+    for read_mode in ReadMode:
+        process = context.Process(target=measure_in_process, args=(args.config, read_mode))
+        process.start()
+        process.join()
+
+
+if __name__ == "__main__":
+    parser = make_parser(__doc__ or "")
+    parser.add_argument("--questions", type=int, default=100_000, help="Amount of questions to seed")
+    main(parser.parse_args())
@@ -0,0 +1,96 @@
+"""
+Helpers shared by benchmark scripts.
+
+Benchmarks run against database configured in server configuration file,
+which must already be migrated to the latest revision.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterable, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from qna_server.utils.config_schema import AppConfig, load_config
+
+T = TypeVar("T")
+
+
+def make_parser(description: str) -> argparse.ArgumentParser:
+    """
+    Creates argument parser with options common for all benchmarks.
+
+    :param description: Description of a benchmark.
+    :return: Argument parser.
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--config", type=Path, default=Path("config.toml"),
+        help="Path to server configuration file with database settings"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=16,
+        help="Amount of operations running at the same time"
+    )
+    return parser
+
+
+def make_session_maker(config_path: Path) -> tuple[AsyncEngine, async_sessionmaker[AsyncSession]]:
+    """
+    Creates engine and session maker the same way server does.
+
+    :param config_path: Path to server configuration file.
+    :return: Engine and session maker bound to it.
+    """
+    config: AppConfig = load_config(config_path)
+    engine: AsyncEngine = create_async_engine(config.db_settings.connection_string)
+
+    return engine, async_sessionmaker(engine, expire_on_commit=False)
+
+
+async def measure_concurrently(
+    operation: Callable[[T], Awaitable[Any]],
+    items: Iterable[T],
+    concurrency: int
+) -> tuple[float, list[float]]:
+    """
+    Runs operation for every item keeping specified amount of them in flight.
+
+    :param operation: Operation to measure.
+    :param items: Arguments for each operation call.
+    :param concurrency: Maximum amount of operations running at the same time.
+    :return: Total elapsed time and latency of each call in seconds.
+    """
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def run(item: T) -> None:
+        async with semaphore:
+            started_at: float = time.perf_counter()
+            await operation(item)
+            latencies.append(time.perf_counter() - started_at)
+
+    started_at: float = time.perf_counter()
+    await asyncio.gather(*(run(item) for item in items))
+
+    return time.perf_counter() - started_at, latencies
+
+
+def print_report(name: str, elapsed: float, latencies: list[float]) -> None:
+    """
+    Prints throughput and latency percentiles of measured operations.
+
+    :param name: Name of measured variant.
+    :param elapsed: Total elapsed time in seconds.
+    :param latencies: Latency of each operation in seconds.
+    :return: Nothing.
+    """
+    quantiles: list[float] = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:<32} {len(latencies) / elapsed:>10.1f} ops/s"
+        f"  p50={quantiles[49] * 1000:.2f}ms"
+        f"  p95={quantiles[94] * 1000:.2f}ms"
+        f"  p99={quantiles[98] * 1000:.2f}ms"
+    )
@@ -26,6 +26,11 @@ target_metadata = BaseTable.metadata
 # my_important_option = config.get_main_option("my_important_option")
 # ... etc.
 
+# Database can be chosen without editing ini file: alembic -x url=sqlite+aiosqlite:///qna.db upgrade head
+url_override = context.get_x_argument(as_dictionary=True).get("url")
+if url_override:
+    config.set_main_option("sqlalchemy.url", url_override)
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
@@ -52,7 +57,12 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        # SQLite alters tables by recreating them, so new migrations are generated in batch mode
+        render_as_batch=connection.dialect.name == "sqlite"
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,34 @@
+"""Answer question_id index
+
+Revision ID: 5c408046db06
+Revises: 6e656dac220a
+Create Date: 2026-10-18 11:02:47.118354
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c408046db06'
+down_revision: Union[str, Sequence[str], None] = '6e656dac220a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Leading question_id column serves FK lookups and cascades,
+    # the rest keeps answers of a question ordered by creation time.
+    op.create_index(
+        'ix_answer_question_id_created_at_id',
+        'answer',
+        ['question_id', 'created_at', 'id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_answer_question_id_created_at_id', table_name='answer')
@@ -0,0 +1,27 @@
+"""Question keyset pagination index
+
+Revision ID: 6e656dac220a
+Revises: fbba0552cf6f
+Create Date: 2026-10-18 10:12:31.402917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e656dac220a'
+down_revision: Union[str, Sequence[str], None] = 'fbba0552cf6f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_question_created_at_id', 'question', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_question_created_at_id', table_name='question')
@@ -0,0 +1,43 @@
+"""Cascade answers deletion
+
+Revision ID: 9a12c177338a
+Revises: 5c408046db06
+Create Date: 2026-10-18 11:48:05.530672
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a12c177338a'
+down_revision: Union[str, Sequence[str], None] = '5c408046db06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Batch mode recreates table in SQLite, which can not alter constraints
+    with op.batch_alter_table('answer') as batch_op:
+        batch_op.drop_constraint('answer_question_id_fkey', type_='foreignkey')
+        batch_op.create_foreign_key(
+            'answer_question_id_fkey',
+            'question',
+            ['question_id'],
+            ['id'],
+            ondelete='CASCADE'
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('answer') as batch_op:
+        batch_op.drop_constraint('answer_question_id_fkey', type_='foreignkey')
+        batch_op.create_foreign_key(
+            'answer_question_id_fkey',
+            'question',
+            ['question_id'],
+            ['id']
+        )
@@ -0,0 +1,59 @@
+"""Question updated_at
+
+Revision ID: c7ce46c92bea
+Revises: 9a12c177338a
+Create Date: 2026-10-18 12:31:40.204815
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7ce46c92bea'
+down_revision: Union[str, Sequence[str], None] = '9a12c177338a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def utc_now() -> sa.TextClause:
+    """Current time default, with microseconds in SQLite that has no now()."""
+    if op.get_context().dialect.name == 'sqlite':
+        return sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))")
+
+    return sa.text('now()')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite can not add columns with non-constant defaults, so the table is recreated there
+    with op.batch_alter_table(
+        'question',
+        recreate='always' if op.get_context().dialect.name == 'sqlite' else 'auto'
+    ) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                'updated_at',
+                sa.DateTime(timezone=True),
+                server_default=utc_now(),
+                nullable=False
+            )
+        )
+    # Existing questions were last changed when their latest answer was created
+    op.execute(
+        """
+        UPDATE question
+        SET updated_at = coalesce(
+            (SELECT max(answer.created_at) FROM answer WHERE answer.question_id = question.id),
+            question.created_at
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('question') as batch_op:
+        batch_op.drop_column('updated_at')
@@ -0,0 +1,72 @@
+"""Question answer_count and last_answer_at
+
+Revision ID: da9e8bb0c174
+Revises: c7ce46c92bea
+Create Date: 2026-10-18 13:05:12.871530
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'da9e8bb0c174'
+down_revision: Union[str, Sequence[str], None] = 'c7ce46c92bea'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'question',
+        sa.Column('answer_count', sa.Integer(), server_default='0', nullable=False)
+    )
+    op.add_column(
+        'question',
+        sa.Column('last_answer_at', sa.DateTime(timezone=True), nullable=True)
+    )
+    op.execute(
+        """
+        UPDATE question
+        SET answer_count = answer_stats.answer_count,
+            last_answer_at = answer_stats.last_answer_at
+        FROM (
+            SELECT question_id, count(*) AS answer_count, max(created_at) AS last_answer_at
+            FROM answer
+            GROUP BY question_id
+        ) AS answer_stats
+        WHERE answer_stats.question_id = question.id
+        """
+    )
+    op.create_index(
+        'ix_question_answer_count_id',
+        'question',
+        ['answer_count', 'id'],
+        unique=False
+    )
+    # SQLite puts NULLs last in descending order already and does not accept NULLS LAST in indexes
+    op.create_index(
+        'ix_question_last_answer_at_id',
+        'question',
+        [
+            sa.text(
+                'last_answer_at DESC'
+                if op.get_context().dialect.name == 'sqlite' else
+                'last_answer_at DESC NULLS LAST'
+            ),
+            sa.text('id DESC')
+        ],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_question_last_answer_at_id', table_name='question')
+    op.drop_index('ix_question_answer_count_id', table_name='question')
+    with op.batch_alter_table('question') as batch_op:
+        batch_op.drop_column('last_answer_at')
+        batch_op.drop_column('answer_count')
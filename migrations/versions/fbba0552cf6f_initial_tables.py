@@ -18,13 +18,21 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+def utc_now() -> sa.TextClause:
+    """Current time default, with microseconds in SQLite that has no now()."""
+    if op.get_context().dialect.name == 'sqlite':
+        return sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))")
+
+    return sa.text('now()')
+
+
 def upgrade() -> None:
     """Upgrade schema."""
     # ### commands auto generated by Alembic - please adjust! ###
     op.create_table('question',
     sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
     sa.Column('text', sa.String(length=2048), nullable=False),
-    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=utc_now(), nullable=False),
     sa.PrimaryKeyConstraint('id')
     )
     op.create_table('answer',
@@ -32,8 +40,8 @@ def upgrade() -> None:
     sa.Column('question_id', sa.Integer(), nullable=False),
     sa.Column('user_id', sa.String(length=320), nullable=False),
     sa.Column('text', sa.String(length=2048), nullable=False),
-    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-    sa.ForeignKeyConstraint(['question_id'], ['question.id'], ),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=utc_now(), nullable=False),
+    sa.ForeignKeyConstraint(['question_id'], ['question.id'], name='answer_question_id_fkey'),
     sa.PrimaryKeyConstraint('id')
     )
     # ### end Alembic commands ###
@@ -1,5 +1,8 @@
 import logging.config
 from pathlib import Path
+from typing import Any
+
+from qna_server.custom_types import current_context_id
 
 
 def init_logging(file_path: Path) -> None:
@@ -7,5 +10,15 @@ def init_logging(file_path: Path) -> None:
         file_path
     )
 
+    make_record = logging.getLogRecordFactory()
+
+    def make_record_with_context_id(*args: Any, **kwargs: Any) -> logging.LogRecord:
+        # Read when record is made, since it may be formatted later in another thread
+        record: logging.LogRecord = make_record(*args, **kwargs)
+        record.context_id = current_context_id.get()
+        return record
+
+    logging.setLogRecordFactory(make_record_with_context_id)
+
 
 init_logging(Path(__file__).parent.parent.parent / "logging.conf")
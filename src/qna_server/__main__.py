@@ -2,14 +2,77 @@ import argparse
 from pathlib import Path
 
 from qna_server.api.server import main
-from qna_server.utils.config_schema import AppConfig, load_config
+from qna_server.bench import add_bench_arguments, run_bench
+from qna_server.utils.config_schema import AppConfig, ServerSettings, load_config
 
 parser: argparse.ArgumentParser = argparse.ArgumentParser(
     prog="qna_server",
     add_help=True,
     description="Hosts a web server with demo questions and answers api"
 )
+parser.add_argument(
+    "--config",
+    type=Path,
+    default=Path("config.toml"),
+    help="Path to configuration file"
+)
+parser.add_argument(
+    "--workers",
+    type=int,
+    help="Amount of worker processes, overrides configuration file"
+)
+parser.add_argument(
+    "--loop",
+    choices=["auto", "asyncio", "uvloop"],
+    help="Event loop implementation, overrides configuration file"
+)
+parser.add_argument(
+    "--http",
+    choices=["auto", "h11", "httptools"],
+    help="HTTP protocol implementation, overrides configuration file"
+)
+parser.add_argument(
+    "--reuse-port",
+    action=argparse.BooleanOptionalAction,
+    default=None,
+    help="Gives every worker its own socket bound with SO_REUSEPORT, overrides configuration file"
+)
+
+commands = parser.add_subparsers(dest="command", metavar="command")
+add_bench_arguments(
+    commands.add_parser(
+        "bench",
+        help="Runs load benchmark and reports throughput and latency per endpoint",
+        description="Seeds dataset and runs mixed read and write workload against in-process app "
+                    "or running server, reporting throughput and latency percentiles per endpoint"
+    )
+)
+
+
+def serve(args: argparse.Namespace) -> None:
+    config: AppConfig = load_config(args.config)
+
+    server_overrides: dict[str, object] = {
+        name: value
+        for name, value in (
+            ("workers", args.workers),
+            ("loop", args.loop),
+            ("http", args.http),
+            ("reuse_port", args.reuse_port),
+        )
+        if value is not None
+    }
+    if server_overrides:
+        config.server = ServerSettings.model_validate(
+            config.server.model_dump() | server_overrides
+        )
+
+    main(config, args.config)
+
 
-config: AppConfig = load_config(Path("config.toml"))
+args: argparse.Namespace = parser.parse_args()
+if args.command == "bench":
+    run_bench(args)
 
-main(config)
+else:
+    serve(args)
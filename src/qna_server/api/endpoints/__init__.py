@@ -1,5 +1,7 @@
-from .api_router import api
+from .api_router import api, internal_api, metrics_api
 
 __all__ = [
     "api",
+    "internal_api",
+    "metrics_api",
 ]
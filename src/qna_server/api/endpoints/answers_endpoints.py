@@ -2,7 +2,7 @@ from dishka import FromDishka
 from fastapi import HTTPException
 from starlette.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_404_NOT_FOUND
 
-from qna_server.dto import Answer, AnswerDeletionConfirmation, CreateAnswer
+from qna_server.dto import Answer, AnswerDeletionConfirmation, AnswersBulkResult, CreateAnswer, CreateAnswersBulk
 from qna_server.exceptions import DataIntegrityError, NotFoundError
 from qna_server.use_cases import AnswersUseCases
 from .api_router import api
@@ -41,6 +41,27 @@ async def create_answer(
         )
 
 
+@api.post(
+    "/answers/bulk",
+    description="Adds multiple answers to any questions at once. "
+                "Answers to not existing questions are reported as failed "
+                "without preventing creation of other answers",
+    responses={
+        HTTP_200_OK: {
+            "description": "Answers processed, result lists created and failed answers"
+        },
+    },
+    tags=["Answers"]
+)
+async def create_answers_bulk(
+    body: CreateAnswersBulk,
+    answers_use_case: FromDishka[AnswersUseCases]
+) -> AnswersBulkResult:
+    return await answers_use_case.create_answers_bulk(
+        [(item.question_id, item.answer) for item in body.answers]
+    )
+
+
 @api.get(
     "/answers/{answer_id}",
     description="Fetches information about specified answer to a question",
@@ -3,3 +3,7 @@ from fastapi.routing import APIRouter
 
 
 api = APIRouter(prefix="/api", route_class=DishkaRoute)
+# Metrics are scraped from the root, as scrapers expect by default
+metrics_api = APIRouter(route_class=DishkaRoute)
+# Counters for monitoring, mounted together with metrics only when they are enabled
+internal_api = APIRouter(prefix="/api/internal", route_class=DishkaRoute)
@@ -0,0 +1,96 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response
+from starlette.status import HTTP_304_NOT_MODIFIED
+
+from qna_server.dto import ResourceVersion
+
+
+def make_etag(version: ResourceVersion, *variant: object) -> str:
+    """
+    Makes strong entity tag for a representation of versioned data.
+
+    :param version: Version of data in representation.
+    :param variant: Request parameters changing representation of the same data,
+        such as page size.
+    :return: Quoted entity tag.
+    """
+    digest: str = hashlib.blake2b(
+        repr((version.tag, variant)).encode(),
+        digest_size=16
+    ).hexdigest()
+
+    return f'"{digest}"'
+
+
+def is_not_modified(request: Request, etag: str, modified_at: datetime | None) -> bool:
+    """
+    Checks conditional headers of a request to find out if client has current representation.
+
+    If-Modified-Since is only used when If-None-Match is not sent,
+    since it has precision of a second.
+
+    :param request: Request with conditional headers.
+    :param etag: Entity tag of current representation.
+    :param modified_at: When data of current representation was changed, if it is known.
+    :return: True if client has current representation.
+    """
+    if_none_match: str | None = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+
+        # Weak comparison is used for GET requests
+        return etag in (
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        )
+
+    if_modified_since: str | None = request.headers.get("if-modified-since")
+    if if_modified_since is None or modified_at is None:
+        return False
+
+    try:
+        since: datetime = parsedate_to_datetime(if_modified_since)
+
+    except (TypeError, ValueError):
+        return False
+
+    if since.tzinfo is None:
+        return False
+
+    return modified_at.replace(microsecond=0) <= since
+
+
+def set_validators(response: Response, etag: str, modified_at: datetime | None) -> None:
+    """
+    Adds headers that allow client to make conditional requests later.
+
+    :param response: Response to add headers to.
+    :param etag: Entity tag of representation.
+    :param modified_at: When data of representation was changed, if it is known.
+    :return: Nothing.
+    """
+    response.headers["ETag"] = etag
+    # Clients may keep representation, but have to check if it is still current
+    response.headers["Cache-Control"] = "no-cache"
+
+    if modified_at is not None:
+        response.headers["Last-Modified"] = format_datetime(
+            modified_at.astimezone(timezone.utc), usegmt=True
+        )
+
+
+def not_modified_response(etag: str, modified_at: datetime | None) -> Response:
+    """
+    Makes response telling client that its representation is current.
+
+    :param etag: Entity tag of representation.
+    :param modified_at: When data of representation was changed, if it is known.
+    :return: Response without body.
+    """
+    response: Response = Response(status_code=HTTP_304_NOT_MODIFIED)
+    set_validators(response, etag, modified_at)
+
+    return response
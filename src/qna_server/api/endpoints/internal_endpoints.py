@@ -0,0 +1,51 @@
+from dishka import FromDishka
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.status import HTTP_200_OK, HTTP_404_NOT_FOUND
+
+from qna_server.dto import CacheStats, PoolStats
+from qna_server.storage.cache import QuestionsCache
+from qna_server.storage.sqla_implementation import InstrumentedAsyncQueuePool
+from .api_router import internal_api
+
+
+@internal_api.get(
+    "/cache",
+    description="Fetches counters of questions cache for monitoring",
+    responses={
+        HTTP_200_OK: {
+            "description": "Cache counters fetched successfully"
+        },
+    },
+    tags=["Internal"]
+)
+async def get_cache_stats(
+    questions_cache: FromDishka[QuestionsCache]
+) -> CacheStats:
+    return questions_cache.stats()
+
+
+@internal_api.get(
+    "/pool",
+    description="Fetches state and counters of database connection pool for monitoring",
+    responses={
+        HTTP_200_OK: {
+            "description": "Pool counters fetched successfully"
+        },
+        HTTP_404_NOT_FOUND: {
+            "description": "Database engine does not use instrumented connection pool, "
+                           "or data is kept in memory"
+        }
+    },
+    tags=["Internal"]
+)
+async def get_pool_stats(
+    engine: FromDishka[AsyncEngine | None]
+) -> PoolStats:
+    if engine is None or not isinstance(engine.pool, InstrumentedAsyncQueuePool):
+        raise HTTPException(
+            status_code=HTTP_404_NOT_FOUND,
+            detail="Connection pool metrics are not available"
+        )
+
+    return engine.pool.stats()
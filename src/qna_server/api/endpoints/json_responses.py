@@ -0,0 +1,32 @@
+from typing import Any, Generic, Mapping, TypeVar
+
+from fastapi import Response
+from pydantic import TypeAdapter
+from starlette.status import HTTP_200_OK
+
+T = TypeVar("T")
+
+
+class DTOJSONResponse(Response, Generic[T]):
+    """
+    JSON response with data serialized by pydantic straight to bytes.
+
+    Returning it from endpoint skips validation of data against response model
+    and conversion of it into dictionaries before encoding,
+    so response model of endpoint is only used for documentation.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: T,
+        adapter: TypeAdapter[T],
+        status_code: int = HTTP_200_OK,
+        headers: Mapping[str, str] | None = None
+    ):
+        self.adapter: TypeAdapter[T] = adapter
+        super().__init__(content, status_code, headers)
+
+    def render(self, content: Any) -> bytes:
+        return self.adapter.dump_json(content)
@@ -0,0 +1,18 @@
+from dishka import FromDishka
+from fastapi import Response
+from prometheus_client import CONTENT_TYPE_LATEST
+
+from qna_server.metrics import AppMetrics
+from .api_router import metrics_api
+
+
+@metrics_api.get(
+    "/metrics",
+    description="Fetches metrics of server process in Prometheus text format",
+    response_class=Response,
+    include_in_schema=False
+)
+async def get_metrics(
+    metrics: FromDishka[AppMetrics]
+) -> Response:
+    return Response(metrics.render(), media_type=CONTENT_TYPE_LATEST)
@@ -1,28 +1,160 @@
+from typing import AsyncIterator
+
 from dishka import FromDishka
-from fastapi import HTTPException
-from starlette.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_404_NOT_FOUND
+from fastapi import HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from starlette.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_304_NOT_MODIFIED,
+    HTTP_400_BAD_REQUEST,
+    HTTP_404_NOT_FOUND,
+)
 
-from qna_server.dto import CreateQuestion, Question, QuestionDeletionConfirmation, QuestionWithAnswers
-from qna_server.exceptions import NotFoundError
+from qna_server.dto import (
+    CreateQuestion,
+    CreateQuestionsBulk,
+    PageCursor,
+    Question,
+    QuestionDeletionConfirmation,
+    QuestionsOrder,
+    QuestionsPage,
+    QuestionsPageCursor,
+    QuestionWithAnswers,
+    ResourceVersion,
+)
+from qna_server.exceptions import InvalidCursorError, NotFoundError
 from qna_server.use_cases import QuestionsUseCases
 from .api_router import api
+from .conditional_responses import is_not_modified, make_etag, not_modified_response, set_validators
+from .json_responses import DTOJSONResponse
+
+# Adapters are built once, since building them compiles serialization schema
+questions_adapter: TypeAdapter[list[Question]] = TypeAdapter(list[Question])
+questions_page_adapter: TypeAdapter[QuestionsPage] = TypeAdapter(QuestionsPage)
+question_with_answers_adapter: TypeAdapter[QuestionWithAnswers] = TypeAdapter(QuestionWithAnswers)
 
 
 @api.get(
     "/questions/",
-    description="Fetches all questions in system",
+    description="Fetches questions in system page by page, ordered by creation time, "
+                "by amount of answers or by time of the latest answer. "
+                "Passing fetch_all=true returns every question ordered by creation time "
+                "as a plain list instead. "
+                "Pages are sent with ETag and can be requested conditionally with If-None-Match",
+    response_model=QuestionsPage | list[Question],
     responses={
         HTTP_200_OK: {
-            "description": "Fetched all questions successfully"
+            "description": "Fetched questions successfully"
         },
+        HTTP_304_NOT_MODIFIED: {
+            "description": "Page was not changed since it was fetched with provided ETag"
+        },
+        HTTP_400_BAD_REQUEST: {
+            "description": "Provided pagination cursor is malformed or was made for another order"
+        }
     },
     tags=["Questions"]
 )
 async def get_all_questions(
+    request: Request,
+    questions_use_cases: FromDishka[QuestionsUseCases],
+    limit: int = Query(
+        default=50,
+        ge=1,
+        le=500,
+        description="Maximum amount of questions on a page"
+    ),
+    cursor: str | None = Query(
+        default=None,
+        description="Cursor from the previous page to continue listing from"
+    ),
+    order: QuestionsOrder = Query(
+        default=QuestionsOrder.CREATED_AT,
+        description="Order of questions: oldest first, most answered first "
+                    "or recently answered first"
+    ),
+    fetch_all: bool = Query(
+        default=False,
+        description="Returns all questions without pagination"
+    )
+) -> Response:
+    if fetch_all:
+        questions: list[Question] = await questions_use_cases.get_all_questions()
+        return DTOJSONResponse(questions, questions_adapter)
+
+    try:
+        page_cursor: QuestionsPageCursor | None = (
+            QuestionsPageCursor.decode(cursor) if cursor else None
+        )
+
+        # Version is fetched before the page, so the page is never older than its ETag
+        version: ResourceVersion = await questions_use_cases.get_questions_page_version(
+            limit, page_cursor, order
+        )
+
+    except InvalidCursorError as err:
+        raise HTTPException(
+            status_code=HTTP_400_BAD_REQUEST,
+            detail=str(err)
+        )
+
+    etag: str = make_etag(version, limit, cursor, order)
+    if is_not_modified(request, etag, version.modified_at):
+        return not_modified_response(etag, version.modified_at)
+
+    page: QuestionsPage = await questions_use_cases.get_questions_page(limit, page_cursor, order)
+    response: Response = DTOJSONResponse(page, questions_page_adapter)
+    set_validators(response, etag, version.modified_at)
+
+    return response
+
+
+async def _encode_as_ndjson(
+    questions: AsyncIterator[Question],
+    chunk_size: int = 100
+) -> AsyncIterator[bytes]:
+    """
+    Encodes questions as newline delimited JSON, grouping lines into chunks.
+
+    :param questions: Questions to encode.
+    :param chunk_size: Amount of lines sent to a client at once.
+    :return: Encoded chunks.
+    """
+    chunk: list[bytes] = []
+    async for question in questions:
+        chunk.append(question.model_dump_json().encode())
+
+        if len(chunk) >= chunk_size:
+            yield b"\n".join(chunk) + b"\n"
+            chunk.clear()
+
+    if chunk:
+        yield b"\n".join(chunk) + b"\n"
+
+
+# Registered before /questions/{question_id} so that "export" is not matched as an ID
+@api.get(
+    "/questions/export",
+    description="Streams all questions in system as newline delimited JSON, "
+                "one question per line ordered by creation time",
+    responses={
+        HTTP_200_OK: {
+            "description": "Streaming all questions",
+            "content": {"application/x-ndjson": {}}
+        },
+    },
+    response_class=StreamingResponse,
+    tags=["Questions"]
+)
+async def export_all_questions(
     questions_use_cases: FromDishka[QuestionsUseCases]
-) -> list[Question]:
-    questions: list[Question] = await questions_use_cases.get_all_questions()
-    return questions
+) -> StreamingResponse:
+    return StreamingResponse(
+        _encode_as_ndjson(questions_use_cases.stream_all_questions()),
+        media_type="application/x-ndjson"
+    )
 
 
 @api.post(
@@ -47,13 +179,44 @@ async def create_new_question(
     return created_question
 
 
+@api.post(
+    "/questions/bulk",
+    description="Creates multiple questions in system at once",
+    responses={
+        HTTP_201_CREATED: {
+            "description": "Questions created successfully, in the same order as in request"
+        },
+    },
+    status_code=HTTP_201_CREATED,
+    tags=["Questions"]
+)
+async def create_questions_bulk(
+    body: CreateQuestionsBulk,
+    questions_use_cases: FromDishka[QuestionsUseCases]
+) -> list[Question]:
+    created_questions: list[Question] = await questions_use_cases.create_questions_bulk(
+        body.questions
+    )
+
+    return created_questions
+
+
 @api.get(
     "/questions/{question_id}",
-    description="Fetches question with specific ID",
+    description="Fetches question with specific ID and a page of its answers, "
+                "ordered by creation time. Question is sent with ETag and Last-Modified "
+                "and can be requested conditionally with If-None-Match or If-Modified-Since",
+    response_model=QuestionWithAnswers,
     responses={
         HTTP_200_OK: {
             "description": "Question data fetched successfully"
         },
+        HTTP_304_NOT_MODIFIED: {
+            "description": "Question and its answers were not changed since they were fetched"
+        },
+        HTTP_400_BAD_REQUEST: {
+            "description": "Provided answers pagination cursor is malformed"
+        },
         HTTP_404_NOT_FOUND: {
             "description": "Question was not found by provided ID"
         }
@@ -62,11 +225,41 @@ async def create_new_question(
 )
 async def get_specific_question(
     question_id: int,
-    questions_use_cases: FromDishka[QuestionsUseCases]
-) -> QuestionWithAnswers:
+    request: Request,
+    questions_use_cases: FromDishka[QuestionsUseCases],
+    answers_limit: int = Query(
+        default=100,
+        ge=1,
+        le=1000,
+        description="Maximum amount of answers on a page"
+    ),
+    answers_cursor: str | None = Query(
+        default=None,
+        description="Cursor from the previous page of answers to continue listing from"
+    )
+) -> Response:
     try:
+        page_cursor: PageCursor | None = (
+            PageCursor.decode(answers_cursor) if answers_cursor else None
+        )
+
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=HTTP_400_BAD_REQUEST,
+            detail="Answers pagination cursor is malformed"
+        )
+
+    try:
+        # Version is fetched before the question, so the question is never older than its ETag
+        version: ResourceVersion = await questions_use_cases.get_question_version(question_id)
+        etag: str = make_etag(version, answers_limit, answers_cursor)
+        if is_not_modified(request, etag, version.modified_at):
+            return not_modified_response(etag, version.modified_at)
+
         question_data: QuestionWithAnswers = await questions_use_cases.fetch_specific_question(
-            question_id
+            question_id,
+            answers_limit,
+            page_cursor
         )
 
     except NotFoundError:
@@ -75,7 +268,10 @@ async def get_specific_question(
             detail=f"Question with ID={question_id} not found"
         )
 
-    return question_data
+    response: Response = DTOJSONResponse(question_data, question_with_answers_adapter)
+    set_validators(response, etag, version.modified_at)
+
+    return response
 
 
 @api.delete(
@@ -0,0 +1,69 @@
+import time
+from contextvars import Token
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from qna_server.storage.sqla_implementation import reads_from_primary
+
+READ_PRIMARY_COOKIE: str = "qna_read_primary_until"
+"""Cookie with time until which reads of a client are served by primary database."""
+
+SAFE_METHODS: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class ReadYourWritesMiddleware:
+    """
+    Serves reads of a client from primary database for a while after it wrote something,
+    so it sees its own writes even if replicas are behind.
+
+    Requests that write are served by primary entirely, and successful ones
+    set cookie marking the client for the following requests, unless window is zero.
+    """
+
+    def __init__(self, app: ASGIApp, window_seconds: float):
+        self.app: ASGIApp = app
+        self.window_seconds: float = window_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        writes: bool = scope["method"] not in SAFE_METHODS
+        token: Token[bool] = reads_from_primary.set(writes or self._recently_wrote(scope))
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                read_primary_until: float = time.time() + self.window_seconds
+                MutableHeaders(scope=message).append(
+                    "Set-Cookie",
+                    f"{READ_PRIMARY_COOKIE}={read_primary_until:.3f}; "
+                    f"Max-Age={int(self.window_seconds) + 1}; Path=/; HttpOnly; SameSite=Lax"
+                )
+
+            await send(message)
+
+        try:
+            await self.app(
+                scope,
+                receive,
+                send_with_cookie if writes and self.window_seconds > 0 else send
+            )
+
+        finally:
+            reads_from_primary.reset(token)
+
+    @staticmethod
+    def _recently_wrote(scope: Scope) -> bool:
+        cookie: str | None = HTTPConnection(scope).cookies.get(READ_PRIMARY_COOKIE)
+        if cookie is None:
+            return False
+
+        try:
+            # Checked on server as well, since not every client respects Max-Age
+            return float(cookie) > time.time()
+
+        except ValueError:
+            return False
@@ -0,0 +1,26 @@
+from contextvars import Token
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from qna_server.custom_types import ContextID, current_context_id, generate_context_id
+
+
+class ContextIdMiddleware:
+    """
+    Gives every request its own context id, which is added to all records logged while processing it.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app: ASGIApp = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token: Token[ContextID] = current_context_id.set(generate_context_id())
+        try:
+            await self.app(scope, receive, send)
+
+        finally:
+            current_context_id.reset(token)
@@ -1,35 +1,199 @@
+import multiprocessing
+import os
+import signal
+import socket
+from contextlib import asynccontextmanager
+from pathlib import Path
+from types import FrameType
+from typing import AsyncIterator
+
 import uvicorn
-from dishka import AsyncContainer, make_async_container
-from dishka.integrations.fastapi import setup_dishka
+from dishka import AsyncContainer, Provider, make_async_container
+from dishka.integrations.starlette import ContainerMiddleware
 from fastapi import FastAPI
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine
 from starlette.middleware.cors import CORSMiddleware
 
 from qna_server.api.endpoints import (
     api,
+    internal_api,
+    metrics_api,
     answers_endpoints, # noqa: F401 user for assigning routes
+    internal_endpoints, # noqa: F401 user for assigning routes
+    metrics_endpoints, # noqa: F401 user for assigning routes
     questions_endpoints, # noqa: F401 user for assigning routes
 )
-from qna_server.utils.config_schema import AppConfig
+from qna_server.api.read_your_writes import ReadYourWritesMiddleware
+from qna_server.api.request_context import ContextIdMiddleware
+from qna_server.metrics import AppMetrics, MetricsMiddleware, instrument_engine
+from qna_server.storage.cache import QuestionChangesListener, QuestionsCache
+from qna_server.storage.memory_implementation import MemoryStorage
+from qna_server.storage.sqla_implementation import ReplicaRouter, SlowQueryLog
+from qna_server.utils.background_logging import BackgroundLogging
+from qna_server.utils.config_schema import AppConfig, load_config
+from qna_server.utils.engine_factory import (
+    create_engine_from_settings,
+    create_read_engine_from_settings,
+)
 from qna_server.utils.providers import (
     AppConfigProvider,
     DatabaseSQLAReposProvider,
-    RequestContextIdentifierProvider,
+    MemoryReposProvider,
+    MetricsProvider,
+    QuestionsCacheProvider,
     UseCasesProvider,
 )
 
+CONFIG_PATH_ENV: str = "QNA_SERVER_CONFIG"
+"""Environment variable with path to configuration, read by app factory in worker processes."""
+
+
+def make_container(
+    config: AppConfig,
+    engine: AsyncEngine | None,
+    questions_cache: QuestionsCache,
+    replica_router: ReplicaRouter | None = None,
+    metrics: AppMetrics | None = None,
+    read_engine: AsyncEngine | None = None
+) -> AsyncContainer:
+    """
+    Makes dependency container of an app.
+
+    :param config: Configuration of an app.
+    :param engine: Engine of primary database, or None to keep data in memory.
+    :param questions_cache: Cache of questions, used if enabled in configuration.
+    :param replica_router: Router of reads to replicas, if there are any.
+    :param metrics: Metrics of server process, new ones are made if not provided.
+    :param read_engine: Engine for reads from primary database, if they do not use its engine.
+    :return: Dependency container.
+    """
+    repos_provider: Provider
+    if engine is None:
+        # Reads from memory are cheaper than from cache, so cache is not used
+        repos_provider = MemoryReposProvider(MemoryStorage())
+
+    else:
+        repos_provider = DatabaseSQLAReposProvider(
+            engine,
+            config.db_settings.read_mode,
+            questions_cache if config.cache.enabled else None,
+            config.cache.invalidation_notifications,
+            replica_router,
+            read_engine
+        )
+
+    return make_async_container(
+        AppConfigProvider(config),
+        QuestionsCacheProvider(questions_cache),
+        MetricsProvider(metrics if metrics is not None else AppMetrics()),
+        repos_provider,
+        UseCasesProvider()
+    )
+
 
 def setup_app(config: AppConfig) -> FastAPI:
     """
     Prepares application for launching.
 
+    Engine and dependency container are made in lifespan of the app,
+    so every worker process gets its own connections.
+
     :param config: Configuration of an app.
     :return: FastAPI Application.
     """
+    # Made with the app, since metrics middleware needs them before lifespan starts
+    metrics: AppMetrics = AppMetrics()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        # Started in lifespan, when server has configured its own loggers as well
+        background_logging: BackgroundLogging = BackgroundLogging(
+            config.logging.background,
+            config.logging.sampling
+        )
+        background_logging.start()
+
+        questions_cache: QuestionsCache = QuestionsCache(
+            max_size=config.cache.max_size,
+            ttl=config.cache.ttl_seconds,
+            negative_ttl=config.cache.negative_ttl_seconds
+        )
+        if config.db_settings.storage == "memory":
+            # Nothing to connect to, so database instrumentation is not set up either
+            container: AsyncContainer = make_container(config, None, questions_cache, metrics=metrics)
+            app.state.dishka_container = container
+
+            yield
+
+            await container.close()
+            background_logging.stop()
+            return
+
+        engine: AsyncEngine = create_engine_from_settings(config.db_settings)
+        read_engine: AsyncEngine | None = create_read_engine_from_settings(config.db_settings)
+        replica_router: ReplicaRouter | None = None
+        if config.db_settings.replica_connection_strings:
+            replica_router = ReplicaRouter(
+                [
+                    create_engine_from_settings(config.db_settings, connection_string)
+                    for connection_string in config.db_settings.replica_connection_strings
+                ],
+                config.db_settings.replica_health_check_interval_seconds
+            )
+
+        if config.metrics.enabled:
+            instrument_engine(engine, metrics, "primary")
+            if read_engine is not None:
+                instrument_engine(read_engine, metrics, "primary")
+            if replica_router is not None:
+                for replica_engine in replica_router.replica_engines:
+                    instrument_engine(replica_engine, metrics, "replica")
+
+        if config.slow_queries.enabled:
+            slow_query_log: SlowQueryLog = SlowQueryLog(
+                config.slow_queries.threshold_seconds,
+                config.slow_queries.log_parameters,
+                config.slow_queries.explain_every
+            )
+            slow_query_log.attach(engine)
+            if read_engine is not None:
+                slow_query_log.attach(read_engine)
+            if replica_router is not None:
+                for replica_engine in replica_router.replica_engines:
+                    slow_query_log.attach(replica_engine)
+
+        container = make_container(
+            config, engine, questions_cache, replica_router, metrics, read_engine
+        )
+        app.state.dishka_container = container
+
+        listener: QuestionChangesListener | None = None
+        if config.cache.enabled and config.cache.invalidation_notifications:
+            listener = QuestionChangesListener(engine.url, questions_cache)
+            listener.start()
+
+        if replica_router is not None:
+            replica_router.start()
+
+        yield
+
+        if listener is not None:
+            await listener.stop()
+
+        if replica_router is not None:
+            await replica_router.close()
+
+        await container.close()
+        await engine.dispose()
+        if read_engine is not None:
+            await read_engine.dispose()
+        background_logging.stop()
+
     app: FastAPI = FastAPI(
         title="Q&A API",
         host=config.host,
-        port=config.port
+        port=config.port,
+        lifespan=lifespan
     )
     app.add_middleware(
         CORSMiddleware,
@@ -38,32 +202,142 @@ def setup_app(config: AppConfig) -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"]
     )
+    if config.db_settings.replica_connection_strings:
+        app.add_middleware(
+            ReadYourWritesMiddleware,
+            window_seconds=config.db_settings.read_your_writes_seconds
+        )
 
-    engine: AsyncEngine = create_async_engine(config.db_settings.connection_string)
+    # Container itself is set to app state in lifespan
+    app.add_middleware(ContainerMiddleware)
+    if config.metrics.enabled:
+        # Wraps container middleware, so time of making request scope is measured too
+        app.add_middleware(MetricsMiddleware, metrics=metrics)
 
-    container: AsyncContainer = make_async_container(
-        AppConfigProvider(config),
-        DatabaseSQLAReposProvider(engine),
-        RequestContextIdentifierProvider(),
-        UseCasesProvider()
-    )
-    setup_dishka(container=container, app=app)
+    # Added last to wrap every other middleware, so their logs have context id too
+    app.add_middleware(ContextIdMiddleware)
     app.include_router(api)
+    if config.metrics.enabled:
+        app.include_router(metrics_api)
+        app.include_router(internal_api)
 
     return app
 
 
-def main(config: AppConfig) -> None:
+def create_app() -> FastAPI:
+    """
+    App factory called by every worker process.
+
+    :return: FastAPI Application configured from file set in environment.
+    """
+    return setup_app(load_config(Path(os.environ.get(CONFIG_PATH_ENV, "config.toml"))))
+
+
+def _bind_reuse_port_socket(host: str, port: int) -> socket.socket:
+    """
+    Binds listening socket that shares port with sockets of other workers.
+
+    :param host: Address to listen on.
+    :param port: Port to listen on.
+    :return: Bound socket.
+    """
+    sock: socket.socket = socket.socket(
+        socket.AF_INET6 if ":" in host else socket.AF_INET,
+        socket.SOCK_STREAM
+    )
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+
+    return sock
+
+
+def _serve_with_reuse_port(config_path: str) -> None:
+    """
+    Runs server in worker process on its own socket.
+
+    :param config_path: Path to configuration file.
+    :return: Nothing.
+    """
+    config: AppConfig = load_config(Path(config_path))
+    sock: socket.socket = _bind_reuse_port_socket(config.host, config.port)
+
+    server: uvicorn.Server = uvicorn.Server(
+        uvicorn.Config(
+            create_app,
+            factory=True,
+            host=config.host,
+            port=config.port,
+            loop=config.server.loop,
+            http=config.server.http
+        )
+    )
+    server.run(sockets=[sock])
+
+
+def _run_reuse_port_workers(config: AppConfig, config_path: Path) -> None:
+    """
+    Starts workers with separate sockets on the same port,
+    letting kernel balance connections between them.
+
+    :param config: App configuration.
+    :param config_path: Path to configuration file, read by workers.
+    :return: Nothing.
+    """
+    context = multiprocessing.get_context("spawn")
+    workers: list[multiprocessing.process.BaseProcess] = [
+        context.Process(target=_serve_with_reuse_port, args=(str(config_path),))
+        for _ in range(config.server.workers)
+    ]
+
+    def stop_workers(signum: int, frame: FrameType | None) -> None:
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+
+    signal.signal(signal.SIGINT, stop_workers)
+    signal.signal(signal.SIGTERM, stop_workers)
+
+    for worker in workers:
+        worker.start()
+
+    for worker in workers:
+        worker.join()
+
+
+def main(config: AppConfig, config_path: Path = Path("config.toml")) -> None:
     """
     Main entry point.
 
+    Runs a single process, or several worker processes that make their own apps
+    with app factory when configured.
+
     :param config: App configuration.
+    :param config_path: Path to configuration file, read by worker processes.
     :return: Nothing.
     """
-    app: FastAPI = setup_app(config)
+    if config.server.workers == 1 and not config.server.reuse_port:
+        uvicorn.run(
+            setup_app(config),
+            host=config.host,
+            port=config.port,
+            loop=config.server.loop,
+            http=config.server.http
+        )
+        return
+
+    # Workers are spawned, so they read configuration from the file on their own
+    os.environ[CONFIG_PATH_ENV] = str(config_path.resolve())
+    if config.server.reuse_port:
+        _run_reuse_port_workers(config, config_path.resolve())
+        return
 
     uvicorn.run(
-        app,
+        f"{create_app.__module__}:{create_app.__name__}",
+        factory=True,
         host=config.host,
-        port=config.port
+        port=config.port,
+        workers=config.server.workers,
+        loop=config.server.loop,
+        http=config.server.http
     )
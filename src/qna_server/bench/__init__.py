@@ -0,0 +1,15 @@
+from .cli import add_bench_arguments, run_bench
+from .dataset import AnswersDistribution, seed_dataset
+from .report import BenchReport, EndpointReport
+from .workload import Operation, Workload
+
+__all__ = (
+    "add_bench_arguments",
+    "run_bench",
+    "AnswersDistribution",
+    "seed_dataset",
+    "BenchReport",
+    "EndpointReport",
+    "Operation",
+    "Workload"
+)
@@ -0,0 +1,159 @@
+import argparse
+import asyncio
+import logging
+import random
+import time
+from contextlib import AsyncExitStack
+from pathlib import Path
+from typing import Any
+
+import httpx
+from fastapi import FastAPI
+
+from qna_server.api.server import setup_app
+from qna_server.utils.config_schema import AppConfig, load_config
+from .dataset import AnswersDistribution, collect_question_ids, seed_dataset
+from .report import BenchReport, format_report, summarize_endpoints
+from .workload import DEFAULT_MIX, OPERATION_ALIASES, LatencySamples, Workload, parse_mix
+
+QUIETED_LOGGERS: tuple[str, ...] = ("qna_logger", "httpx")
+"""Loggers writing a record per request, which would be measured along with requests."""
+
+
+def add_bench_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Adds options of load benchmark to parser.
+
+    :param parser: Parser of bench command.
+    :return: Nothing.
+    """
+    # Not set by default, so the option of main parser given before command is not overwritten
+    parser.add_argument(
+        "--config",
+        type=Path,
+        default=argparse.SUPPRESS,
+        help="Path to configuration file of in-process app, config.toml by default"
+    )
+    parser.add_argument(
+        "--url",
+        help="Address of running server, app is run in-process from configuration if not set"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=16, help="Amount of clients sending requests at the same time"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=10.0, help="Duration of measured part of a run in seconds"
+    )
+    parser.add_argument(
+        "--warmup", type=float, default=1.0, help="Duration of unmeasured warm-up in seconds"
+    )
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=DEFAULT_MIX,
+        help="Weights of operations, for example "
+             + ",".join(
+                 f"{alias}={DEFAULT_MIX[operation]:g}" for alias, operation in OPERATION_ALIASES.items()
+             )
+    )
+    parser.add_argument(
+        "--questions",
+        type=int,
+        default=1000,
+        help="Amount of questions to seed, existing questions are used if zero"
+    )
+    parser.add_argument(
+        "--answers-per-question", type=float, default=5.0, help="Mean amount of seeded answers per question"
+    )
+    parser.add_argument(
+        "--answers-distribution",
+        type=AnswersDistribution,
+        choices=list(AnswersDistribution),
+        default=AnswersDistribution.EXPONENTIAL,
+        help="Distribution of amount of seeded answers per question"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed of random generator")
+    parser.add_argument("--json", type=Path, help="Path to write report in JSON format to")
+    parser.add_argument(
+        "--log-level",
+        default="WARNING",
+        help="Level of app and client logs during benchmark"
+    )
+
+
+async def _run(args: argparse.Namespace) -> BenchReport:
+    rng: random.Random = random.Random(args.seed)
+    for logger_name in QUIETED_LOGGERS:
+        logging.getLogger(logger_name).setLevel(args.log_level)
+
+    async with AsyncExitStack() as stack:
+        client_options: dict[str, Any]
+        if args.url is not None:
+            # A connection per client, as every client waits for its response before the next request
+            client_options = {
+                "base_url": args.url, "limits": httpx.Limits(max_connections=1), "timeout": 30.0
+            }
+
+        else:
+            config: AppConfig = load_config(args.config)
+            app: FastAPI = setup_app(config)
+            await stack.enter_async_context(app.router.lifespan_context(app))
+            # Errors of app are counted like 500 responses of running server, instead of stopping the run
+            client_options = {
+                "transport": httpx.ASGITransport(app=app, raise_app_exceptions=False),
+                "base_url": "http://bench"
+            }
+
+        # Clients are separate, so cookies set after writes of one client do not affect others
+        clients: list[httpx.AsyncClient] = [
+            await stack.enter_async_context(httpx.AsyncClient(**client_options)) for _ in range(args.concurrency)
+        ]
+
+        answers: int = 0
+        if args.questions > 0:
+            question_ids, answers = await seed_dataset(
+                clients[0], rng, args.questions, args.answers_per_question, args.answers_distribution
+            )
+
+        else:
+            question_ids = await collect_question_ids(clients[0], 10_000)
+
+        questions: int = len(question_ids)
+        workload: Workload = Workload(args.mix, question_ids, rng)
+        samples: LatencySamples = LatencySamples()
+        measure_from: float = time.perf_counter() + args.warmup
+        deadline: float = measure_from + args.duration
+        await asyncio.gather(
+            *(workload.run_client(client, samples, measure_from, deadline) for client in clients)
+        )
+
+    total, endpoints = summarize_endpoints(samples, args.duration)
+    return BenchReport(
+        target=args.url or f"in-process app from {args.config}",
+        concurrency=args.concurrency,
+        duration_seconds=args.duration,
+        warmup_seconds=args.warmup,
+        seed=args.seed,
+        mix={operation.value: weight for operation, weight in args.mix.items()},
+        questions=questions,
+        answers=answers,
+        answers_per_question=args.answers_per_question,
+        answers_distribution=args.answers_distribution,
+        total=total,
+        endpoints=endpoints
+    )
+
+
+def run_bench(args: argparse.Namespace) -> None:
+    """
+    Seeds dataset, runs mixed workload against the app and prints latency report.
+
+    :param args: Parsed options of bench command.
+    :return: Nothing.
+    """
+    report: BenchReport = asyncio.run(_run(args))
+    print(format_report(report))
+
+    if args.json is not None:
+        args.json.write_text(report.model_dump_json(indent=2))
+
@@ -0,0 +1,128 @@
+import random
+from enum import StrEnum
+from typing import Any
+
+import httpx
+
+from qna_server.dto import (
+    CreateAnswer,
+    CreateAnswerForQuestion,
+    CreateAnswersBulk,
+    CreateQuestion,
+    CreateQuestionsBulk,
+)
+from qna_server.dto.create_answers_bulk import MAX_BULK_ANSWERS
+from qna_server.dto.create_questions_bulk import MAX_BULK_QUESTIONS
+
+
+class AnswersDistribution(StrEnum):
+    """
+    Distribution of amount of answers per seeded question.
+    """
+    FIXED = "fixed"
+    UNIFORM = "uniform"
+    # Most questions get few answers, while some get many, as on real Q&A sites
+    EXPONENTIAL = "exponential"
+
+
+def draw_answers_count(
+    rng: random.Random,
+    mean: float,
+    distribution: AnswersDistribution
+) -> int:
+    """
+    Draws amount of answers for a question.
+
+    :param rng: Random generator.
+    :param mean: Mean amount of answers per question.
+    :param distribution: Distribution to draw from.
+    :return: Amount of answers.
+    """
+    if mean <= 0:
+        return 0
+
+    match distribution:
+        case AnswersDistribution.FIXED:
+            return round(mean)
+
+        case AnswersDistribution.UNIFORM:
+            return rng.randint(0, round(2 * mean))
+
+        case AnswersDistribution.EXPONENTIAL:
+            return int(rng.expovariate(1 / mean))
+
+
+async def seed_dataset(
+    client: httpx.AsyncClient,
+    rng: random.Random,
+    questions: int,
+    answers_per_question: float,
+    distribution: AnswersDistribution
+) -> tuple[list[int], int]:
+    """
+    Creates questions and answers to them through bulk endpoints of the API.
+
+    :param client: Client of the server.
+    :param rng: Random generator.
+    :param questions: Amount of questions to create.
+    :param answers_per_question: Mean amount of answers per question.
+    :param distribution: Distribution of amount of answers per question.
+    :return: IDs of created questions and amount of created answers.
+    """
+    question_ids: list[int] = []
+    for offset in range(0, questions, MAX_BULK_QUESTIONS):
+        batch: CreateQuestionsBulk = CreateQuestionsBulk(
+            questions=[
+                CreateQuestion(text=f"Benchmark question {offset + index}")
+                for index in range(min(MAX_BULK_QUESTIONS, questions - offset))
+            ]
+        )
+        response: httpx.Response = await client.post(
+            "/api/questions/bulk", json=batch.model_dump(mode="json")
+        )
+        response.raise_for_status()
+        question_ids.extend(question["id"] for question in response.json())
+
+    answers: list[CreateAnswerForQuestion] = [
+        CreateAnswerForQuestion(
+            question_id=question_id,
+            answer=CreateAnswer(text=f"Benchmark answer {index}", user_id=f"user_{index}")
+        )
+        for question_id in question_ids
+        for index in range(draw_answers_count(rng, answers_per_question, distribution))
+    ]
+    for offset in range(0, len(answers), MAX_BULK_ANSWERS):
+        response = await client.post(
+            "/api/answers/bulk",
+            json=CreateAnswersBulk(
+                answers=answers[offset:offset + MAX_BULK_ANSWERS]
+            ).model_dump(mode="json")
+        )
+        response.raise_for_status()
+
+    return question_ids, len(answers)
+
+
+async def collect_question_ids(client: httpx.AsyncClient, limit: int) -> list[int]:
+    """
+    Collects IDs of questions already stored on the server.
+
+    :param client: Client of the server.
+    :param limit: Maximum amount of IDs to collect.
+    :return: IDs of questions.
+    """
+    question_ids: list[int] = []
+    params: dict[str, Any] = {"limit": 500}
+
+    while len(question_ids) < limit:
+        response: httpx.Response = await client.get("/api/questions/", params=params)
+        response.raise_for_status()
+        page: dict[str, Any] = response.json()
+        question_ids.extend(question["id"] for question in page["questions"])
+
+        if page["next_cursor"] is None:
+            break
+
+        params["cursor"] = page["next_cursor"]
+
+    return question_ids[:limit]
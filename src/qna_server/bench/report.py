@@ -0,0 +1,133 @@
+import math
+
+from pydantic import BaseModel, Field
+
+from .dataset import AnswersDistribution
+from .workload import LatencySamples, Operation
+
+
+class EndpointReport(BaseModel):
+    """
+    Throughput and latency of requests to a single endpoint.
+    """
+    endpoint: str
+    requests: int
+    errors: int
+    throughput: float = Field(description="Requests per second")
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+class BenchReport(BaseModel):
+    """
+    Results of a benchmark run together with its parameters, so that runs can be compared.
+    """
+    target: str
+    concurrency: int
+    duration_seconds: float
+    warmup_seconds: float
+    seed: int
+    mix: dict[str, float]
+    questions: int
+    answers: int
+    answers_per_question: float = Field(description="Mean amount of seeded answers per question")
+    answers_distribution: AnswersDistribution = Field(description="Distribution of amount of seeded answers per question")
+    total: EndpointReport
+    endpoints: list[EndpointReport]
+
+
+def _percentile(sorted_latencies: list[float], percent: float) -> float:
+    """
+    Finds percentile of latencies with nearest-rank method.
+
+    :param sorted_latencies: Latencies sorted in ascending order.
+    :param percent: Percentile to find, from 0 to 100.
+    :return: Latency in seconds, or zero if there are none.
+    """
+    if not sorted_latencies:
+        return 0.0
+
+    rank: int = max(math.ceil(percent / 100 * len(sorted_latencies)), 1)
+    return sorted_latencies[rank - 1]
+
+
+def summarize(
+    endpoint: str,
+    latencies: list[float],
+    errors: int,
+    duration_seconds: float
+) -> EndpointReport:
+    """
+    Summarizes latencies of requests.
+
+    :param endpoint: Name of endpoint.
+    :param latencies: Latency of each request in seconds.
+    :param errors: Amount of failed requests.
+    :param duration_seconds: Duration of measured part of a run.
+    :return: Summary of requests.
+    """
+    sorted_latencies: list[float] = sorted(latencies)
+    return EndpointReport(
+        endpoint=endpoint,
+        requests=len(sorted_latencies),
+        errors=errors,
+        throughput=len(sorted_latencies) / duration_seconds,
+        p50_ms=_percentile(sorted_latencies, 50) * 1000,
+        p95_ms=_percentile(sorted_latencies, 95) * 1000,
+        p99_ms=_percentile(sorted_latencies, 99) * 1000,
+        max_ms=sorted_latencies[-1] * 1000 if sorted_latencies else 0.0
+    )
+
+
+def summarize_endpoints(
+    samples: LatencySamples,
+    duration_seconds: float
+) -> tuple[EndpointReport, list[EndpointReport]]:
+    """
+    Summarizes requests to every endpoint and all of them together.
+
+    :param samples: Collected latencies and errors.
+    :param duration_seconds: Duration of measured part of a run.
+    :return: Summary of all requests and summaries of endpoints that were called.
+    """
+    endpoints: list[EndpointReport] = [
+        summarize(operation.value, samples.latencies[operation], samples.errors[operation], duration_seconds)
+        for operation in Operation
+        if samples.latencies[operation]
+    ]
+    total: EndpointReport = summarize(
+        "total",
+        [latency for latencies in samples.latencies.values() for latency in latencies],
+        sum(samples.errors.values()),
+        duration_seconds
+    )
+
+    return total, endpoints
+
+
+def format_report(report: BenchReport) -> str:
+    """
+    Formats report as a table.
+
+    :param report: Report of a run.
+    :return: Table with a row per endpoint.
+    """
+    lines: list[str] = [
+        f"Target: {report.target}, concurrency: {report.concurrency}, "
+        f"duration: {report.duration_seconds:.1f}s, warm-up: {report.warmup_seconds:.1f}s, "
+        f"seed: {report.seed}",
+        f"Dataset: {report.questions} questions, {report.answers} answers, seeded with "
+        f"{report.answers_per_question:g} answers per question, {report.answers_distribution} distribution",
+        f"{'endpoint':<44} {'requests':>9} {'errors':>7} {'req/s':>9} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}",
+    ]
+    for endpoint in (*report.endpoints, report.total):
+        lines.append(
+            f"{endpoint.endpoint:<44} {endpoint.requests:>9} {endpoint.errors:>7} "
+            f"{endpoint.throughput:>9.1f} {endpoint.p50_ms:>8.2f} {endpoint.p95_ms:>8.2f} "
+            f"{endpoint.p99_ms:>8.2f} {endpoint.max_ms:>8.2f}"
+        )
+
+    return "\n".join(lines)
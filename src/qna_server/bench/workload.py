@@ -0,0 +1,153 @@
+import random
+import time
+from enum import StrEnum
+from typing import Awaitable, Callable
+
+import httpx
+
+from qna_server.dto import CreateAnswer, CreateQuestion, QuestionsOrder
+
+
+class Operation(StrEnum):
+    """
+    Operation of benchmark workload, named by endpoint it calls.
+    """
+    LIST_QUESTIONS = "GET /api/questions/"
+    FETCH_QUESTION = "GET /api/questions/{question_id}"
+    CREATE_QUESTION = "POST /api/questions/"
+    CREATE_ANSWER = "POST /api/questions/{question_id}/answers/"
+
+
+OPERATION_ALIASES: dict[str, Operation] = {
+    "list": Operation.LIST_QUESTIONS,
+    "detail": Operation.FETCH_QUESTION,
+    "create_question": Operation.CREATE_QUESTION,
+    "create_answer": Operation.CREATE_ANSWER,
+}
+"""Short names of operations used in workload mix option."""
+
+DEFAULT_MIX: dict[Operation, float] = {
+    Operation.LIST_QUESTIONS: 30,
+    Operation.FETCH_QUESTION: 50,
+    Operation.CREATE_QUESTION: 5,
+    Operation.CREATE_ANSWER: 15,
+}
+
+
+def parse_mix(mix: str) -> dict[Operation, float]:
+    """
+    Parses workload mix from string like "list=30,detail=50,create_question=5,create_answer=15".
+
+    :param mix: Weights of operations by their short names.
+    :return: Weights of operations.
+    """
+    weights: dict[Operation, float] = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in OPERATION_ALIASES:
+            raise ValueError(
+                f"Unknown operation {name.strip()!r}, expected one of: {', '.join(OPERATION_ALIASES)}"
+            )
+
+        weights[OPERATION_ALIASES[name.strip()]] = float(weight)
+
+    if any(weight < 0 for weight in weights.values()) or sum(weights.values()) <= 0:
+        raise ValueError("Weights of operations must be non-negative and not all zero")
+
+    return weights
+
+
+class LatencySamples:
+    """
+    Latencies and errors of operations collected during measured part of a run.
+    """
+
+    def __init__(self) -> None:
+        self.latencies: dict[Operation, list[float]] = {operation: [] for operation in Operation}
+        self.errors: dict[Operation, int] = {operation: 0 for operation in Operation}
+
+
+class Workload:
+    """
+    Mixed workload of reads and writes, sent by every simulated client in a closed loop.
+    """
+
+    def __init__(
+        self,
+        mix: dict[Operation, float],
+        question_ids: list[int],
+        rng: random.Random
+    ):
+        self.operations: list[Operation] = list(mix)
+        self.weights: list[float] = list(mix.values())
+        # Shared by clients, so answers are created for questions created during the run as well
+        self.question_ids: list[int] = question_ids
+        self.rng: random.Random = rng
+
+        self._calls: dict[Operation, Callable[[httpx.AsyncClient], Awaitable[httpx.Response]]] = {
+            Operation.LIST_QUESTIONS: self._list_questions,
+            Operation.FETCH_QUESTION: self._fetch_question,
+            Operation.CREATE_QUESTION: self._create_question,
+            Operation.CREATE_ANSWER: self._create_answer,
+        }
+
+    async def run_client(
+        self,
+        client: httpx.AsyncClient,
+        samples: LatencySamples,
+        measure_from: float,
+        deadline: float
+    ) -> None:
+        """
+        Sends requests one after another until deadline.
+
+        :param client: Client of the server, one per simulated client.
+        :param samples: Samples to record results to.
+        :param measure_from: Time from which results are recorded, skipping warm-up.
+        :param deadline: Time when client stops sending requests.
+        :return: Nothing.
+        """
+        while (started_at := time.perf_counter()) < deadline:
+            operation: Operation = self.rng.choices(self.operations, self.weights)[0]
+
+            try:
+                response: httpx.Response = await self._calls[operation](client)
+                failed: bool = response.status_code >= 400
+
+            except httpx.TransportError:
+                failed = True
+
+            if started_at < measure_from:
+                continue
+
+            samples.latencies[operation].append(time.perf_counter() - started_at)
+            if failed:
+                samples.errors[operation] += 1
+
+    def _random_question_id(self) -> int:
+        return self.rng.choice(self.question_ids) if self.question_ids else 1
+
+    async def _list_questions(self, client: httpx.AsyncClient) -> httpx.Response:
+        return await client.get(
+            "/api/questions/",
+            params={"limit": 50, "order": self.rng.choice(list(QuestionsOrder)).value}
+        )
+
+    async def _fetch_question(self, client: httpx.AsyncClient) -> httpx.Response:
+        return await client.get(f"/api/questions/{self._random_question_id()}")
+
+    async def _create_question(self, client: httpx.AsyncClient) -> httpx.Response:
+        response: httpx.Response = await client.post(
+            "/api/questions/",
+            json=CreateQuestion(text="Benchmark question").model_dump(mode="json")
+        )
+        if response.status_code < 400:
+            self.question_ids.append(response.json()["id"])
+
+        return response
+
+    async def _create_answer(self, client: httpx.AsyncClient) -> httpx.Response:
+        return await client.post(
+            f"/api/questions/{self._random_question_id()}/answers/",
+            json=CreateAnswer(text="Benchmark answer", user_id="bench_user").model_dump(mode="json")
+        )
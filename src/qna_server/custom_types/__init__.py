@@ -1,8 +1,9 @@
-from .context_id import ContextID, generate_context_id
-from .logging_context import LoggingContext
+from .context_id import ContextID, current_context_id, generate_context_id
+from .read_mode import ReadMode
 
 __all__ = (
     "ContextID",
-    "LoggingContext",
-    "generate_context_id"
+    "current_context_id",
+    "generate_context_id",
+    "ReadMode"
 )
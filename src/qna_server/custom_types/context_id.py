@@ -1,8 +1,12 @@
+from contextvars import ContextVar
 from secrets import token_hex
 from typing import NewType
 
 ContextID = NewType("ContextID", str)
 
+current_context_id: ContextVar[ContextID] = ContextVar("current_context_id", default=ContextID("-"))
+"""Identifier of request or background task being processed, added to every log record."""
+
 
 def generate_context_id() -> ContextID:
     """
@@ -0,0 +1,12 @@
+from enum import StrEnum
+
+
+class ReadMode(StrEnum):
+    """
+    Defines how repositories read data from database.
+    """
+
+    ORM = "orm"
+    """Rows are loaded as ORM objects, tracked by session identity map."""
+    CORE = "core"
+    """Only required columns are selected and plain rows are mapped straight to DTO."""
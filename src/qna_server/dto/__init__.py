@@ -1,17 +1,41 @@
 from .answer import Answer
 from .answer_deletion_confirmation import AnswerDeletionConfirmation
+from .answer_creation_failure import AnswerCreationFailure
+from .answers_bulk_result import AnswersBulkResult
+from .cache_stats import CacheStats
 from .create_answer import CreateAnswer
+from .create_answer_for_question import CreateAnswerForQuestion
+from .create_answers_bulk import CreateAnswersBulk
 from .create_question import CreateQuestion
+from .create_questions_bulk import CreateQuestionsBulk
+from .page_cursor import PageCursor
+from .pool_stats import PoolStats
 from .question import Question
 from .question_deletion_confirmed import QuestionDeletionConfirmation
+from .questions_order import QuestionsOrder
+from .questions_page import QuestionsPage
+from .questions_page_cursor import QuestionsPageCursor
 from .questions_with_answers import QuestionWithAnswers
+from .resource_version import ResourceVersion
 
 __all__ = (
     "Answer",
     "Question",
     "QuestionWithAnswers",
+    "QuestionsPage",
+    "PageCursor",
+    "QuestionsOrder",
+    "QuestionsPageCursor",
+    "ResourceVersion",
     "CreateQuestion",
+    "CreateQuestionsBulk",
     "CreateAnswer",
+    "CreateAnswerForQuestion",
+    "CreateAnswersBulk",
+    "AnswerCreationFailure",
+    "AnswersBulkResult",
     "QuestionDeletionConfirmation",
-    "AnswerDeletionConfirmation"
+    "AnswerDeletionConfirmation",
+    "CacheStats",
+    "PoolStats"
 )
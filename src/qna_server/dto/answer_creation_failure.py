@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+
+
+class AnswerCreationFailure(BaseModel):
+    """
+    Describes answer from bulk request that was not created.
+    """
+    index: int = Field(
+        description="Position of an answer in request"
+    )
+    question_id: int = Field(
+        description="ID of a question answer was for"
+    )
+    reason: str = Field(
+        description="Why answer was not created",
+        examples=["Question not found"]
+    )
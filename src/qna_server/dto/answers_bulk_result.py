@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+
+from .answer import Answer
+from .answer_creation_failure import AnswerCreationFailure
+
+
+class AnswersBulkResult(BaseModel):
+    """
+    Result of creating multiple answers at once.
+    """
+    created: list[Answer] = Field(
+        description="Created answers in the same order as in request"
+    )
+    failed: list[AnswerCreationFailure] = Field(
+        description="Answers that were not created"
+    )
@@ -0,0 +1,29 @@
+from pydantic import BaseModel, Field
+
+
+class CacheStats(BaseModel):
+    """
+    Counters of questions cache for monitoring.
+    """
+
+    size: int = Field(
+        description="Amount of entries currently stored in cache"
+    )
+    max_size: int = Field(
+        description="Maximum amount of entries stored in cache"
+    )
+    hits: int = Field(
+        description="Amount of lookups served from cache"
+    )
+    misses: int = Field(
+        description="Amount of lookups that went to database"
+    )
+    evictions: int = Field(
+        description="Amount of entries removed to free space for new ones"
+    )
+    expirations: int = Field(
+        description="Amount of entries removed because their time to live passed"
+    )
+    invalidations: int = Field(
+        description="Amount of entries removed because related data was changed"
+    )
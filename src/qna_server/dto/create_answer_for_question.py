@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+
+from .create_answer import CreateAnswer
+
+
+class CreateAnswerForQuestion(BaseModel):
+    """
+    Answer content together with a question it is for.
+    """
+    question_id: int = Field(
+        description="ID of a question answer is for"
+    )
+    answer: CreateAnswer = Field(
+        description="Content of an answer"
+    )
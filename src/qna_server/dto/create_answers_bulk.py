@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+
+from .create_answer_for_question import CreateAnswerForQuestion
+
+MAX_BULK_ANSWERS: int = 1000
+
+
+class CreateAnswersBulk(BaseModel):
+    """
+    Body model for creating multiple answers to any questions at once.
+    """
+    answers: list[CreateAnswerForQuestion] = Field(
+        min_length=1,
+        max_length=MAX_BULK_ANSWERS,
+        description="Answers to create"
+    )
@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+
+from .create_question import CreateQuestion
+
+MAX_BULK_QUESTIONS: int = 1000
+
+
+class CreateQuestionsBulk(BaseModel):
+    """
+    Body model for creating multiple questions at once.
+    """
+    questions: list[CreateQuestion] = Field(
+        min_length=1,
+        max_length=MAX_BULK_QUESTIONS,
+        description="Questions to create, returned in the same order after creation"
+    )
@@ -0,0 +1,40 @@
+import binascii
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from typing import Self
+
+from pydantic import BaseModel, ValidationError
+
+from qna_server.exceptions import InvalidCursorError
+
+
+class OpaqueCursor(BaseModel):
+    """
+    Pagination cursor that is passed to clients as opaque string.
+    """
+
+    def encode(self) -> str:
+        """
+        Encodes cursor into opaque string that can be passed to clients.
+
+        :return: URL safe cursor string.
+        """
+        return urlsafe_b64encode(
+            self.model_dump_json().encode()
+        ).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str) -> Self:
+        """
+        Decodes cursor that was previously made with encode method.
+
+        :param cursor: URL safe cursor string.
+        :return: Decoded cursor.
+        :raises InvalidCursorError: If cursor is malformed.
+        """
+        try:
+            return cls.model_validate_json(
+                urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            )
+
+        except (binascii.Error, ValidationError, ValueError) as err:
+            raise InvalidCursorError("Pagination cursor is malformed") from err
@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from pydantic import Field
+
+from .opaque_cursor import OpaqueCursor
+
+
+class PageCursor(OpaqueCursor):
+    """
+    Position of the last record on a page, ordered by creation time and ID.
+    """
+
+    created_at: datetime = Field(
+        description="Creation time of the last record on a page"
+    )
+    id: int = Field(
+        description="ID of the last record on a page"
+    )
@@ -0,0 +1,35 @@
+from pydantic import BaseModel, Field
+
+
+class PoolStats(BaseModel):
+    """
+    State and counters of database connection pool for monitoring.
+    """
+
+    size: int = Field(
+        description="Amount of connections kept open in pool"
+    )
+    max_overflow: int = Field(
+        description="Maximum amount of connections opened above pool size"
+    )
+    checked_out: int = Field(
+        description="Amount of connections currently in use"
+    )
+    checked_in: int = Field(
+        description="Amount of open connections currently idle in pool"
+    )
+    overflow: int = Field(
+        description="Amount of connections currently opened above pool size"
+    )
+    checkouts: int = Field(
+        description="Amount of times connection was taken from pool"
+    )
+    checkout_timeouts: int = Field(
+        description="Amount of times no connection became available in time"
+    )
+    checkout_wait_seconds_total: float = Field(
+        description="Total time spent waiting for connections, including opening new ones"
+    )
+    checkout_wait_seconds_max: float = Field(
+        description="Longest time spent waiting for a connection"
+    )
@@ -20,3 +20,11 @@ class Question(BaseModel):
     created_at: datetime = Field(
         description="When the question was created"
     )
+    answer_count: int = Field(
+        default=0,
+        description="Amount of answers to the question"
+    )
+    last_answer_at: datetime | None = Field(
+        default=None,
+        description="When the latest answer to the question was created, or null if it has no answers"
+    )
@@ -0,0 +1,14 @@
+from enum import StrEnum
+
+
+class QuestionsOrder(StrEnum):
+    """
+    Orders in which questions can be listed. Values match names of question fields.
+    """
+
+    CREATED_AT = "created_at"
+    """Oldest questions first."""
+    ANSWER_COUNT = "answer_count"
+    """Questions with most answers first."""
+    LAST_ANSWER_AT = "last_answer_at"
+    """Recently answered questions first, questions without answers last."""
@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+
+from .question import Question
+
+
+class QuestionsPage(BaseModel):
+    """
+    Single page of questions ordered by creation time.
+    """
+
+    questions: list[Question] = Field(
+        description="Questions on the current page"
+    )
+    next_cursor: str | None = Field(
+        description="Cursor for fetching the next page, or null if this is the last page"
+    )
@@ -0,0 +1,41 @@
+from datetime import datetime
+from typing import Self
+
+from pydantic import Field, model_validator
+
+from .opaque_cursor import OpaqueCursor
+from .questions_order import QuestionsOrder
+
+
+class QuestionsPageCursor(OpaqueCursor):
+    """
+    Position of the last question on a page of questions listed in specific order.
+    """
+
+    order: QuestionsOrder = Field(
+        default=QuestionsOrder.CREATED_AT,
+        description="Order of questions the cursor was made for"
+    )
+    sort_value: datetime | int | None = Field(
+        description="Value of ordering field of the last question on a page"
+    )
+    id: int = Field(
+        description="ID of the last question on a page"
+    )
+
+    @model_validator(mode="after")
+    def check_sort_value_matches_order(self) -> Self:
+        """
+        Checks that sort value can be compared with ordering field.
+
+        :return: Validated cursor.
+        """
+        expected_type: type = int if self.order is QuestionsOrder.ANSWER_COUNT else datetime
+
+        if self.sort_value is None and self.order is QuestionsOrder.LAST_ANSWER_AT:
+            return self
+
+        if not isinstance(self.sort_value, expected_type):
+            raise ValueError(f"Sort value does not match order {self.order}")
+
+        return self
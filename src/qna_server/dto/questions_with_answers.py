@@ -6,6 +6,13 @@ from .question import Question
 
 class QuestionWithAnswers(Question):
     answers: list[Answer] = Field(
-        description="Answers to specified question",
+        description="Answers to specified question ordered by creation time",
         examples=["Answer to a question is 42"]
     )
+    answers_total: int = Field(
+        description="Total amount of answers to specified question"
+    )
+    answers_next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for fetching the next page of answers, or null if this is the last page"
+    )
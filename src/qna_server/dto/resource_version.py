@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class ResourceVersion(BaseModel):
+    """
+    Cheap to fetch version of data, used to find out if it was changed
+    without fetching the data itself.
+    """
+
+    tag: str = Field(
+        description="Opaque value that changes every time the data changes"
+    )
+    modified_at: datetime | None = Field(
+        default=None,
+        description="When the data was changed last time, if it is known"
+    )
@@ -1,7 +1,9 @@
 from .data_integrity_error import DataIntegrityError
+from .invalid_cursor_error import InvalidCursorError
 from .not_found_error import NotFoundError
 
 __all__ = (
     "DataIntegrityError",
+    "InvalidCursorError",
     "NotFoundError",
 )
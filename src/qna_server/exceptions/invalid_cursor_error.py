@@ -0,0 +1,4 @@
+class InvalidCursorError(Exception):
+    """
+    Raised when pagination cursor can not be decoded.
+    """
@@ -0,0 +1,9 @@
+from .app_metrics import AppMetrics
+from .metrics_middleware import MetricsMiddleware
+from .statement_metrics import instrument_engine
+
+__all__ = (
+    "AppMetrics",
+    "MetricsMiddleware",
+    "instrument_engine"
+)
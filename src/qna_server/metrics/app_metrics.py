@@ -0,0 +1,44 @@
+from prometheus_client import CollectorRegistry, Gauge, Histogram, generate_latest
+
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+"""Upper bounds of latency histogram buckets in seconds."""
+
+
+class AppMetrics:
+    """
+    Metrics of a single server process, exposed in Prometheus text format.
+    """
+
+    def __init__(self) -> None:
+        # Own registry keeps metrics of apps made in one process apart
+        self.registry: CollectorRegistry = CollectorRegistry()
+        self.request_duration: Histogram = Histogram(
+            "qna_http_request_duration_seconds",
+            "Time of processing HTTP requests",
+            ["method", "route", "status"],
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry
+        )
+        self.requests_in_flight: Gauge = Gauge(
+            "qna_http_requests_in_flight",
+            "HTTP requests being processed",
+            ["method"],
+            registry=self.registry
+        )
+        self.statement_duration: Histogram = Histogram(
+            "qna_db_statement_duration_seconds",
+            "Time of executing database statements",
+            ["database", "operation", "table"],
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry
+        )
+
+    def render(self) -> bytes:
+        """
+        Renders current values of metrics.
+
+        :return: Metrics in Prometheus text format.
+        """
+        return generate_latest(self.registry)
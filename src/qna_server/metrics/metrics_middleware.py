@@ -0,0 +1,65 @@
+import time
+
+from prometheus_client import Gauge, Histogram
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .app_metrics import AppMetrics
+
+UNMATCHED_ROUTE: str = "<unmatched>"
+"""Route label of requests to paths without routes, so scanned paths do not make new series."""
+
+KNOWN_METHODS: frozenset[str] = frozenset(
+    {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+)
+
+
+class MetricsMiddleware:
+    """
+    Measures latency of requests by route and status, and counts requests being processed.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: AppMetrics):
+        self.app: ASGIApp = app
+        self.metrics: AppMetrics = metrics
+        # Children of labelled metrics are kept, since looking them up takes a lock every time
+        self._durations: dict[tuple[str, str, int], Histogram] = {}
+        self._in_flight: dict[str, Gauge] = {
+            method: metrics.requests_in_flight.labels(method)
+            for method in (*KNOWN_METHODS, "OTHER")
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method: str = scope["method"] if scope["method"] in KNOWN_METHODS else "OTHER"
+        # Requests failed before sending response are reported by server as internal errors
+        status: int = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+            await send(message)
+
+        requests_in_flight: Gauge = self._in_flight[method]
+        requests_in_flight.inc()
+        started_at: float = time.perf_counter()
+
+        try:
+            await self.app(scope, receive, send_with_status)
+
+        finally:
+            requests_in_flight.dec()
+            # Router puts matched route into scope, giving path template instead of path with IDs
+            route: str = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            duration: float = time.perf_counter() - started_at
+            labels: tuple[str, str, int] = (method, route, status)
+            histogram: Histogram | None = self._durations.get(labels)
+            if histogram is None:
+                histogram = self.metrics.request_duration.labels(method, route, str(status))
+                self._durations[labels] = histogram
+
+            histogram.observe(duration)
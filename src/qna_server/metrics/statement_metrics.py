@@ -0,0 +1,84 @@
+import re
+import time
+from functools import lru_cache
+from typing import Any
+
+from prometheus_client import Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .app_metrics import AppMetrics
+
+KNOWN_OPERATIONS: frozenset[str] = frozenset(
+    {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "BEGIN", "COMMIT", "ROLLBACK"}
+)
+
+# Table after the first FROM, INTO or UPDATE, which is the main one for queries of the app
+TABLE_PATTERN: re.Pattern[str] = re.compile(
+    r'\b(?:FROM|INTO|UPDATE)\s+"?(\w+)', re.IGNORECASE
+)
+
+
+def _statement_labels(statement: str) -> tuple[str, str]:
+    """
+    Finds kind of statement and table it works with, keeping amount of label values small.
+
+    :param statement: SQL of statement.
+    :return: Operation and table name, empty if it is not known.
+    """
+    words: list[str] = statement.lstrip().split(None, 1)
+    operation: str = words[0].upper() if words else ""
+    if operation not in KNOWN_OPERATIONS:
+        return "OTHER", ""
+
+    table: re.Match[str] | None = TABLE_PATTERN.search(statement)
+    return operation, table.group(1).lower() if table else ""
+
+
+def instrument_engine(engine: AsyncEngine, metrics: AppMetrics, database: str) -> None:
+    """
+    Measures latency of statements executed with engine.
+
+    :param engine: Engine to measure statements of.
+    :param metrics: Metrics to put measurements into.
+    :param database: Label of database engine is connected to.
+    :return: Nothing.
+    """
+    # Cached, since the same SQL is rendered for every execution of a query
+    @lru_cache(maxsize=1024)
+    def statement_histogram(statement: str) -> Histogram:
+        return metrics.statement_duration.labels(database, *_statement_labels(statement))
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def start_timer(
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool
+    ) -> None:
+        conn.info.setdefault("qna_statement_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def observe_duration(
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool
+    ) -> None:
+        duration: float = time.perf_counter() - conn.info["qna_statement_started_at"].pop()
+        statement_histogram(statement).observe(duration)
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def drop_timer(exception_context: Any) -> None:
+        # Failed statements are not measured, but their start has to be forgotten
+        started_at: list[float] | None = (
+            exception_context.connection.info.get("qna_statement_started_at")
+            if exception_context.connection is not None else None
+        )
+        if started_at:
+            started_at.pop()
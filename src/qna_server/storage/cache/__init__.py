@@ -0,0 +1,11 @@
+from .cached_answers_repo import CachedAnswersRepository
+from .cached_questions_repo import CachedQuestionsRepository
+from .question_changes_listener import QuestionChangesListener
+from .questions_cache import QuestionsCache
+
+__all__ = (
+    "CachedAnswersRepository",
+    "CachedQuestionsRepository",
+    "QuestionChangesListener",
+    "QuestionsCache"
+)
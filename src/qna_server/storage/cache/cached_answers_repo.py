@@ -0,0 +1,45 @@
+from typing import Sequence
+
+from qna_server.dto import Answer, AnswersBulkResult, CreateAnswer
+from qna_server.storage.protocol import AnswersRepository
+from .questions_cache import QuestionsCache
+
+
+class CachedAnswersRepository(AnswersRepository):
+    """
+    Invalidates cached questions when their answers change.
+    """
+
+    def __init__(self, repository: AnswersRepository, cache: QuestionsCache):
+        self.repository: AnswersRepository = repository
+        self.cache: QuestionsCache = cache
+
+    async def create_answer(self, question_id: int, answer_content: CreateAnswer) -> Answer:
+        created_answer: Answer = await self.repository.create_answer(question_id, answer_content)
+        self.cache.invalidate(question_id)
+
+        return created_answer
+
+    async def create_answers_bulk(
+        self,
+        answers_content: Sequence[tuple[int, CreateAnswer]]
+    ) -> AnswersBulkResult:
+        result: AnswersBulkResult = await self.repository.create_answers_bulk(answers_content)
+
+        for question_id in {answer.question_id for answer in result.created}:
+            self.cache.invalidate(question_id)
+
+        return result
+
+    async def fetch_answer_by_id(self, answer_id: int) -> Answer | None:
+        return await self.repository.fetch_answer_by_id(answer_id)
+
+    async def delete_answer(self, answer_id: int) -> bool:
+        # Question of an answer never changes, so it can be looked up before deletion
+        answer: Answer | None = await self.repository.fetch_answer_by_id(answer_id)
+        deleted: bool = await self.repository.delete_answer(answer_id)
+
+        if answer is not None:
+            self.cache.invalidate(answer.question_id)
+
+        return deleted
@@ -0,0 +1,128 @@
+from contextvars import Token
+from typing import AsyncIterator, Awaitable, Callable, Sequence, TypeVar
+
+from qna_server.dto import (
+    CreateQuestion,
+    PageCursor,
+    Question,
+    QuestionsOrder,
+    QuestionsPage,
+    QuestionsPageCursor,
+    QuestionWithAnswers,
+    ResourceVersion,
+)
+from qna_server.storage.protocol import QuestionsRepository
+from qna_server.storage.sqla_implementation.replica_router import reads_from_primary
+from .questions_cache import CacheKey, QuestionsCache
+
+T = TypeVar("T")
+
+
+class CachedQuestionsRepository(QuestionsRepository):
+    """
+    Serves question details from cache, passing other calls to wrapped repository.
+
+    Cached values are loaded from primary database only, since invalidation
+    may come before replicas apply the change. Requests that have to read from primary
+    skip the cache, as it may not have received invalidation of their writes yet.
+    """
+
+    def __init__(self, repository: QuestionsRepository, cache: QuestionsCache):
+        self.repository: QuestionsRepository = repository
+        self.cache: QuestionsCache = cache
+
+    async def _get_or_load(self, key: CacheKey, loader: Callable[[], Awaitable[T]]) -> T:
+        """
+        Returns cached value, or loads it from primary database and stores it in cache.
+
+        :param key: Key of cached value.
+        :param loader: Loads value from wrapped repository.
+        :return: Cached or loaded value.
+        """
+        if reads_from_primary.get():
+            return await loader()
+
+        async def load_from_primary() -> T:
+            token: Token[bool] = reads_from_primary.set(True)
+            try:
+                return await loader()
+
+            finally:
+                reads_from_primary.reset(token)
+
+        return await self.cache.get_or_load(key, load_from_primary)
+
+    async def create_new_question(self, question_content: CreateQuestion) -> Question:
+        created_question: Question = await self.repository.create_new_question(question_content)
+        # Question might have been requested before it was created and cached as missing
+        self.cache.invalidate(created_question.id)
+
+        return created_question
+
+    async def create_questions_bulk(
+        self,
+        questions_content: Sequence[CreateQuestion]
+    ) -> list[Question]:
+        created_questions: list[Question] = await self.repository.create_questions_bulk(
+            questions_content
+        )
+        for created_question in created_questions:
+            self.cache.invalidate(created_question.id)
+
+        return created_questions
+
+    async def get_all_questions(self) -> list[Question]:
+        return await self.repository.get_all_questions()
+
+    async def get_questions_page(
+        self,
+        limit: int,
+        cursor: QuestionsPageCursor | None = None,
+        order: QuestionsOrder = QuestionsOrder.CREATED_AT
+    ) -> QuestionsPage:
+        return await self.repository.get_questions_page(limit, cursor, order)
+
+    async def get_questions_page_version(
+        self,
+        limit: int,
+        cursor: QuestionsPageCursor | None = None,
+        order: QuestionsOrder = QuestionsOrder.CREATED_AT
+    ) -> ResourceVersion:
+        return await self.repository.get_questions_page_version(limit, cursor, order)
+
+    def stream_all_questions(self, batch_size: int = 1000) -> AsyncIterator[Question]:
+        return self.repository.stream_all_questions(batch_size)
+
+    async def fetch_specific_question(
+        self,
+        question_id: int,
+        answers_limit: int | None = None,
+        answers_cursor: PageCursor | None = None
+    ) -> QuestionWithAnswers | None:
+        key: CacheKey = (
+            question_id,
+            answers_limit,
+            (answers_cursor.created_at, answers_cursor.id) if answers_cursor else None
+        )
+
+        return await self._get_or_load(
+            key,
+            lambda: self.repository.fetch_specific_question(
+                question_id,
+                answers_limit,
+                answers_cursor
+            )
+        )
+
+    async def get_question_version(self, question_id: int) -> ResourceVersion | None:
+        # Stored next to details of the question, so both are invalidated together
+        return await self._get_or_load(
+            (question_id, "version", None),
+            lambda: self.repository.get_question_version(question_id)
+        )
+
+    async def delete_question(self, question_id: int) -> bool:
+        deleted: bool = await self.repository.delete_question(question_id)
+        self.cache.invalidate(question_id)
+
+        return deleted
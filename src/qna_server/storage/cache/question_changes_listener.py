@@ -0,0 +1,125 @@
+import asyncio
+import logging
+from typing import Any
+
+import asyncpg  # type: ignore[import-untyped]
+from sqlalchemy import URL
+
+from qna_server.custom_types import current_context_id, generate_context_id
+from qna_server.storage.sqla_implementation.change_notifications import QUESTION_CHANGES_CHANNEL
+from .questions_cache import QuestionsCache
+
+logger: logging.Logger = logging.getLogger("qna_logger")
+
+
+class QuestionChangesListener:
+    """
+    Listens for Postgres notifications about changed questions
+    and removes them from cache of current process.
+
+    Notifications sent while listener is disconnected are lost,
+    so whole cache is cleared every time listener (re)connects.
+    """
+
+    def __init__(
+        self,
+        database_url: URL,
+        cache: QuestionsCache,
+        reconnect_delay: float = 1.0,
+        health_check_interval: float = 30.0
+    ):
+        # Listener uses its own connection, so it does not hold a connection from pool of engine,
+        # and option of SQLAlchemy dialect is not passed to asyncpg
+        self.dsn: str = (
+            database_url.set(drivername="postgresql")
+            .difference_update_query(["prepared_statement_cache_size"])
+            .render_as_string(hide_password=False)
+        )
+        self.cache: QuestionsCache = cache
+        self.reconnect_delay: float = reconnect_delay
+        self.health_check_interval: float = health_check_interval
+        self.connected: asyncio.Event = asyncio.Event()
+
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """
+        Starts listening in background task.
+
+        :return: Nothing.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen_forever())
+
+    async def stop(self) -> None:
+        """
+        Stops listening and waits until connection is closed.
+
+        :return: Nothing.
+        """
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+
+        except asyncio.CancelledError:
+            pass
+
+        self._task = None
+
+    async def _listen_forever(self) -> None:
+        # Task has its own copy of context, so logs of listener are told apart from requests
+        current_context_id.set(generate_context_id())
+        while True:
+            try:
+                await self._listen()
+
+            except (OSError, asyncio.TimeoutError, asyncpg.PostgresError, asyncpg.InterfaceError):
+                logger.exception(
+                    "Lost connection for listening to question changes"
+                )
+
+            self.connected.clear()
+            await asyncio.sleep(self.reconnect_delay)
+
+    async def _listen(self) -> None:
+        connection: asyncpg.Connection = await asyncpg.connect(self.dsn)
+        terminated: asyncio.Event = asyncio.Event()
+        connection.add_termination_listener(lambda _: terminated.set())
+
+        try:
+            await connection.add_listener(QUESTION_CHANGES_CHANNEL, self._on_notification)
+            self.cache.clear()
+            self.connected.set()
+            logger.info(
+                "Listening for question changes on channel %s",
+                QUESTION_CHANGES_CHANNEL
+            )
+
+            while not terminated.is_set():
+                try:
+                    await asyncio.wait_for(terminated.wait(), self.health_check_interval)
+
+                except asyncio.TimeoutError:
+                    # Connection might have been dropped without closing it
+                    await connection.fetchval("SELECT 1", timeout=self.health_check_interval)
+
+        finally:
+            if not connection.is_closed():
+                await connection.close(timeout=self.reconnect_delay)
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        try:
+            question_id: int = int(payload)
+
+        except ValueError:
+            logger.warning(
+                "Received malformed question change notification payload=%r, clearing cache",
+                payload
+            )
+            self.cache.clear()
+            return
+
+        self.cache.invalidate(question_id)
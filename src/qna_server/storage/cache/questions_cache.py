@@ -0,0 +1,166 @@
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Hashable, NamedTuple, TypeVar
+
+from qna_server.dto import CacheStats
+
+CacheKey = tuple[int, Hashable, Hashable]
+"""Cache key that starts from ID of a question cached data belongs to."""
+
+T = TypeVar("T")
+
+
+class _CacheEntry(NamedTuple):
+    value: object
+    expires_at: float
+
+
+class QuestionsCache:
+    """
+    Bounded LRU cache of question related data with time to live for entries.
+
+    Entries are grouped by question ID, so every entry of a question can be invalidated
+    when question or its answers change. Missing questions are cached as well,
+    with separate time to live.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        negative_ttl: float,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_size: int = max_size
+        self.ttl: float = ttl
+        self.negative_ttl: float = negative_ttl
+        self.clock: Callable[[], float] = clock
+
+        self._entries: OrderedDict[CacheKey, _CacheEntry] = OrderedDict()
+        self._keys_by_question: dict[int, set[CacheKey]] = {}
+        # Change on invalidation, so data loaded before it is not cached. Generations
+        # of questions are kept only while they are loaded, and the global one changes on clear
+        self._generation: int = 0
+        self._question_generations: dict[int, int] = {}
+        self._loads_in_flight: dict[int, int] = {}
+
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._expirations: int = 0
+        self._invalidations: int = 0
+
+    async def get_or_load(self, key: CacheKey, loader: Callable[[], Awaitable[T]]) -> T:
+        """
+        Returns cached value or loads it and stores it in cache.
+
+        :param key: Key of cached value.
+        :param loader: Loads value if it is not cached. None values are cached
+            with negative time to live.
+        :return: Cached or loaded value.
+        """
+        entry: _CacheEntry | None = self._entries.get(key)
+
+        if entry is not None:
+            if entry.expires_at > self.clock():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.value  # type: ignore[return-value]
+
+            self._remove(key)
+            self._expirations += 1
+
+        self._misses += 1
+        question_id: int = key[0]
+        generation: tuple[int, int] = self._generation_of(question_id)
+        self._loads_in_flight[question_id] = self._loads_in_flight.get(question_id, 0) + 1
+
+        try:
+            value: T = await loader()
+
+            if generation == self._generation_of(question_id) and self.max_size > 0:
+                self._store(key, value)
+
+        finally:
+            self._finish_load(question_id)
+
+        return value
+
+    def invalidate(self, question_id: int) -> None:
+        """
+        Removes every cached entry of a question.
+
+        :param question_id: ID of a question that was changed.
+        :return: Nothing.
+        """
+        if question_id in self._loads_in_flight:
+            self._question_generations[question_id] = (
+                self._question_generations.get(question_id, 0) + 1
+            )
+
+        for key in self._keys_by_question.pop(question_id, ()):
+            del self._entries[key]
+            self._invalidations += 1
+
+    def clear(self) -> None:
+        """
+        Removes all cached entries.
+
+        :return: Nothing.
+        """
+        self._generation += 1
+        self._invalidations += len(self._entries)
+        self._entries.clear()
+        self._keys_by_question.clear()
+
+    def stats(self) -> CacheStats:
+        """
+        Returns cache counters.
+
+        :return: Current cache statistics.
+        """
+        return CacheStats(
+            size=len(self._entries),
+            max_size=self.max_size,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            expirations=self._expirations,
+            invalidations=self._invalidations
+        )
+
+    def _generation_of(self, question_id: int) -> tuple[int, int]:
+        return self._generation, self._question_generations.get(question_id, 0)
+
+    def _finish_load(self, question_id: int) -> None:
+        loads: int = self._loads_in_flight.pop(question_id) - 1
+
+        if loads > 0:
+            self._loads_in_flight[question_id] = loads
+
+        else:
+            # No load can see the old generation anymore, so counting starts anew
+            self._question_generations.pop(question_id, None)
+
+    def _store(self, key: CacheKey, value: object) -> None:
+        ttl: float = self.negative_ttl if value is None else self.ttl
+        self._entries[key] = _CacheEntry(value, self.clock() + ttl)
+        self._entries.move_to_end(key)
+        self._keys_by_question.setdefault(key[0], set()).add(key)
+
+        while len(self._entries) > self.max_size:
+            evicted_key, _ = self._entries.popitem(last=False)
+            self._forget_key(evicted_key)
+            self._evictions += 1
+
+    def _remove(self, key: CacheKey) -> None:
+        del self._entries[key]
+        self._forget_key(key)
+
+    def _forget_key(self, key: CacheKey) -> None:
+        question_keys: set[CacheKey] | None = self._keys_by_question.get(key[0])
+
+        if question_keys is not None:
+            question_keys.discard(key)
+            if not question_keys:
+                del self._keys_by_question[key[0]]
@@ -0,0 +1,11 @@
+from .answer_memory_repo import AnswerRepositoryMemory
+from .memory_storage import MemoryStorage
+from .question_memory_repo import QuestionsRepositoryMemory
+from .sorted_index import SortedIndex
+
+__all__ = (
+    "AnswerRepositoryMemory",
+    "MemoryStorage",
+    "QuestionsRepositoryMemory",
+    "SortedIndex"
+)
@@ -0,0 +1,106 @@
+import logging
+from typing import Sequence
+
+from qna_server.dto import Answer, AnswerCreationFailure, AnswersBulkResult, CreateAnswer
+from qna_server.exceptions import DataIntegrityError, NotFoundError
+from qna_server.storage.protocol import AnswersRepository
+from .memory_storage import MemoryStorage
+
+logger: logging.Logger = logging.getLogger("qna_logger")
+
+
+class AnswerRepositoryMemory(AnswersRepository):
+    def __init__(self, storage: MemoryStorage):
+        self.storage: MemoryStorage = storage
+
+    async def create_answer(
+        self, question_id: int, answer_content: CreateAnswer
+    ) -> Answer:
+        logger.debug(
+            "Started creating the answer for question with ID=%s",
+            question_id
+        )
+        new_answer: Answer | None = self.storage.add_answer(
+            question_id, answer_content.user_id, answer_content.text
+        )
+
+        if new_answer is None:
+            logger.warning(
+                "Failed to create an answer to a question that does not exist"
+            )
+            raise DataIntegrityError("Question does not exist to be linked to")
+
+        logger.debug(
+            "Successfully created the answer for question with ID=%s",
+            question_id
+        )
+        return new_answer
+
+    async def create_answers_bulk(
+        self,
+        answers_content: Sequence[tuple[int, CreateAnswer]]
+    ) -> AnswersBulkResult:
+        logger.debug(
+            "Started creating %s answers",
+            len(answers_content)
+        )
+
+        created: list[Answer] = []
+        failures: list[AnswerCreationFailure] = []
+        for index, (question_id, answer_content) in enumerate(answers_content):
+            new_answer: Answer | None = self.storage.add_answer(
+                question_id, answer_content.user_id, answer_content.text
+            )
+
+            if new_answer is None:
+                failures.append(
+                    AnswerCreationFailure(
+                        index=index,
+                        question_id=question_id,
+                        reason="Question not found"
+                    )
+                )
+                continue
+
+            created.append(new_answer)
+
+        logger.debug(
+            "Created %s answers, %s answers failed",
+            len(created),
+            len(failures)
+        )
+        return AnswersBulkResult(created=created, failed=failures)
+
+    async def fetch_answer_by_id(self, answer_id: int) -> Answer | None:
+        logger.info(
+            "Fetching information for answer with id=%s",
+            answer_id
+        )
+        answer: Answer | None = self.storage.answers.get(answer_id)
+
+        if answer is None:
+            logger.warning(
+                "Answer with id=%s not found",
+                answer_id
+            )
+            return None
+
+        logger.info(
+            "Successfully found answer with ID=%s",
+            answer_id
+        )
+        return answer
+
+    async def delete_answer(self, answer_id: int) -> bool:
+        logger.info(
+            "Deleting answer with id=%s",
+            answer_id
+        )
+
+        if not self.storage.remove_answer(answer_id):
+            logger.warning(
+                "No answer with provided ID found"
+            )
+            raise NotFoundError("Answer not found in storage")
+
+        return True
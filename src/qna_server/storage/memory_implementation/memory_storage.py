@@ -0,0 +1,268 @@
+from datetime import UTC, datetime, timedelta
+from itertools import count
+from typing import Any, Callable, Iterator
+
+from qna_server.dto import Answer, PageCursor, QuestionsOrder, QuestionsPageCursor
+from .sorted_index import SortedIndex
+
+QuestionKey = tuple[Any, ...]
+"""Position of a question in index of specific order, that ends with ID of the question."""
+
+AnswerKey = tuple[datetime, int]
+"""Position of an answer among answers to its question: creation time and ID."""
+
+EPOCH: datetime = datetime(1970, 1, 1, tzinfo=UTC)
+MICROSECOND: timedelta = timedelta(microseconds=1)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC)
+
+
+def _as_utc(moment: datetime) -> datetime:
+    # Naive time is taken as UTC, the same way database columns read it
+    return moment if moment.tzinfo is not None else moment.replace(tzinfo=UTC)
+
+
+def _descending(moment: datetime) -> int:
+    # Datetime can not be negated, so it is turned into exact amount of microseconds
+    return -((_as_utc(moment) - EPOCH) // MICROSECOND)
+
+
+class QuestionRecord:
+    """
+    Question with statistics of its answers and index of them.
+    """
+
+    __slots__ = (
+        "id",
+        "text",
+        "created_at",
+        "updated_at",
+        "answer_count",
+        "last_answer_at",
+        "answers"
+    )
+
+    def __init__(self, question_id: int, text: str, created_at: datetime):
+        self.id: int = question_id
+        self.text: str = text
+        self.created_at: datetime = created_at
+        self.updated_at: datetime = created_at
+        self.answer_count: int = 0
+        self.last_answer_at: datetime | None = None
+        self.answers: SortedIndex[AnswerKey] = SortedIndex()
+
+
+class MemoryStorage:
+    """
+    Questions and answers kept in memory of server process and shared by all requests.
+
+    Records are found by ID in dictionaries, questions are listed with sorted index
+    of every order, and answers with sorted index of their question.
+    Methods never await, so each change is seen by other tasks of event loop
+    either fully applied or not applied at all.
+    """
+
+    def __init__(self, clock: Callable[[], datetime] = _utc_now):
+        self.clock: Callable[[], datetime] = clock
+        self.questions: dict[int, QuestionRecord] = {}
+        self.answers: dict[int, Answer] = {}
+        self.questions_indexes: dict[QuestionsOrder, SortedIndex[QuestionKey]] = {
+            order: SortedIndex() for order in QuestionsOrder
+        }
+
+        self._question_ids: Iterator[int] = count(1)
+        self._answer_ids: Iterator[int] = count(1)
+
+    @staticmethod
+    def question_key(question: QuestionRecord, order: QuestionsOrder) -> QuestionKey:
+        """
+        Makes position of a question in index of specified order.
+
+        :param question: Question record.
+        :param order: Order of questions.
+        :return: Key that sorts ascending in specified order.
+        """
+        if order is QuestionsOrder.CREATED_AT:
+            return question.created_at, question.id
+
+        # IDs are negated for descending orders, which keeps them positive in the other one
+        if order is QuestionsOrder.ANSWER_COUNT:
+            return -question.answer_count, -question.id
+
+        if question.last_answer_at is None:
+            return 1, 0, -question.id
+
+        return 0, _descending(question.last_answer_at), -question.id
+
+    @staticmethod
+    def cursor_key(cursor: QuestionsPageCursor) -> QuestionKey:
+        """
+        Makes position of the last question on a page from its cursor.
+
+        :param cursor: Position of the last question on a page.
+        :return: Key in index of the order cursor was made for.
+        """
+        # Type of sort value is checked against order when cursor is validated
+        if cursor.sort_value is None:
+            return 1, 0, -cursor.id
+
+        if isinstance(cursor.sort_value, int):
+            return -cursor.sort_value, -cursor.id
+
+        if cursor.order is QuestionsOrder.CREATED_AT:
+            return _as_utc(cursor.sort_value), cursor.id
+
+        return 0, _descending(cursor.sort_value), -cursor.id
+
+    def iter_questions(
+        self,
+        order: QuestionsOrder,
+        after: QuestionKey | None = None
+    ) -> Iterator[QuestionRecord]:
+        """
+        Iterates over questions in specified order. Storage must not be changed while iterating.
+
+        :param order: Order of questions.
+        :param after: Position to start after, or None to start from the first question.
+        :return: Iterator over question records.
+        """
+        for key in self.questions_indexes[order].iter_after(after):
+            yield self.questions[abs(key[-1])]
+
+    def iter_answers(
+        self,
+        question: QuestionRecord,
+        cursor: PageCursor | None = None
+    ) -> Iterator[Answer]:
+        """
+        Iterates over answers to a question ordered by creation time and ID.
+        Storage must not be changed while iterating.
+
+        :param question: Question record.
+        :param cursor: Position of the last answer on a previous page,
+            or None to start from the first answer.
+        :return: Iterator over answers.
+        """
+        after: AnswerKey | None = (
+            (_as_utc(cursor.created_at), cursor.id) if cursor is not None else None
+        )
+        for _, answer_id in question.answers.iter_after(after):
+            yield self.answers[answer_id]
+
+    def add_question(self, text: str) -> QuestionRecord:
+        """
+        Adds new question.
+
+        :param text: Text of a question.
+        :return: Added question record.
+        """
+        question: QuestionRecord = QuestionRecord(next(self._question_ids), text, self.clock())
+        self.questions[question.id] = question
+        for order, index in self.questions_indexes.items():
+            index.add(self.question_key(question, order))
+
+        return question
+
+    def remove_question(self, question_id: int) -> bool:
+        """
+        Removes question together with its answers.
+
+        :param question_id: ID of a question.
+        :return: Flag signifying if question existed.
+        """
+        question: QuestionRecord | None = self.questions.pop(question_id, None)
+        if question is None:
+            return False
+
+        for order, index in self.questions_indexes.items():
+            index.discard(self.question_key(question, order))
+
+        for _, answer_id in question.answers.iter_after():
+            del self.answers[answer_id]
+
+        return True
+
+    def add_answer(self, question_id: int, user_id: str, text: str) -> Answer | None:
+        """
+        Adds answer to a question and updates statistics of the question.
+
+        :param question_id: ID of a question.
+        :param user_id: ID of a user that answered.
+        :param text: Text of an answer.
+        :return: Added answer, or None if question does not exist.
+        """
+        question: QuestionRecord | None = self.questions.get(question_id)
+        if question is None:
+            return None
+
+        answer: Answer = Answer.model_construct(
+            id=next(self._answer_ids),
+            question_id=question_id,
+            user_id=user_id,
+            text=text,
+            created_at=self.clock()
+        )
+        self.answers[answer.id] = answer
+        question.answers.add((answer.created_at, answer.id))
+
+        # Clock might go back, so the latest answer is not always the one just added
+        last_answer_at: datetime = answer.created_at
+        if question.last_answer_at is not None and question.last_answer_at > last_answer_at:
+            last_answer_at = question.last_answer_at
+
+        self._update_answers_stats(question, question.answer_count + 1, last_answer_at)
+
+        return answer
+
+    def remove_answer(self, answer_id: int) -> bool:
+        """
+        Removes answer and updates statistics of its question.
+
+        :param answer_id: ID of an answer.
+        :return: Flag signifying if answer existed.
+        """
+        answer: Answer | None = self.answers.pop(answer_id, None)
+        if answer is None:
+            return False
+
+        question: QuestionRecord = self.questions[answer.question_id]
+        question.answers.discard((answer.created_at, answer.id))
+
+        last_answer: AnswerKey | None = question.answers.last()
+        self._update_answers_stats(
+            question,
+            question.answer_count - 1,
+            last_answer[0] if last_answer is not None else None
+        )
+
+        return True
+
+    def _update_answers_stats(
+        self,
+        question: QuestionRecord,
+        answer_count: int,
+        last_answer_at: datetime | None
+    ) -> None:
+        """
+        Changes statistics of answers to a question, moving it in indexes that depend on them.
+
+        :param question: Question record.
+        :param answer_count: New amount of answers.
+        :param last_answer_at: New creation time of the latest answer.
+        :return: Nothing.
+        """
+        reordered: tuple[QuestionsOrder, ...] = (
+            QuestionsOrder.ANSWER_COUNT, QuestionsOrder.LAST_ANSWER_AT
+        )
+        for order in reordered:
+            self.questions_indexes[order].discard(self.question_key(question, order))
+
+        question.answer_count = answer_count
+        question.last_answer_at = last_answer_at
+        # Versions of questions are made from update time, so it must change on every update
+        question.updated_at = max(self.clock(), question.updated_at + MICROSECOND)
+
+        for order in reordered:
+            self.questions_indexes[order].add(self.question_key(question, order))
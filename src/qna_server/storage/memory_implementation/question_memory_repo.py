@@ -0,0 +1,248 @@
+import hashlib
+import logging
+from itertools import islice
+from typing import AsyncIterator, Sequence
+
+from qna_server.dto import (
+    Answer,
+    CreateQuestion,
+    PageCursor,
+    Question,
+    QuestionsOrder,
+    QuestionsPage,
+    QuestionsPageCursor,
+    QuestionWithAnswers,
+    ResourceVersion,
+)
+from qna_server.exceptions import NotFoundError
+from qna_server.storage.protocol import QuestionsRepository
+from qna_server.storage.row_mapping import (
+    question_from_row,
+    question_with_answers_from_row,
+)
+from .memory_storage import MemoryStorage, QuestionKey, QuestionRecord
+
+logger: logging.Logger = logging.getLogger("qna_logger")
+
+
+class QuestionsRepositoryMemory(QuestionsRepository):
+    def __init__(self, storage: MemoryStorage):
+        self.storage: MemoryStorage = storage
+
+    def _page_records(
+        self,
+        limit: int,
+        cursor: QuestionsPageCursor | None,
+        order: QuestionsOrder
+    ) -> list[QuestionRecord]:
+        """
+        Takes records of a page of questions with one extra record to know if there is a next page.
+
+        :param limit: Maximum amount of questions on a page.
+        :param cursor: Position of the last question on a previous page.
+        :param order: Order of questions.
+        :return: Up to limit + 1 records.
+        """
+        after: QuestionKey | None = self.storage.cursor_key(cursor) if cursor is not None else None
+
+        return list(islice(self.storage.iter_questions(order, after), limit + 1))
+
+    async def create_new_question(self, question_content: CreateQuestion) -> Question:
+        logger.debug(
+            "Creating new question"
+        )
+        new_question: QuestionRecord = self.storage.add_question(question_content.text)
+
+        logger.debug(
+            "Question was successfully created"
+        )
+        return question_from_row(new_question)
+
+    async def create_questions_bulk(
+        self,
+        questions_content: Sequence[CreateQuestion]
+    ) -> list[Question]:
+        logger.debug(
+            "Creating %s new questions",
+            len(questions_content)
+        )
+
+        return [
+            question_from_row(self.storage.add_question(question.text))
+            for question in questions_content
+        ]
+
+    async def get_all_questions(self) -> list[Question]:
+        logger.info(
+            "Fetching questions"
+        )
+        questions_list: list[Question] = [
+            question_from_row(question)
+            for question in self.storage.iter_questions(QuestionsOrder.CREATED_AT)
+        ]
+
+        logger.info(
+            "Fetched %s questions",
+            len(questions_list)
+        )
+        return questions_list
+
+    async def get_questions_page(
+        self,
+        limit: int,
+        cursor: QuestionsPageCursor | None = None,
+        order: QuestionsOrder = QuestionsOrder.CREATED_AT
+    ) -> QuestionsPage:
+        logger.info(
+            "Fetching page of %s questions ordered by %s after cursor=%r",
+            limit,
+            order,
+            cursor
+        )
+        fetched_questions: list[QuestionRecord] = self._page_records(limit, cursor, order)
+
+        # One extra record is taken to know if there is a next page
+        has_next_page: bool = len(fetched_questions) > limit
+        questions_list: list[Question] = [
+            question_from_row(question) for question in fetched_questions[:limit]
+        ]
+
+        next_cursor: str | None = None
+        if has_next_page:
+            last_question: Question = questions_list[-1]
+            next_cursor = QuestionsPageCursor(
+                order=order,
+                sort_value=getattr(last_question, order.value),
+                id=last_question.id
+            ).encode()
+
+        logger.info(
+            "Fetched page of %s questions",
+            len(questions_list)
+        )
+        return QuestionsPage(questions=questions_list, next_cursor=next_cursor)
+
+    async def get_questions_page_version(
+        self,
+        limit: int,
+        cursor: QuestionsPageCursor | None = None,
+        order: QuestionsOrder = QuestionsOrder.CREATED_AT
+    ) -> ResourceVersion:
+        logger.debug(
+            "Fetching version of page of %s questions ordered by %s after cursor=%r",
+            limit,
+            order,
+            cursor
+        )
+        page_records: list[QuestionRecord] = self._page_records(limit, cursor, order)
+
+        # Made the same way as by database repository, so tags do not depend on storage
+        page_digest: str = hashlib.blake2b(
+            ",".join(
+                f"{question.id}@{question.updated_at.isoformat()}" for question in page_records
+            ).encode(),
+            digest_size=16
+        ).hexdigest()
+
+        return ResourceVersion(tag=page_digest)
+
+    async def stream_all_questions(self, batch_size: int = 1000) -> AsyncIterator[Question]:
+        logger.info(
+            "Streaming questions in batches of %s",
+            batch_size
+        )
+
+        streamed_count: int = 0
+        after: QuestionKey | None = None
+        while True:
+            # Storage may change while batch is consumed, so each batch is taken at once
+            # and the next one continues from position of the last question
+            batch: list[QuestionRecord] = list(
+                islice(self.storage.iter_questions(QuestionsOrder.CREATED_AT, after), batch_size)
+            )
+            if not batch:
+                break
+
+            after = self.storage.question_key(batch[-1], QuestionsOrder.CREATED_AT)
+            for question in [question_from_row(question) for question in batch]:
+                yield question
+                streamed_count += 1
+
+        logger.info(
+            "Streamed %s questions",
+            streamed_count
+        )
+
+    async def fetch_specific_question(
+        self,
+        question_id: int,
+        answers_limit: int | None = None,
+        answers_cursor: PageCursor | None = None
+    ) -> QuestionWithAnswers | None:
+        logger.info(
+            "Fetching question with ID=%s, "
+            "answers_limit=%r answers after answers_cursor=%r",
+            question_id,
+            answers_limit,
+            answers_cursor
+        )
+        question: QuestionRecord | None = self.storage.questions.get(question_id)
+
+        if question is None:
+            logger.info(
+                "Question with ID=%s not found",
+                question_id
+            )
+            return None
+
+        # One extra answer is taken to know if there is a next page
+        fetched_answers: list[Answer] = list(
+            islice(
+                self.storage.iter_answers(question, answers_cursor),
+                answers_limit + 1 if answers_limit is not None else None
+            )
+        )
+        answers_list: list[Answer] = fetched_answers[:answers_limit]
+
+        answers_next_cursor: str | None = None
+        if answers_limit is not None and len(fetched_answers) > answers_limit:
+            answers_next_cursor = PageCursor(
+                created_at=answers_list[-1].created_at,
+                id=answers_list[-1].id
+            ).encode()
+
+        logger.info(
+            "Fetching question with ID=%s completed successfully",
+            question_id
+        )
+        return question_with_answers_from_row(question, answers_list, answers_next_cursor)
+
+    async def get_question_version(self, question_id: int) -> ResourceVersion | None:
+        logger.debug(
+            "Fetching version of question with ID=%s",
+            question_id
+        )
+        question: QuestionRecord | None = self.storage.questions.get(question_id)
+
+        if question is None:
+            return None
+
+        return ResourceVersion(
+            tag=f"{question_id}:{question.updated_at.isoformat()}",
+            modified_at=question.updated_at
+        )
+
+    async def delete_question(self, question_id: int) -> bool:
+        logger.debug(
+            "Deleting question with ID=%s",
+            question_id
+        )
+
+        if not self.storage.remove_question(question_id):
+            logger.warning(
+                "Question for deletion was not found with ID=%s",
+                question_id
+            )
+            raise NotFoundError(f"Question with ID={question_id} not found")
+
+        return True
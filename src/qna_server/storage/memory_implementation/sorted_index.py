@@ -0,0 +1,80 @@
+from bisect import bisect_right, insort
+from typing import Any, Generic, Iterator, TypeVar
+
+K = TypeVar("K", bound=tuple[Any, ...])
+
+
+class SortedIndex(Generic[K]):
+    """
+    Keys kept in ascending order for listing them after a position.
+
+    Removed keys are only marked and skipped while listing, so removal does not
+    shift the list. Marked keys are dropped at once when they make up half of the list.
+    """
+
+    def __init__(self) -> None:
+        self._keys: list[K] = []
+        self._removed: set[K] = set()
+
+    def __len__(self) -> int:
+        return len(self._keys) - len(self._removed)
+
+    def add(self, key: K) -> None:
+        """
+        Adds key to the index.
+
+        :param key: Key that is not in the index yet.
+        :return: Nothing.
+        """
+        if key in self._removed:
+            self._removed.discard(key)
+            return
+
+        # Keys mostly come in ascending order, so they are appended without search
+        if not self._keys or self._keys[-1] < key:
+            self._keys.append(key)
+
+        else:
+            insort(self._keys, key)
+
+    def discard(self, key: K) -> None:
+        """
+        Removes key from the index.
+
+        :param key: Key that is in the index.
+        :return: Nothing.
+        """
+        self._removed.add(key)
+
+        if len(self._removed) * 2 > len(self._keys):
+            self._keys = [key for key in self._keys if key not in self._removed]
+            self._removed.clear()
+
+    def last(self) -> K | None:
+        """
+        Returns the greatest key in the index.
+
+        :return: Key, or None if index is empty.
+        """
+        for key in reversed(self._keys):
+            if key not in self._removed:
+                return key
+
+        return None
+
+    def iter_after(self, key: K | None = None) -> Iterator[K]:
+        """
+        Iterates over keys greater than provided one.
+
+        Index must not be changed while iterating, so callers take as many keys
+        as they need without awaiting in between.
+
+        :param key: Key to start after, or None to start from the smallest key.
+        :return: Iterator over keys in ascending order.
+        """
+        start: int = 0 if key is None else bisect_right(self._keys, key)
+
+        for index in range(start, len(self._keys)):
+            current_key: K = self._keys[index]
+            if current_key not in self._removed:
+                yield current_key
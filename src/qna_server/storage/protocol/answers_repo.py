@@ -1,7 +1,7 @@
 from abc import abstractmethod
-from typing import Protocol, runtime_checkable
+from typing import Protocol, Sequence, runtime_checkable
 
-from qna_server.dto import Answer, CreateAnswer
+from qna_server.dto import Answer, AnswersBulkResult, CreateAnswer
 
 
 @runtime_checkable
@@ -17,6 +17,20 @@ class AnswersRepository(Protocol):
         :raises DataIntegrityError: If question that answer is linked to does not exist.
         """
 
+    @abstractmethod
+    async def create_answers_bulk(
+        self,
+        answers_content: Sequence[tuple[int, CreateAnswer]]
+    ) -> AnswersBulkResult:
+        """
+        Creates multiple answers to any questions at once.
+        Answers to questions that do not exist are skipped and reported as failed,
+        without preventing creation of other answers.
+
+        :param answers_content: Pairs of question ID and content of an answer to it.
+        :return: Created answers in provided order and failures with their positions.
+        """
+
     @abstractmethod
     async def fetch_answer_by_id(self, answer_id: int) -> Answer | None:
         """
@@ -1,7 +1,15 @@
 from abc import abstractmethod
-from typing import Protocol, runtime_checkable
+from typing import AsyncIterator, Protocol, Sequence, runtime_checkable
 
-from qna_server.dto import CreateQuestion, Question
+from qna_server.dto import (
+    CreateQuestion,
+    PageCursor,
+    Question,
+    QuestionsOrder,
+    QuestionsPage,
+    QuestionsPageCursor,
+    ResourceVersion,
+)
 from qna_server.dto.questions_with_answers import QuestionWithAnswers
 
 
@@ -19,6 +27,18 @@ class QuestionsRepository(Protocol):
         :return: Created question.
         """
 
+    @abstractmethod
+    async def create_questions_bulk(
+        self,
+        questions_content: Sequence[CreateQuestion]
+    ) -> list[Question]:
+        """
+        Creates multiple questions in system with a single statement.
+
+        :param questions_content: Contents of questions.
+        :return: Created questions in the same order as provided contents.
+        """
+
     @abstractmethod
     async def get_all_questions(self) -> list[Question]:
         """
@@ -28,14 +48,76 @@ class QuestionsRepository(Protocol):
         """
 
     @abstractmethod
-    async def fetch_specific_question(self, question_id: int) -> QuestionWithAnswers | None:
+    async def get_questions_page(
+        self,
+        limit: int,
+        cursor: QuestionsPageCursor | None = None,
+        order: QuestionsOrder = QuestionsOrder.CREATED_AT
+    ) -> QuestionsPage:
+        """
+        Returns a page of questions in specified order, with ties ordered by ID.
+
+        :param limit: Maximum amount of questions on a page.
+        :param cursor: Position of the last question on a previous page,
+            or None to fetch the first page. Must be made for the same order.
+        :param order: Order of questions.
+        :return: Page of questions with cursor to the next page.
+        """
+
+    @abstractmethod
+    async def get_questions_page_version(
+        self,
+        limit: int,
+        cursor: QuestionsPageCursor | None = None,
+        order: QuestionsOrder = QuestionsOrder.CREATED_AT
+    ) -> ResourceVersion:
+        """
+        Returns version of a page of questions without fetching the questions themselves.
+
+        :param limit: Maximum amount of questions on a page.
+        :param cursor: Position of the last question on a previous page,
+            or None to use the first page. Must be made for the same order.
+        :param order: Order of questions.
+        :return: Version that changes whenever content of the page changes.
+        """
+
+    @abstractmethod
+    def stream_all_questions(self, batch_size: int = 1000) -> AsyncIterator[Question]:
+        """
+        Streams all registered questions ordered by creation time and ID
+        without loading them into memory at once.
+
+        :param batch_size: Amount of rows fetched from database at a time.
+        :return: Asynchronous iterator over questions.
         """
-        Fetches question by its ID.
+
+    @abstractmethod
+    async def fetch_specific_question(
+        self,
+        question_id: int,
+        answers_limit: int | None = None,
+        answers_cursor: PageCursor | None = None
+    ) -> QuestionWithAnswers | None:
+        """
+        Fetches question by its ID with its answers ordered by creation time and ID.
 
         :param question_id: ID of a question.
+        :param answers_limit: Maximum amount of answers to fetch, or None to fetch all of them.
+        :param answers_cursor: Position of the last answer on a previous page,
+            or None to fetch answers from the beginning.
         :return: Question if it was found or None.
         """
 
+    @abstractmethod
+    async def get_question_version(self, question_id: int) -> ResourceVersion | None:
+        """
+        Returns version of a question and its answers without fetching them.
+
+        :param question_id: ID of a question.
+        :return: Version that changes whenever question or its answers change,
+            or None if question was not found.
+        """
+
     @abstractmethod
     async def delete_question(self, question_id: int) -> bool:
         """
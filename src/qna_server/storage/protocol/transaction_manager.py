@@ -11,6 +11,15 @@ class TransactionManager(Protocol[SessionObject], AbstractAsyncContextManager[An
     Manages transaction objects for database.
     """
 
+    def for_reads(self) -> "TransactionManager[SessionObject]":
+        """
+        Returns manager of transactions that only read data,
+        which may be served by other database than writes.
+
+        :return: Transaction manager for read only transactions.
+        """
+        return self
+
     async def __aenter__(self) -> SessionObject:
         """
         Starts transaction.
@@ -0,0 +1,102 @@
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from qna_server.dto import Answer, Question, QuestionWithAnswers
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Every field is always set, so instances share one set of field names
+_QUESTION_FIELDS: set[str] = set(Question.model_fields)
+_ANSWER_FIELDS: set[str] = set(Answer.model_fields)
+_QUESTION_WITH_ANSWERS_FIELDS: set[str] = set(QuestionWithAnswers.model_fields)
+
+
+def _construct_trusted(model: type[ModelT], fields_set: set[str], values: dict[str, Any]) -> ModelT:
+    """
+    Makes model from values read from storage without validating them again.
+
+    Does the same as BaseModel.model_construct, except for applying defaults,
+    so values must be provided for every field.
+
+    :param model: Model to make.
+    :param fields_set: Names of all fields of the model.
+    :param values: Values of all fields of the model.
+    :return: Model instance.
+    """
+    instance: ModelT = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+
+    return instance
+
+
+def question_from_row(question: Any) -> Question:
+    """
+    Converts question record read from storage into question.
+
+    :param question: ORM object, plain row or in-memory record with question fields.
+    :return: Question data.
+    """
+    return _construct_trusted(
+        Question,
+        _QUESTION_FIELDS,
+        {
+            "id": question.id,
+            "text": question.text,
+            "created_at": question.created_at,
+            "answer_count": question.answer_count,
+            "last_answer_at": question.last_answer_at
+        }
+    )
+
+
+def answer_from_row(answer: Any) -> Answer:
+    """
+    Converts answer record read from storage into answer.
+
+    :param answer: ORM object, plain row or in-memory record with answer fields.
+    :return: Answer data.
+    """
+    return _construct_trusted(
+        Answer,
+        _ANSWER_FIELDS,
+        {
+            "id": answer.id,
+            "question_id": answer.question_id,
+            "user_id": answer.user_id,
+            "text": answer.text,
+            "created_at": answer.created_at
+        }
+    )
+
+
+def question_with_answers_from_row(
+    question: Any,
+    answers: list[Answer],
+    answers_next_cursor: str | None
+) -> QuestionWithAnswers:
+    """
+    Converts question record read from storage into question with page of its answers.
+
+    :param question: ORM object, plain row or in-memory record with question fields.
+    :param answers: Page of answers to the question.
+    :param answers_next_cursor: Cursor for the next page of answers.
+    :return: Question data with answers.
+    """
+    return _construct_trusted(
+        QuestionWithAnswers,
+        _QUESTION_WITH_ANSWERS_FIELDS,
+        {
+            "id": question.id,
+            "text": question.text,
+            "created_at": question.created_at,
+            "answer_count": question.answer_count,
+            "last_answer_at": question.last_answer_at,
+            "answers": answers,
+            "answers_total": question.answer_count,
+            "answers_next_cursor": answers_next_cursor
+        }
+    )
@@ -1,9 +1,16 @@
 from .question_sqla_repo import QuestionsRepositorySQLA
 from .transaction_manager_sqla import TransactionManagerSQLA
 from .answer_sqla_repo import AnswerRepositorySQLA
+from .instrumented_pool import InstrumentedAsyncQueuePool
+from .replica_router import ReplicaRouter, reads_from_primary
+from .slow_query_log import SlowQueryLog
 
 __all__ = (
     "QuestionsRepositorySQLA",
     "AnswerRepositorySQLA",
-    "TransactionManagerSQLA"
+    "TransactionManagerSQLA",
+    "InstrumentedAsyncQueuePool",
+    "ReplicaRouter",
+    "reads_from_primary",
+    "SlowQueryLog"
 )
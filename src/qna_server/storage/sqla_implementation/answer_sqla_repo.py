@@ -1,45 +1,131 @@
 import logging
-from typing import Optional
+from datetime import datetime
+from typing import Any, Iterable, Sequence
 
+from sqlalchemy import (
+    CTE,
+    Integer,
+    Row,
+    Select,
+    Update,
+    case,
+    column,
+    delete,
+    func,
+    insert,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError, NoResultFound
-from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy.sql.dml import ReturningDelete, ReturningInsert
 
-from qna_server.dto import Answer, CreateAnswer
+from qna_server.custom_types import ReadMode
+from qna_server.dto import Answer, AnswerCreationFailure, AnswersBulkResult, CreateAnswer
 from qna_server.exceptions import DataIntegrityError, NotFoundError
 from qna_server.storage.protocol import AnswersRepository
-from qna_server.custom_types import ContextID, LoggingContext, generate_context_id
-from .tables import AnswerTable
+from qna_server.storage.row_mapping import answer_from_row
+from .change_notifications import notify_questions_changed
+from .tables import AnswerTable, QuestionTable, UTCDateTime, utc_now_after
 from .transaction_manager_sqla import TransactionManagerSQLA
 
+logger: logging.Logger = logging.getLogger("qna_logger")
+
 
 class AnswerRepositorySQLA(AnswersRepository):
     def __init__(
         self,
         transaction: TransactionManagerSQLA,
-        context_id: Optional[ContextID] = None
+        read_mode: ReadMode = ReadMode.ORM,
+        emit_change_notifications: bool = False
     ):
         self.transaction: TransactionManagerSQLA = transaction
-        if context_id:
-            self.context_id: ContextID = context_id
+        self.read_mode: ReadMode = read_mode
+        self.emit_change_notifications: bool = emit_change_notifications
 
-        else:
-            self.context_id = generate_context_id()
+    async def _count_added_answers(
+        self,
+        session: AsyncSession,
+        added_answers: Iterable[tuple[int, datetime]]
+    ) -> None:
+        """
+        Updates answer statistics of questions after answers were added to them.
 
-        self.logger: logging.Logger = logging.getLogger("qna_logger")
-        self.logging_ctx = LoggingContext(context_id=self.context_id)
+        :param session: Session with transaction that added answers.
+        :param added_answers: ID of a question and creation time of every added answer.
+        :return: Nothing.
+        """
+        added_stats: dict[int, tuple[int, datetime]] = {}
+        for question_id, created_at in added_answers:
+            added_count, last_created_at = added_stats.get(question_id, (0, created_at))
+            added_stats[question_id] = (added_count + 1, max(last_created_at, created_at))
+
+        # Common table expression, since SQLite does not name columns of VALUES in FROM
+        added_counts: CTE = values(
+            column("question_id", Integer),
+            column("added_count", Integer),
+            column("last_created_at", UTCDateTime()),
+            name="added_counts"
+        ).data(
+            [(question_id, *stats) for question_id, stats in sorted(added_stats.items())]
+        ).cte("added_counts")
+        query: Update = (
+            update(QuestionTable)
+            .where(QuestionTable.id == added_counts.c.question_id)
+            .values(
+                answer_count=QuestionTable.answer_count + added_counts.c.added_count,
+                # Answers are created at now(), so concurrent transaction that started later
+                # and committed first might have already set later time
+                last_answer_at=case(
+                    (
+                        QuestionTable.last_answer_at > added_counts.c.last_created_at,
+                        QuestionTable.last_answer_at
+                    ),
+                    else_=added_counts.c.last_created_at
+                ),
+                updated_at=utc_now_after(QuestionTable.updated_at)
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await session.execute(query)
+
+    async def _count_deleted_answer(self, session: AsyncSession, question_id: int) -> None:
+        """
+        Updates answer statistics of a question after its answer was deleted.
+
+        :param session: Session with transaction that deleted an answer.
+        :param question_id: ID of a question which answer was deleted.
+        :return: Nothing.
+        """
+        query: Update = (
+            update(QuestionTable)
+            .where(QuestionTable.id == question_id)
+            .values(
+                answer_count=QuestionTable.answer_count - 1,
+                last_answer_at=(
+                    select(func.max(AnswerTable.created_at))
+                    .where(AnswerTable.question_id == QuestionTable.id)
+                    .scalar_subquery()
+                ),
+                updated_at=utc_now_after(QuestionTable.updated_at)
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await session.execute(query)
 
     async def create_answer(
         self, question_id: int, answer_content: CreateAnswer
     ) -> Answer:
-        self.logger.debug(
-            f"Started creating the answer for question with ID={question_id}",
-            extra=self.logging_ctx
+        logger.debug(
+            "Started creating the answer for question with ID=%s",
+            question_id
         )
 
         async with self.transaction as tr:
-            self.logger.debug(
-                f"Creating object with provided data: {answer_content=}",
-                extra=self.logging_ctx
+            logger.debug(
+                "Creating object with provided data: answer_content=%r",
+                answer_content
             )
 
             new_answer: AnswerTable = AnswerTable(
@@ -50,87 +136,177 @@ class AnswerRepositorySQLA(AnswersRepository):
             tr.add(new_answer)
 
             try:
-                self.logger.debug(
-                    f"Successfully created the answer for question with ID={question_id}",
-                    extra=self.logging_ctx
+                # Flushed before counting, since question takes creation time of the answer
+                await tr.flush()
+                logger.debug(
+                    "Successfully created the answer for question with ID=%s",
+                    question_id
                 )
+                await self._count_added_answers(tr, [(question_id, new_answer.created_at)])
+                if self.emit_change_notifications:
+                    await notify_questions_changed(tr, [question_id])
+
                 await tr.commit()
 
             except IntegrityError as err:
-                self.logger.warning(
-                    "Failed to create an answer to a question in database",
-                    extra=self.logging_ctx
+                logger.warning(
+                    "Failed to create an answer to a question in database"
                 )
                 raise DataIntegrityError("Question does not exist to be linked to") from err
 
-        self.logger.debug(
-            f"Successfully created the answer for question with ID={question_id}",
-            extra=self.logging_ctx
+        logger.debug(
+            "Successfully created the answer for question with ID=%s",
+            question_id
         )
 
-        return Answer(
-            id=new_answer.id,
-            question_id=new_answer.question_id,
-            user_id=new_answer.user_id,
-            text=new_answer.text,
-            created_at=new_answer.created_at
+        return answer_from_row(new_answer)
+
+    async def create_answers_bulk(
+        self,
+        answers_content: Sequence[tuple[int, CreateAnswer]]
+    ) -> AnswersBulkResult:
+        if not answers_content:
+            return AnswersBulkResult(created=[], failed=[])
+
+        logger.debug(
+            "Started creating %s answers",
+            len(answers_content)
         )
 
-    async def fetch_answer_by_id(self, answer_id: int) -> Answer | None:
         async with self.transaction as tr:
-            self.logger.info(
-                f"Fetching information for answer with id={answer_id}",
-                extra=self.logging_ctx
+            # Questions are locked against deletion until commit, so answers to them
+            # can not break foreign key on insert. Locks are taken in order of IDs
+            # to avoid deadlocks with concurrent bulk creations when questions are updated.
+            existence_query: Select[tuple[int]] = (
+                select(QuestionTable.id)
+                .where(
+                    QuestionTable.id.in_({question_id for question_id, _ in answers_content})
+                )
+                .order_by(QuestionTable.id)
+                .with_for_update(key_share=True)
+            )
+            existing_question_ids: set[int] = set(
+                (await tr.execute(existence_query)).scalars()
             )
-            answer_data: AnswerTable | None = await tr.get(AnswerTable, answer_id)
 
-        if answer_data is not None:
-            self.logger.info(
-                f"Successfully found answer with ID={answer_data.id}",
-                extra=self.logging_ctx
+            failures: list[AnswerCreationFailure] = []
+            new_answers: list[dict[str, int | str]] = []
+            for index, (question_id, answer_content) in enumerate(answers_content):
+                if question_id not in existing_question_ids:
+                    failures.append(
+                        AnswerCreationFailure(
+                            index=index,
+                            question_id=question_id,
+                            reason="Question not found"
+                        )
+                    )
+                    continue
+
+                new_answers.append(
+                    {
+                        "question_id": question_id,
+                        "user_id": answer_content.user_id,
+                        "text": answer_content.text
+                    }
+                )
+
+            created_rows: Sequence[Row[tuple[int, int, str, str, datetime]]] = []
+            if new_answers:
+                query: ReturningInsert[tuple[int, int, str, str, datetime]] = (
+                    insert(AnswerTable)
+                    .returning(
+                        AnswerTable.id,
+                        AnswerTable.question_id,
+                        AnswerTable.user_id,
+                        AnswerTable.text,
+                        AnswerTable.created_at,
+                        sort_by_parameter_order=True
+                    )
+                )
+                created_rows = (await tr.execute(query, new_answers)).all()
+                await self._count_added_answers(
+                    tr, ((row.question_id, row.created_at) for row in created_rows)
+                )
+                if self.emit_change_notifications:
+                    await notify_questions_changed(tr, [row.question_id for row in created_rows])
+
+                await tr.commit()
+
+        logger.debug(
+            "Created %s answers, %s answers failed",
+            len(created_rows),
+            len(failures)
+        )
+
+        return AnswersBulkResult(
+            created=[answer_from_row(row) for row in created_rows],
+            failed=failures
+        )
+
+    async def fetch_answer_by_id(self, answer_id: int) -> Answer | None:
+        async with self.transaction.for_reads() as tr:
+            logger.info(
+                "Fetching information for answer with id=%s",
+                answer_id
             )
+            answer_data: Any
+            if self.read_mode is ReadMode.CORE:
+                query: Select[tuple[int, int, str, str, datetime]] = (
+                    select(
+                        AnswerTable.id,
+                        AnswerTable.question_id,
+                        AnswerTable.user_id,
+                        AnswerTable.text,
+                        AnswerTable.created_at
+                    )
+                    .where(AnswerTable.id == answer_id)
+                )
+                answer_data = (await tr.execute(query)).one_or_none()
+
+            else:
+                answer_data = await tr.get(AnswerTable, answer_id)
 
-            return Answer(
-                id=answer_data.id,
-                question_id=answer_data.question_id,
-                user_id=answer_data.user_id,
-                text=answer_data.text,
-                created_at=answer_data.created_at
+        if answer_data is not None:
+            logger.info(
+                "Successfully found answer with ID=%s",
+                answer_data.id
             )
 
+            return answer_from_row(answer_data)
+
         else:
-            self.logger.warning(
-                f"Answer with id={answer_id} not found",
-                extra=self.logging_ctx
+            logger.warning(
+                "Answer with id=%s not found",
+                answer_id
             )
             return None
 
     async def delete_answer(self, answer_id: int) -> bool:
         async with self.transaction as tr:
-            self.logger.info(
-                f"Fetching information for answer with id={answer_id} to be deleted",
-                extra=self.logging_ctx
+            logger.info(
+                "Deleting answer with id=%s",
+                answer_id
             )
 
-            try:
-                answer_data: AnswerTable = await tr.get_one(AnswerTable, answer_id)
-
-            except NoResultFound as err:
-                self.logger.warning(
-                    "No answer with provided ID found",
-                    extra=self.logging_ctx
-                )
-                raise NotFoundError("Answer not found in database") from err
+            query: ReturningDelete[tuple[int]] = (
+                delete(AnswerTable)
+                .where(AnswerTable.id == answer_id)
+                .returning(AnswerTable.question_id)
+                .execution_options(synchronize_session=False)
+            )
 
             try:
-                await tr.delete(answer_data)
+                question_id: int = (await tr.execute(query)).scalar_one()
+                await self._count_deleted_answer(tr, question_id)
+                if self.emit_change_notifications:
+                    await notify_questions_changed(tr, [question_id])
+
                 await tr.commit()
 
-            except StaleDataError as err:
-                self.logger.warning(
-                    "Exception while deleting data from DB",
-                    extra=self.logging_ctx
+            except NoResultFound as err:
+                logger.warning(
+                    "No answer with provided ID found"
                 )
-                raise NotFoundError("Data was deleted before it could be found") from err
+                raise NotFoundError("Answer not found in database") from err
 
         return True
@@ -0,0 +1,36 @@
+from typing import Iterable
+
+from sqlalchemy import Integer, TextClause, bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+QUESTION_CHANGES_CHANNEL: str = "qna_question_changes"
+"""Postgres channel that receives IDs of changed questions."""
+
+_notify_query: TextClause = text(
+    "SELECT pg_notify(:channel, question_id::text) "
+    "FROM unnest(:question_ids) AS question_id"
+).bindparams(
+    bindparam("question_ids", type_=ARRAY(Integer))
+)
+
+
+async def notify_questions_changed(session: AsyncSession, question_ids: Iterable[int]) -> None:
+    """
+    Notifies listeners that data of questions was changed.
+
+    Notifications are delivered only after transaction is committed
+    and are dropped if it is rolled back.
+
+    :param session: Session with transaction that changes questions.
+    :param question_ids: IDs of changed questions.
+    :return: Nothing.
+    """
+    # Payload of one notification is limited in size, so each question gets its own
+    unique_ids: list[int] = sorted(set(question_ids))
+
+    if unique_ids:
+        await session.execute(
+            _notify_query,
+            {"channel": QUESTION_CHANGES_CHANNEL, "question_ids": unique_ids}
+        )
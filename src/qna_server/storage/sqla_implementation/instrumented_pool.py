@@ -0,0 +1,59 @@
+import time
+from typing import Any
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from qna_server.dto import PoolStats
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Connection pool that measures how long requests wait for connections.
+    """
+
+    # Keeps pool messages under sqlalchemy logger, which is configured separately from the app ones
+    _sqla_logger_namespace: str = "sqlalchemy.pool.impl.AsyncAdaptedQueuePool"
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.checkouts: int = 0
+        self.checkout_timeouts: int = 0
+        self.checkout_wait_seconds_total: float = 0.0
+        self.checkout_wait_seconds_max: float = 0.0
+
+    def connect(self) -> PoolProxiedConnection:
+        started_at: float = time.perf_counter()
+
+        try:
+            connection: PoolProxiedConnection = super().connect()
+
+        except PoolTimeoutError:
+            self.checkout_timeouts += 1
+            raise
+
+        finally:
+            waited: float = time.perf_counter() - started_at
+            self.checkout_wait_seconds_total += waited
+            self.checkout_wait_seconds_max = max(self.checkout_wait_seconds_max, waited)
+
+        self.checkouts += 1
+        return connection
+
+    def stats(self) -> PoolStats:
+        """
+        Returns state and counters of the pool.
+
+        :return: Current pool statistics.
+        """
+        return PoolStats(
+            size=self.size(),
+            max_overflow=self._max_overflow,
+            checked_out=self.checkedout(),
+            checked_in=self.checkedin(),
+            overflow=max(self.overflow(), 0),
+            checkouts=self.checkouts,
+            checkout_timeouts=self.checkout_timeouts,
+            checkout_wait_seconds_total=self.checkout_wait_seconds_total,
+            checkout_wait_seconds_max=self.checkout_wait_seconds_max
+        )
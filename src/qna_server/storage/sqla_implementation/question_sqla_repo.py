@@ -1,51 +1,138 @@
+import hashlib
 import logging
-from typing import Optional, Sequence
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Sequence
 
-from sqlalchemy import Result, Select, select
+from sqlalchemy import Result, Row, Select, delete, insert, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncScalarResult, AsyncSession
 from sqlalchemy.exc import IntegrityError, NoResultFound
-from sqlalchemy.orm import selectinload
-from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy.sql.dml import ReturningDelete, ReturningInsert
 
-from qna_server.dto import Answer, CreateQuestion, Question
+from qna_server.custom_types import ReadMode
+from qna_server.dto import (
+    Answer,
+    CreateQuestion,
+    PageCursor,
+    Question,
+    QuestionsOrder,
+    QuestionsPage,
+    QuestionsPageCursor,
+    ResourceVersion,
+)
 from qna_server.dto.questions_with_answers import QuestionWithAnswers
 from qna_server.exceptions import NotFoundError
 from qna_server.storage.protocol import QuestionsRepository
-from qna_server.storage.sqla_implementation.tables import QuestionTable
+from qna_server.storage.row_mapping import (
+    answer_from_row,
+    question_from_row,
+    question_with_answers_from_row,
+)
+from qna_server.storage.sqla_implementation.change_notifications import notify_questions_changed
+from qna_server.storage.sqla_implementation.tables import AnswerTable, QuestionTable
 from qna_server.storage.sqla_implementation.transaction_manager_sqla import TransactionManagerSQLA
-from qna_server.custom_types import ContextID, LoggingContext, generate_context_id
+
+logger: logging.Logger = logging.getLogger("qna_logger")
+# Events logged for every row are sampled separately from the rest
+row_logger: logging.Logger = logging.getLogger("qna_logger.rows")
+
+ALL_QUESTIONS_BATCH_SIZE: int = 1000
+"""Amount of rows fetched from database at once when all questions are read."""
 
 
 class QuestionsRepositorySQLA(QuestionsRepository):
     def __init__(
         self,
         transaction: TransactionManagerSQLA,
-        context_id: Optional[ContextID] = None
+        read_mode: ReadMode = ReadMode.ORM,
+        emit_change_notifications: bool = False
     ):
         self.transaction: TransactionManagerSQLA = transaction
-        if context_id:
-            self.context_id: ContextID = context_id
+        self.read_mode: ReadMode = read_mode
+        self.emit_change_notifications: bool = emit_change_notifications
 
-        else:
-            self.context_id = generate_context_id()
+    def _select_questions(self) -> Select[Any]:
+        """
+        Makes query for questions that loads either ORM objects or plain rows,
+        depending on read mode.
+
+        :return: Select query for questions.
+        """
+        if self.read_mode is ReadMode.CORE:
+            return select(
+                QuestionTable.id,
+                QuestionTable.text,
+                QuestionTable.created_at,
+                QuestionTable.answer_count,
+                QuestionTable.last_answer_at
+            )
 
-        self.logger: logging.Logger = logging.getLogger("qna_logger")
-        self.logging_ctx = LoggingContext(context_id=self.context_id)
+        return select(QuestionTable)
+
+    def _select_answers(self) -> Select[Any]:
+        """
+        Makes query for answers that loads either ORM objects or plain rows,
+        depending on read mode.
+
+        :return: Select query for answers.
+        """
+        if self.read_mode is ReadMode.CORE:
+            return select(
+                AnswerTable.id,
+                AnswerTable.question_id,
+                AnswerTable.user_id,
+                AnswerTable.text,
+                AnswerTable.created_at
+            )
+
+        return select(AnswerTable)
+
+    def _fetched_rows(self, results: Result[Any]) -> Sequence[Any]:
+        """
+        Fetches all records from query made by _select_questions or _select_answers.
+
+        :param results: Results of a query.
+        :return: ORM objects or plain rows, both having the same attributes.
+        """
+        if self.read_mode is ReadMode.CORE:
+            return results.all()
+
+        return results.scalars().all()
+
+    async def _streamed_rows(
+        self,
+        session: AsyncSession,
+        query: Select[Any]
+    ) -> AsyncResult[Any] | AsyncScalarResult[Any]:
+        """
+        Streams records from query made by _select_questions or _select_answers,
+        fetching them from database in batches of yield_per execution option.
+
+        :param session: Session to execute query in.
+        :param query: Query to execute.
+        :return: ORM objects or plain rows, both having the same attributes.
+        """
+        if self.read_mode is ReadMode.CORE:
+            return await session.stream(query)
+
+        return await session.stream_scalars(query)
 
     async def create_new_question(self, question_content: CreateQuestion) -> Question:
         async with self.transaction as tr:
-            self.logger.debug(
-                "Creating new question",
-                extra=self.logging_ctx
+            logger.debug(
+                "Creating new question"
             )
             new_question: QuestionTable = QuestionTable(
                 text=question_content.text
             )
             tr.add(new_question)
+            if self.emit_change_notifications:
+                await tr.flush()
+                await notify_questions_changed(tr, [new_question.id])
+
             await tr.commit()
 
-        self.logger.debug(
-            "Question was successfully created",
-            extra=self.logging_ctx
+        logger.debug(
+            "Question was successfully created"
         )
         return Question(
             id=new_question.id,
@@ -53,120 +140,380 @@ class QuestionsRepositorySQLA(QuestionsRepository):
             created_at=new_question.created_at
         )
 
-    async def get_all_questions(self) -> list[Question]:
+    async def create_questions_bulk(
+        self,
+        questions_content: Sequence[CreateQuestion]
+    ) -> list[Question]:
+        if not questions_content:
+            return []
+
         async with self.transaction as tr:
-            self.logger.info(
-                "Fetching questions",
-                extra=self.logging_ctx
+            logger.debug(
+                "Creating %s new questions",
+                len(questions_content)
             )
+            query: ReturningInsert[tuple[int, str, datetime]] = (
+                insert(QuestionTable)
+                .returning(
+                    QuestionTable.id,
+                    QuestionTable.text,
+                    QuestionTable.created_at,
+                    sort_by_parameter_order=True
+                )
+            )
+            created_rows: Sequence[Row[tuple[int, str, datetime]]] = (
+                await tr.execute(
+                    query,
+                    [{"text": question.text} for question in questions_content]
+                )
+            ).all()
+            if self.emit_change_notifications:
+                await notify_questions_changed(tr, [row.id for row in created_rows])
 
-            query: Select[tuple[QuestionTable]] = (
-                select(QuestionTable)
+            await tr.commit()
+
+        logger.debug(
+            "%s questions were successfully created",
+            len(created_rows)
+        )
+        return [
+            Question(id=row.id, text=row.text, created_at=row.created_at)
+            for row in created_rows
+        ]
+
+    async def get_all_questions(self) -> list[Question]:
+        async with self.transaction.for_reads() as tr:
+            logger.info(
+                "Fetching questions"
+            )
+
+            query: Select[Any] = (
+                self._select_questions()
                 .order_by(QuestionTable.created_at)
+                .execution_options(yield_per=ALL_QUESTIONS_BATCH_SIZE)
+            )
+            # Rows are fetched and converted in batches, so only questions are kept for all of them
+            questions_list: list[Question] = []
+            async for question in await self._streamed_rows(tr, query):
+                row_logger.debug(
+                    "Processing question with ID=%s",
+                    question.id
+                )
+
+                current_question: Question = question_from_row(question)
+                questions_list.append(current_question)
+
+                row_logger.debug(
+                    "Processed %s",
+                    current_question
+                )
+
+        logger.info(
+            "Fetched %s questions",
+            len(questions_list)
+        )
+        return questions_list
+
+    @staticmethod
+    def _page_queries(
+        base_query: Select[Any],
+        cursor: QuestionsPageCursor | None,
+        order: QuestionsOrder
+    ) -> list[Select[Any]]:
+        """
+        Makes queries for questions after cursor in specified order.
+        Results of queries follow each other, so a page is collected from them one by one.
+
+        :param base_query: Query selecting questions data.
+        :param cursor: Position of the last question on a previous page.
+        :param order: Order of questions.
+        :return: Queries that are executed until a page is filled.
+        """
+        if order is QuestionsOrder.CREATED_AT:
+            query: Select[Any] = base_query.order_by(QuestionTable.created_at, QuestionTable.id)
+            if cursor is not None:
+                query = query.where(
+                    tuple_(QuestionTable.created_at, QuestionTable.id) > (cursor.sort_value, cursor.id)
+                )
+
+            return [query]
+
+        if order is QuestionsOrder.ANSWER_COUNT:
+            query = base_query.order_by(QuestionTable.answer_count.desc(), QuestionTable.id.desc())
+            if cursor is not None:
+                query = query.where(
+                    tuple_(QuestionTable.answer_count, QuestionTable.id) < (cursor.sort_value, cursor.id)
+                )
+
+            return [query]
+
+        # Rows with NULL can not be compared with cursor, so questions without answers
+        # are fetched by separate query after all answered ones
+        answered_query: Select[Any] = (
+            base_query
+            .where(QuestionTable.last_answer_at.is_not(None))
+            .order_by(QuestionTable.last_answer_at.desc().nulls_last(), QuestionTable.id.desc())
+        )
+        unanswered_query: Select[Any] = (
+            base_query
+            .where(QuestionTable.last_answer_at.is_(None))
+            .order_by(QuestionTable.last_answer_at.desc().nulls_last(), QuestionTable.id.desc())
+        )
+
+        if cursor is None:
+            return [answered_query, unanswered_query]
+
+        if cursor.sort_value is None:
+            return [unanswered_query.where(QuestionTable.id < cursor.id)]
+
+        return [
+            answered_query.where(
+                tuple_(QuestionTable.last_answer_at, QuestionTable.id) < (cursor.sort_value, cursor.id)
+            ),
+            unanswered_query
+        ]
+
+    async def _fetch_page_rows(
+        self,
+        session: AsyncSession,
+        base_query: Select[Any],
+        limit: int,
+        cursor: QuestionsPageCursor | None,
+        order: QuestionsOrder,
+        fetch_rows: Callable[[Result[Any]], Sequence[Any]]
+    ) -> list[Any]:
+        """
+        Fetches rows of a page of questions with one extra row to know if there is a next page.
+
+        :param session: Session to execute queries in.
+        :param base_query: Query selecting questions data.
+        :param limit: Maximum amount of questions on a page.
+        :param cursor: Position of the last question on a previous page.
+        :param order: Order of questions.
+        :param fetch_rows: Fetches records from results of query.
+        :return: Up to limit + 1 rows.
+        """
+        page_rows: list[Any] = []
+
+        for query in self._page_queries(base_query, cursor, order):
+            page_rows.extend(
+                fetch_rows(await session.execute(query.limit(limit + 1 - len(page_rows))))
             )
-            results: Result[tuple[QuestionTable]] = await tr.execute(query)
-            fetched_questions: Sequence[QuestionTable] = results.scalars().all()
 
-        questions_list: list[Question] = []
-        for question in fetched_questions:
-            self.logger.debug(
-                f"Processing question with ID={question.id}",
-                extra=self.logging_ctx
+            if len(page_rows) > limit:
+                break
+
+        return page_rows
+
+    async def get_questions_page(
+        self,
+        limit: int,
+        cursor: QuestionsPageCursor | None = None,
+        order: QuestionsOrder = QuestionsOrder.CREATED_AT
+    ) -> QuestionsPage:
+        async with self.transaction.for_reads() as tr:
+            logger.info(
+                "Fetching page of %s questions ordered by %s after cursor=%r",
+                limit,
+                order,
+                cursor
+            )
+
+            fetched_questions: list[Any] = await self._fetch_page_rows(
+                tr, self._select_questions(), limit, cursor, order, self._fetched_rows
             )
 
-            current_question: Question = Question(id=question.id, text=question.text, created_at=question.created_at)
-            questions_list.append(current_question)
+        # One extra row is fetched to know if there is a next page
+        has_next_page: bool = len(fetched_questions) > limit
+        questions_list: list[Question] = [
+            question_from_row(question) for question in fetched_questions[:limit]
+        ]
+
+        next_cursor: str | None = None
+        if has_next_page:
+            last_question: Question = questions_list[-1]
+            next_cursor = QuestionsPageCursor(
+                order=order,
+                sort_value=getattr(last_question, order.value),
+                id=last_question.id
+            ).encode()
+
+        logger.info(
+            "Fetched page of %s questions",
+            len(questions_list)
+        )
+        return QuestionsPage(questions=questions_list, next_cursor=next_cursor)
 
-            self.logger.debug(
-                f"Processed {current_question}",
-                extra=self.logging_ctx
+    async def get_questions_page_version(
+        self,
+        limit: int,
+        cursor: QuestionsPageCursor | None = None,
+        order: QuestionsOrder = QuestionsOrder.CREATED_AT
+    ) -> ResourceVersion:
+        async with self.transaction.for_reads() as tr:
+            logger.debug(
+                "Fetching version of page of %s questions ordered by %s after cursor=%r",
+                limit,
+                order,
+                cursor
+            )
+
+            page_rows: list[Any] = await self._fetch_page_rows(
+                tr,
+                select(QuestionTable.id, QuestionTable.updated_at),
+                limit,
+                cursor,
+                order,
+                Result.all
+            )
+
+        # Text of questions is never edited and everything else changes together with updated_at
+        page_digest: str = hashlib.blake2b(
+            ",".join(f"{row.id}@{row.updated_at.isoformat()}" for row in page_rows).encode(),
+            digest_size=16
+        ).hexdigest()
+
+        return ResourceVersion(tag=page_digest)
+
+    async def stream_all_questions(self, batch_size: int = 1000) -> AsyncIterator[Question]:
+        async with self.transaction.for_reads() as tr:
+            logger.info(
+                "Streaming questions in batches of %s",
+                batch_size
+            )
+
+            query: Select[Any] = (
+                self._select_questions()
+                .order_by(QuestionTable.created_at, QuestionTable.id)
+                .execution_options(yield_per=batch_size)
             )
+            streamed_count: int = 0
+            async for question in await self._streamed_rows(tr, query):
+                yield question_from_row(question)
+                streamed_count += 1
 
-        self.logger.info(
-            f"Fetched {len(questions_list)} questions",
-            extra=self.logging_ctx
+        logger.info(
+            "Streamed %s questions",
+            streamed_count
         )
-        return questions_list
 
-    async def fetch_specific_question(self, question_id: int) -> QuestionWithAnswers | None:
-        self.logger.info(
-        f"Fetching question with ID={question_id}",
-            extra=self.logging_ctx
+    async def fetch_specific_question(
+        self,
+        question_id: int,
+        answers_limit: int | None = None,
+        answers_cursor: PageCursor | None = None
+    ) -> QuestionWithAnswers | None:
+        logger.info(
+            "Fetching question with ID=%s, "
+            "answers_limit=%r answers after answers_cursor=%r",
+            question_id,
+            answers_limit,
+            answers_cursor
         )
-        async with self.transaction as tr:
-            query: Select[tuple[QuestionTable]] = (
-                select(QuestionTable).options(
-                    selectinload(QuestionTable.answers)
-                ).where(QuestionTable.id == question_id)
+        async with self.transaction.for_reads() as tr:
+            fetched_questions: Sequence[Any] = self._fetched_rows(
+                await tr.execute(
+                    self._select_questions().where(QuestionTable.id == question_id)
+                )
             )
-            question: QuestionTable | None = (
-                await tr.execute(query)
-            ).scalar_one_or_none()
 
-        if question is not None:
-            answers_list = []
-
-            for answer in question.answers:
-                answers_list.append(
-                    Answer(
-                        id=answer.id,
-                        question_id=answer.question_id,
-                        user_id=answer.user_id,
-                        text=answer.text,
-                        created_at=answer.created_at
-                    )
+            fetched_answers: Sequence[Any] = []
+            if fetched_questions:
+                answers_query: Select[Any] = (
+                    self._select_answers()
+                    .where(AnswerTable.question_id == question_id)
+                    .order_by(AnswerTable.created_at, AnswerTable.id)
                 )
+                if answers_cursor is not None:
+                    answers_query = answers_query.where(
+                        tuple_(AnswerTable.created_at, AnswerTable.id) >
+                        (answers_cursor.created_at, answers_cursor.id)
+                    )
+                if answers_limit is not None:
+                    answers_query = answers_query.limit(answers_limit + 1)
 
-            self.logger.info(
-                f"Fetching question with ID={question_id} completed successfully",
-                extra=self.logging_ctx
-            )
-            return QuestionWithAnswers(
-                id=question.id,
-                text=question.text,
-                created_at=question.created_at,
-                answers=answers_list
+                fetched_answers = self._fetched_rows(await tr.execute(answers_query))
+
+        if not fetched_questions:
+            logger.info(
+                "Question with ID=%s not found",
+                question_id
             )
+            return None
+
+        question: Any = fetched_questions[0]
+        answers_list: list[Answer] = [
+            answer_from_row(answer) for answer in fetched_answers[:answers_limit]
+        ]
+
+        # One extra answer is fetched to know if there is a next page
+        answers_next_cursor: str | None = None
+        if answers_limit is not None and len(fetched_answers) > answers_limit:
+            answers_next_cursor = PageCursor(
+                created_at=answers_list[-1].created_at,
+                id=answers_list[-1].id
+            ).encode()
 
-        else:
-            self.logger.info(
-                f"Question with ID={question_id} not found",
-                extra=self.logging_ctx
+        logger.info(
+            "Fetching question with ID=%s completed successfully",
+            question_id
+        )
+        return question_with_answers_from_row(question, answers_list, answers_next_cursor)
+
+    async def get_question_version(self, question_id: int) -> ResourceVersion | None:
+        async with self.transaction.for_reads() as tr:
+            logger.debug(
+                "Fetching version of question with ID=%s",
+                question_id
             )
+
+            updated_at: datetime | None = (
+                await tr.execute(
+                    select(QuestionTable.updated_at)
+                    .where(QuestionTable.id == question_id)
+                )
+            ).scalar_one_or_none()
+
+        if updated_at is None:
             return None
 
+        return ResourceVersion(
+            tag=f"{question_id}:{updated_at.isoformat()}",
+            modified_at=updated_at
+        )
+
     async def delete_question(self, question_id: int) -> bool:
         async with self.transaction as tr:
-            self.logger.debug(
-                f"Deleting question with ID={question_id}",
-                extra=self.logging_ctx
+            logger.debug(
+                "Deleting question with ID=%s",
+                question_id
+            )
+
+            # Answers are removed by ON DELETE CASCADE, so one statement is enough
+            query: ReturningDelete[tuple[int]] = (
+                delete(QuestionTable)
+                .where(QuestionTable.id == question_id)
+                .returning(QuestionTable.id)
+                .execution_options(synchronize_session=False)
             )
 
             try:
-                query: Select[tuple[QuestionTable]] = (
-                    select(QuestionTable)
-                    .options(
-                        selectinload(QuestionTable.answers)
-                    )
-                    .where(QuestionTable.id == question_id)
-                )
-                question: QuestionTable = (
-                    await tr.execute(query)
-                ).scalar_one()
-                await tr.delete(question)
+                (await tr.execute(query)).scalar_one()
+                if self.emit_change_notifications:
+                    await notify_questions_changed(tr, [question_id])
+
                 await tr.commit()
 
             except NoResultFound as err:
-                self.logger.warning(
-                    f"Question for deletion was not found with ID={question_id}",
-                    extra=self.logging_ctx
+                logger.warning(
+                    "Question for deletion was not found with ID=%s",
+                    question_id
                 )
                 raise NotFoundError(f"Question with ID={question_id} not found") from err
 
-            except (IntegrityError, StaleDataError):
-                self.logger.exception(
-                    "Unexpected exception caught related to data integrity when deleting",
-                    extra=self.logging_ctx
+            except IntegrityError:
+                logger.exception(
+                    "Unexpected exception caught related to data integrity when deleting"
                 )
                 raise
 
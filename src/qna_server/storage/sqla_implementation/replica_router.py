@@ -0,0 +1,119 @@
+import asyncio
+import logging
+from contextvars import ContextVar
+from itertools import count
+from typing import Iterator, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from qna_server.custom_types import current_context_id, generate_context_id
+
+logger: logging.Logger = logging.getLogger("qna_logger")
+
+reads_from_primary: ContextVar[bool] = ContextVar("reads_from_primary", default=False)
+"""Set for requests which reads must see their own or recent writes, so replicas are not used."""
+
+
+class ReplicaRouter:
+    """
+    Picks read replica for read only transactions in round-robin order,
+    skipping replicas that failed the last health check.
+    """
+
+    def __init__(
+        self,
+        replica_engines: Sequence[AsyncEngine],
+        health_check_interval: float = 5.0
+    ):
+        self.replica_engines: Sequence[AsyncEngine] = replica_engines
+        self.health_check_interval: float = health_check_interval
+        self.session_makers: list[async_sessionmaker[AsyncSession]] = [
+            async_sessionmaker(engine, expire_on_commit=False) for engine in replica_engines
+        ]
+        # Replicas are trusted until the first health check says otherwise
+        self.healthy: list[bool] = [True] * len(replica_engines)
+
+        self._turns: Iterator[int] = count()
+        self._task: asyncio.Task[None] | None = None
+
+    def pick_session_maker(self) -> async_sessionmaker[AsyncSession] | None:
+        """
+        Picks the next healthy replica.
+
+        :return: Session maker of a replica, or None if reads should go to primary.
+        """
+        if reads_from_primary.get():
+            return None
+
+        replicas_count: int = len(self.session_makers)
+        turn: int = next(self._turns)
+
+        for offset in range(replicas_count):
+            index: int = (turn + offset) % replicas_count
+            if self.healthy[index]:
+                return self.session_makers[index]
+
+        return None
+
+    async def check_health(self, timeout: float = 1.0) -> None:
+        """
+        Checks that every replica accepts queries.
+
+        :param timeout: Time replica has to answer in.
+        :return: Nothing.
+        """
+        for index, engine in enumerate(self.replica_engines):
+            try:
+                async with asyncio.timeout(timeout), engine.connect() as connection:
+                    await connection.execute(text("SELECT 1"))
+
+                healthy: bool = True
+
+            except (OSError, TimeoutError, SQLAlchemyError):
+                healthy = False
+
+            if healthy != self.healthy[index]:
+                logger.warning(
+                    "Replica %s is %s",
+                    engine.url.render_as_string(),
+                    "back to healthy" if healthy else "unhealthy"
+                )
+
+            self.healthy[index] = healthy
+
+    def start(self) -> None:
+        """
+        Starts checking health of replicas in background task.
+
+        :return: Nothing.
+        """
+        if self._task is None and self.replica_engines:
+            self._task = asyncio.create_task(self._check_health_forever())
+
+    async def close(self) -> None:
+        """
+        Stops health checks and closes connections to replicas.
+
+        :return: Nothing.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+
+            except asyncio.CancelledError:
+                pass
+
+            self._task = None
+
+        for engine in self.replica_engines:
+            await engine.dispose()
+
+    async def _check_health_forever(self) -> None:
+        # Task has its own copy of context, so logs of health checks are told apart from requests
+        current_context_id.set(generate_context_id())
+        while True:
+            await self.check_health(timeout=self.health_check_interval)
+            await asyncio.sleep(self.health_check_interval)
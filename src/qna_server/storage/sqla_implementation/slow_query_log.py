@@ -0,0 +1,181 @@
+import logging
+import time
+from itertools import count
+from typing import Any, Iterator
+
+from sqlalchemy import Select, event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+slow_query_logger: logging.Logger = logging.getLogger("qna_logger.slow_queries")
+
+REDACTED_PARAMETERS: str = "<redacted>"
+
+STARTED_AT_KEY: str = "qna_slow_query_started_at"
+
+
+class SlowQueryLog:
+    """
+    Logs statements running longer than threshold with their duration and row count,
+    optionally capturing plans of some of them with EXPLAIN ANALYZE.
+
+    Records are made in request context, so they have context id of request that made the statement.
+    """
+
+    def __init__(
+        self,
+        threshold_seconds: float,
+        log_parameters: bool = False,
+        explain_every: int = 0
+    ):
+        self.threshold_seconds: float = threshold_seconds
+        self.log_parameters: bool = log_parameters
+        self.explain_every: int = explain_every
+
+        self._slow_statements: Iterator[int] = count()
+
+    def attach(self, engine: AsyncEngine) -> None:
+        """
+        Starts watching statements executed with engine.
+
+        :param engine: Engine to watch statements of.
+        :return: Nothing.
+        """
+        event.listen(engine.sync_engine, "before_cursor_execute", self._start_timer)
+        event.listen(engine.sync_engine, "after_cursor_execute", self._check_duration)
+        event.listen(engine.sync_engine, "handle_error", self._check_failed_duration)
+
+    def _start_timer(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool
+    ) -> None:
+        conn.info.setdefault(STARTED_AT_KEY, []).append(time.perf_counter())
+
+    def _check_duration(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool
+    ) -> None:
+        duration: float = time.perf_counter() - conn.info[STARTED_AT_KEY].pop()
+        if duration < self.threshold_seconds:
+            return
+
+        plan: str | None = None
+        if self._should_explain(conn, statement, context):
+            plan = self._explain(conn, statement, parameters)
+
+        slow_query_logger.warning(
+            "Slow statement took %.1f ms, rows=%s: %s; parameters: %s%s",
+            duration * 1000,
+            cursor.rowcount,
+            statement,
+            parameters if self.log_parameters else REDACTED_PARAMETERS,
+            f"\nPlan:\n{plan}" if plan is not None else ""
+        )
+
+    def _check_failed_duration(self, exception_context: Any) -> None:
+        started_at: list[float] | None = (
+            exception_context.connection.info.get(STARTED_AT_KEY)
+            if exception_context.connection is not None else None
+        )
+        if not started_at:
+            return
+
+        # Statements cancelled by timeouts are the slowest ones, so they are logged as well
+        duration: float = time.perf_counter() - started_at.pop()
+        if duration >= self.threshold_seconds:
+            slow_query_logger.warning(
+                "Slow statement failed after %.1f ms (%s): %s; parameters: %s",
+                duration * 1000,
+                exception_context.original_exception,
+                exception_context.statement,
+                exception_context.parameters if self.log_parameters else REDACTED_PARAMETERS
+            )
+
+    def _should_explain(
+        self,
+        conn: Connection,
+        statement: str,
+        context: ExecutionContext | None
+    ) -> bool:
+        """
+        Checks whether plan of slow statement should be captured.
+
+        EXPLAIN ANALYZE executes statement once again, so only plain selects built
+        with SQLAlchemy are explained: textual statements and selects without FROM
+        may call functions with side effects, like pg_notify, and selects with FOR UPDATE
+        take locks. Streamed ones are skipped to keep their cursor the only one on connection.
+
+        :param conn: Connection statement was executed with.
+        :param statement: SQL of statement.
+        :param context: Execution context of statement.
+        :return: Whether plan should be captured.
+        """
+        if self.explain_every == 0 or conn.dialect.name != "postgresql":
+            return False
+
+        compiled: Any = getattr(context, "compiled", None)
+        if context is None or compiled is None or not isinstance(compiled.statement, Select):
+            return False
+
+        select_statement: Select[Any] = compiled.statement
+        if select_statement._for_update_arg is not None or not select_statement.get_final_froms():
+            return False
+
+        if context.execution_options.get("stream_results", False):
+            return False
+
+        return next(self._slow_statements) % self.explain_every == 0
+
+    @staticmethod
+    def _explain(conn: Connection, statement: str, parameters: Any) -> str | None:
+        """
+        Captures plan of statement with actual timings and buffers usage.
+
+        Runs in a savepoint inside transaction, so failed EXPLAIN does not abort transaction of a request.
+
+        :param conn: Connection statement was executed with.
+        :param statement: SQL of statement.
+        :param parameters: Parameters of statement.
+        :return: Plan as text, or None if it could not be captured.
+        """
+        dbapi_connection: Any = conn.connection.dbapi_connection
+        in_transaction: bool = not getattr(dbapi_connection, "autocommit", False)
+        # Raw cursor is used so that EXPLAIN is not reported by engine events itself
+        cursor: Any = dbapi_connection.cursor()
+
+        try:
+            if in_transaction:
+                cursor.execute("SAVEPOINT qna_explain")
+
+            try:
+                cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+                plan: str = "\n".join(row[0] for row in cursor.fetchall())
+
+            except Exception:
+                if in_transaction:
+                    cursor.execute("ROLLBACK TO SAVEPOINT qna_explain")
+
+                raise
+
+            finally:
+                if in_transaction:
+                    cursor.execute("RELEASE SAVEPOINT qna_explain")
+
+        except (OSError, conn.dialect.loaded_dbapi.Error) as err:
+            slow_query_logger.warning("Failed to capture plan of slow statement: %s", err)
+            return None
+
+        finally:
+            cursor.close()
+
+        return plan
@@ -1,9 +1,13 @@
 from .answer import AnswerTable
 from .base import BaseTable
 from .question import QuestionTable
+from .timestamps import UTCDateTime, utc_now, utc_now_after
 
 __all__ = (
     "BaseTable",
     "AnswerTable",
-    "QuestionTable"
+    "QuestionTable",
+    "UTCDateTime",
+    "utc_now",
+    "utc_now_after"
 )
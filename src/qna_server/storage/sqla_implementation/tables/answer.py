@@ -1,9 +1,10 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, String, func
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import BaseTable
+from .timestamps import UTCDateTime, utc_now
 
 
 class AnswerTable(BaseTable):
@@ -12,15 +13,18 @@ class AnswerTable(BaseTable):
         primary_key=True
     )
     question_id: Mapped[int] = mapped_column(
-        ForeignKey("question.id")
+        ForeignKey("question.id", ondelete="CASCADE")
     )
     user_id: Mapped[str] = mapped_column(String(320))
     text: Mapped[str] = mapped_column(
         String(2048)
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now()
+        UTCDateTime(),
+        server_default=utc_now()
     )
 
     __tablename__ = "answer"
+    __table_args__ = (
+        Index("ix_answer_question_id_created_at_id", "question_id", "created_at", "id"),
+    )
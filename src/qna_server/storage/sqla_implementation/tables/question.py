@@ -1,11 +1,12 @@
 from __future__ import annotations
 from datetime import datetime
 
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .answer import AnswerTable
 from .base import BaseTable
+from .timestamps import UTCDateTime, utc_now
 
 
 class QuestionTable(BaseTable):
@@ -17,12 +18,38 @@ class QuestionTable(BaseTable):
         String(2048)
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now()
+        UTCDateTime(),
+        server_default=utc_now()
+    )
+    # Kept up to date by answers repository, so lists of questions do not have to count answers
+    answer_count: Mapped[int] = mapped_column(
+        server_default="0"
+    )
+    last_answer_at: Mapped[datetime | None] = mapped_column(
+        UTCDateTime()
+    )
+    # Changed together with answers of a question, so clients can check if it was modified
+    updated_at: Mapped[datetime] = mapped_column(
+        UTCDateTime(),
+        server_default=utc_now()
     )
 
     answers: Mapped[list[AnswerTable]] = relationship(
         lazy="raise",
-        cascade="all, delete-orphan"
+        order_by=(AnswerTable.created_at, AnswerTable.id),
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
     __tablename__ = "question"
+    __table_args__ = (
+        Index("ix_question_created_at_id", "created_at", "id"),
+        # Scanned backwards for listing most answered questions first
+        Index("ix_question_answer_count_id", "answer_count", "id"),
+    )
+
+
+Index(
+    "ix_question_last_answer_at_id",
+    QuestionTable.last_answer_at.desc().nulls_last(),
+    QuestionTable.id.desc()
+)
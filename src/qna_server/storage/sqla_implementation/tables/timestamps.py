@@ -0,0 +1,83 @@
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import DateTime, Dialect, TypeDecorator
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement
+
+SQLITE_UTC_NOW: str = "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
+"""Current time in the same format SQLAlchemy stores datetimes in SQLite,
+so that stored and bound values are compared as strings correctly."""
+
+
+class UTCDateTime(TypeDecorator[datetime]):
+    """
+    Timezone aware datetime stored in UTC.
+
+    SQLite has no timezone support, so values are stored there without timezone
+    and are returned as UTC ones.
+    """
+
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_bind_param(self, value: datetime | None, dialect: Dialect) -> datetime | None:
+        if value is not None and value.tzinfo is not None:
+            return value.astimezone(UTC)
+
+        return value
+
+    def process_result_value(self, value: datetime | None, dialect: Dialect) -> datetime | None:
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=UTC)
+
+        return value
+
+
+class utc_now(FunctionElement[datetime]):
+    """
+    Current time of the database, with microseconds in every supported database.
+    """
+
+    type = UTCDateTime()
+    inherit_cache = True
+
+
+@compiles(utc_now)
+def _compile_utc_now(element: utc_now, compiler: SQLCompiler, **kw: Any) -> str:
+    return "now()"
+
+
+@compiles(utc_now, "sqlite")
+def _compile_utc_now_sqlite(element: utc_now, compiler: SQLCompiler, **kw: Any) -> str:
+    # CURRENT_TIMESTAMP of SQLite has only seconds, which is not enough to order answers
+    return SQLITE_UTC_NOW
+
+
+class utc_now_after(FunctionElement[datetime]):
+    """
+    Current time of the database, or time right after provided one if it is not earlier.
+
+    PostgreSQL now() is time when transaction started, so transaction waiting for a lock
+    could write time older than the one committed before it. Values made with it never go back.
+    """
+
+    type = UTCDateTime()
+    inherit_cache = True
+
+
+@compiles(utc_now_after)
+def _compile_utc_now_after(element: utc_now_after, compiler: SQLCompiler, **kw: Any) -> str:
+    return f"greatest(now(), {compiler.process(element.clauses, **kw)} + interval '1 microsecond')"
+
+
+@compiles(utc_now_after, "sqlite")
+def _compile_utc_now_after_sqlite(element: utc_now_after, compiler: SQLCompiler, **kw: Any) -> str:
+    # SQLite reads time with milliseconds, so a millisecond is added to get a later one
+    later: str = (
+        f"strftime('%Y-%m-%d %H:%M:%f000', {compiler.process(element.clauses, **kw)}, "
+        "'+0.001 seconds')"
+    )
+
+    return f"max({SQLITE_UTC_NOW}, {later})"
@@ -4,6 +4,7 @@ from typing import Any
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from qna_server.storage.protocol import TransactionManager
+from .replica_router import ReplicaRouter
 
 
 class TransactionManagerSQLA(TransactionManager[AsyncSession]):
@@ -11,10 +12,31 @@ class TransactionManagerSQLA(TransactionManager[AsyncSession]):
     Manages SQLAlchemy ORM session.
     """
 
-    def __init__(self, sessionmaker: async_sessionmaker[AsyncSession]):
+    def __init__(
+        self,
+        sessionmaker: async_sessionmaker[AsyncSession],
+        replica_router: ReplicaRouter | None = None,
+        read_sessionmaker: async_sessionmaker[AsyncSession] | None = None
+    ):
         self.sessionmaker: async_sessionmaker[AsyncSession] = sessionmaker
+        self.replica_router: ReplicaRouter | None = replica_router
+        # Separate connections to primary database for reads, such as SQLite ones next to its writer
+        self.read_sessionmaker: async_sessionmaker[AsyncSession] | None = read_sessionmaker
         self.current_session: AsyncSession | None = None
 
+    def for_reads(self) -> "TransactionManagerSQLA":
+        if self.replica_router is not None:
+            replica_sessionmaker: async_sessionmaker[AsyncSession] | None = (
+                self.replica_router.pick_session_maker()
+            )
+            if replica_sessionmaker is not None:
+                return TransactionManagerSQLA(replica_sessionmaker)
+
+        if self.read_sessionmaker is not None:
+            return TransactionManagerSQLA(self.read_sessionmaker)
+
+        return self
+
     async def __aenter__(self) -> AsyncSession:
         self.current_session = self.sessionmaker()
 
@@ -1,26 +1,18 @@
 import logging
-from typing import Optional
+from typing import Sequence
 
-from qna_server.dto import Answer, CreateAnswer
+from qna_server.dto import Answer, AnswersBulkResult, CreateAnswer
 from qna_server.storage.protocol import AnswersRepository
-from qna_server.custom_types import ContextID, LoggingContext, generate_context_id
+
+logger: logging.Logger = logging.getLogger("qna_logger")
 
 
 class AnswersUseCases:
     def __init__(
         self,
-        answers_repo: AnswersRepository,
-        context_id: Optional[ContextID] = None
+        answers_repo: AnswersRepository
     ):
-        if context_id:
-            self.context_id: ContextID = context_id
-
-        else:
-            self.context_id = generate_context_id()
-
         self.answers_repo: AnswersRepository = answers_repo
-        self.logger: logging.Logger = logging.getLogger("qna_logger")
-        self.logging_ctx = LoggingContext(context_id=self.context_id)
 
     async def create_answer(self, question_id: int, answer_content: CreateAnswer) -> Answer:
         """
@@ -32,12 +24,36 @@ class AnswersUseCases:
         :raises DataIntegrityError: If question that answer is linked to does not exist.
         """
 
-        self.logger.info(
-            f"Creating new answer with {answer_content=}",
-            extra=self.logging_ctx
+        logger.info(
+            "Creating new answer with answer_content=%r",
+            answer_content
         )
         return await self.answers_repo.create_answer(question_id, answer_content)
 
+    async def create_answers_bulk(
+        self,
+        answers_content: Sequence[tuple[int, CreateAnswer]]
+    ) -> AnswersBulkResult:
+        """
+        Creates multiple answers to any questions at once.
+
+        :param answers_content: Pairs of question ID and content of an answer to it.
+        :return: Created answers and failures for answers to not existing questions.
+        """
+        logger.info(
+            "Creating %s new answers",
+            len(answers_content)
+        )
+        result: AnswersBulkResult = await self.answers_repo.create_answers_bulk(answers_content)
+
+        if result.failed:
+            logger.warning(
+                "Failed to create %s answers",
+                len(result.failed)
+            )
+
+        return result
+
     async def fetch_answer_by_id(self, answer_id: int) -> Answer | None:
         """
         Fetches an answer by the specified ID.
@@ -45,9 +61,9 @@ class AnswersUseCases:
         :param answer_id: ID of an answer to fetch.
         :return: Answer information or None.
         """
-        self.logger.info(
-            f"Fetching answer with {answer_id=}",
-            extra=self.logging_ctx
+        logger.info(
+            "Fetching answer with answer_id=%r",
+            answer_id
         )
         return await self.answers_repo.fetch_answer_by_id(answer_id)
 
@@ -59,8 +75,8 @@ class AnswersUseCases:
         :return: Flag that signifies if answer was deleted.
         :raises NotFoundError: If answer was not found by ID to be deleted.
         """
-        self.logger.info(
-            f"Deleting answer with {answer_id=}",
-            extra=self.logging_ctx
+        logger.info(
+            "Deleting answer with answer_id=%r",
+            answer_id
         )
         return await self.answers_repo.delete_answer(answer_id)
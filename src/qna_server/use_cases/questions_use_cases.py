@@ -1,27 +1,28 @@
 import logging
-from typing import Optional
-
-from qna_server.dto import CreateQuestion, Question, QuestionWithAnswers
-from qna_server.exceptions import NotFoundError
+from typing import AsyncIterator, Sequence
+
+from qna_server.dto import (
+    CreateQuestion,
+    PageCursor,
+    Question,
+    QuestionsOrder,
+    QuestionsPage,
+    QuestionsPageCursor,
+    QuestionWithAnswers,
+    ResourceVersion,
+)
+from qna_server.exceptions import InvalidCursorError, NotFoundError
 from qna_server.storage.protocol import QuestionsRepository
-from qna_server.custom_types import ContextID, LoggingContext, generate_context_id
+
+logger: logging.Logger = logging.getLogger("qna_logger")
 
 
 class QuestionsUseCases:
     def __init__(
         self,
-        question_repo: QuestionsRepository,
-        context_id: Optional[ContextID] = None
+        question_repo: QuestionsRepository
     ):
-        if context_id:
-            self.context_id: ContextID = context_id
-
-        else:
-            self.context_id = generate_context_id()
-
         self.question_repo: QuestionsRepository = question_repo
-        self.logger: logging.Logger = logging.getLogger("qna_logger")
-        self.logging_ctx = LoggingContext(context_id=self.context_id)
 
     async def create_new_question(self, question_content: CreateQuestion) -> Question:
         """
@@ -30,56 +31,170 @@ class QuestionsUseCases:
         :param question_content: Content of a question.
         :return: Question information.
         """
-        self.logger.info(
-            "Creating new question",
-            extra=self.logging_ctx
+        logger.info(
+            "Creating new question"
         )
 
         new_question: Question = await self.question_repo.create_new_question(question_content)
 
-        self.logger.info(
-            f"New question successfully created with ID={new_question.id}",
-            extra=self.logging_ctx
+        logger.info(
+            "New question successfully created with ID=%s",
+            new_question.id
         )
         return new_question
 
+    async def create_questions_bulk(
+        self,
+        questions_content: Sequence[CreateQuestion]
+    ) -> list[Question]:
+        """
+        Creates multiple questions in database at once.
+
+        :param questions_content: Contents of questions.
+        :return: Created questions in the same order as provided contents.
+        """
+        logger.info(
+            "Creating %s new questions",
+            len(questions_content)
+        )
+
+        return await self.question_repo.create_questions_bulk(questions_content)
+
     async def get_all_questions(self) -> list[Question]:
         """
         Fetches all questions information.
 
         :return: List of all questions.
         """
-        self.logger.info(
-            "Fetching all questions in database",
-            extra=self.logging_ctx
+        logger.info(
+            "Fetching all questions in database"
         )
         return await self.question_repo.get_all_questions()
 
-    async def fetch_specific_question(self, question_id: int) -> QuestionWithAnswers:
+    async def get_questions_page(
+        self,
+        limit: int,
+        cursor: QuestionsPageCursor | None = None,
+        order: QuestionsOrder = QuestionsOrder.CREATED_AT
+    ) -> QuestionsPage:
+        """
+        Fetches a page of questions in specified order.
+
+        :param limit: Maximum amount of questions on a page.
+        :param cursor: Position of the last question on a previous page.
+        :param order: Order of questions.
+        :return: Page of questions with cursor to the next page.
+        :raise InvalidCursorError: If cursor was made for another order.
+        """
+        logger.info(
+            "Fetching page of %s questions ordered by %s",
+            limit,
+            order
+        )
+        self._check_cursor_order(cursor, order)
+
+        return await self.question_repo.get_questions_page(limit, cursor, order)
+
+    async def get_questions_page_version(
+        self,
+        limit: int,
+        cursor: QuestionsPageCursor | None = None,
+        order: QuestionsOrder = QuestionsOrder.CREATED_AT
+    ) -> ResourceVersion:
+        """
+        Fetches version of a page of questions to check if it was changed.
+
+        :param limit: Maximum amount of questions on a page.
+        :param cursor: Position of the last question on a previous page.
+        :param order: Order of questions.
+        :return: Version of the page.
+        :raise InvalidCursorError: If cursor was made for another order.
+        """
+        self._check_cursor_order(cursor, order)
+
+        return await self.question_repo.get_questions_page_version(limit, cursor, order)
+
+    def _check_cursor_order(self, cursor: QuestionsPageCursor | None, order: QuestionsOrder) -> None:
+        """
+        Checks that cursor can be used to continue listing questions in specified order.
+
+        :param cursor: Position of the last question on a previous page.
+        :param order: Order of questions.
+        :return: Nothing.
+        :raise InvalidCursorError: If cursor was made for another order.
+        """
+        if cursor is not None and cursor.order is not order:
+            logger.warning(
+                "Cursor made for order %s was used with order %s",
+                cursor.order,
+                order
+            )
+            raise InvalidCursorError("Pagination cursor was made for another order of questions")
+
+    def stream_all_questions(self) -> AsyncIterator[Question]:
+        """
+        Streams all questions without loading them into memory at once.
+
+        :return: Asynchronous iterator over all questions.
+        """
+        logger.info(
+            "Streaming all questions in database"
+        )
+        return self.question_repo.stream_all_questions()
+
+    async def fetch_specific_question(
+        self,
+        question_id: int,
+        answers_limit: int | None = None,
+        answers_cursor: PageCursor | None = None
+    ) -> QuestionWithAnswers:
         """
         Fetch specific question by ID.
 
         :param question_id: ID of a question.
-        :return: Question information with all answers related to it.
+        :param answers_limit: Maximum amount of answers to fetch, or None to fetch all of them.
+        :param answers_cursor: Position of the last answer on a previous page.
+        :return: Question information with answers related to it.
         :raise NotFoundError: If question was not found by specified ID.
         """
-        self.logger.info(
-            f"Fetching question by ID={question_id}",
-            extra=self.logging_ctx
+        logger.info(
+            "Fetching question by ID=%s",
+            question_id
         )
         fetched_question_data: QuestionWithAnswers | None = await self.question_repo.fetch_specific_question(
-            question_id
+            question_id,
+            answers_limit,
+            answers_cursor
         )
 
         if fetched_question_data is None:
-            self.logger.warning(
-                f"Question with ID={question_id} not found",
-                extra=self.logging_ctx
+            logger.warning(
+                "Question with ID=%s not found",
+                question_id
             )
             raise NotFoundError(f"Question with ID={question_id} not found")
 
         return fetched_question_data
 
+    async def get_question_version(self, question_id: int) -> ResourceVersion:
+        """
+        Fetches version of a question and its answers to check if they were changed.
+
+        :param question_id: ID of a question.
+        :return: Version of the question.
+        :raise NotFoundError: If question was not found by specified ID.
+        """
+        version: ResourceVersion | None = await self.question_repo.get_question_version(question_id)
+
+        if version is None:
+            logger.warning(
+                "Question with ID=%s not found",
+                question_id
+            )
+            raise NotFoundError(f"Question with ID={question_id} not found")
+
+        return version
+
     async def delete_question(self, question_id: int) -> bool:
         """
         Delete question and all related answers.
@@ -88,9 +203,9 @@ class QuestionsUseCases:
         :return: Flag representing that question was deleted.
         :raise NotFoundError: Question was not found in database.
         """
-        self.logger.info(
-            f"Deleting question by ID={question_id}",
-            extra=self.logging_ctx
+        logger.info(
+            "Deleting question by ID=%s",
+            question_id
         )
 
         return await self.question_repo.delete_question(question_id)
@@ -0,0 +1,112 @@
+import itertools
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import Iterator, Mapping
+
+
+class InProcessQueueHandler(QueueHandler):
+    """
+    Puts records into queue as they are, so they are formatted by the listener thread.
+
+    Records never leave the process, so unlike with QueueHandler
+    their messages do not have to be formatted before being queued.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Passes only one of every specified amount of records.
+    """
+
+    def __init__(self, every: int):
+        super().__init__()
+        self.every: int = every
+        self._counter: Iterator[int] = itertools.count()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return next(self._counter) % self.every == 0
+
+
+class BackgroundLogging:
+    """
+    Moves writing of log records out of the event loop: handlers of configured loggers
+    are replaced with ones putting records into queues, and original handlers
+    process them in background threads.
+
+    Also samples records of specified loggers that log too many events to keep all of them.
+    """
+
+    def __init__(self, use_queue: bool = True, sampling: Mapping[str, int] | None = None):
+        self.use_queue: bool = use_queue
+        self.sampling: Mapping[str, int] = sampling or {}
+        self._listeners: list[QueueListener] = []
+        self._replaced_handlers: list[tuple[logging.Logger, logging.Handler, logging.Handler]] = []
+        self._filters: list[tuple[logging.Logger, SamplingFilter]] = []
+
+    def start(self) -> None:
+        """
+        Starts processing records in background and sampling records.
+
+        :return: Nothing.
+        """
+        for logger_name, every in self.sampling.items():
+            sampling_filter: SamplingFilter = SamplingFilter(every)
+            logging.getLogger(logger_name).addFilter(sampling_filter)
+            self._filters.append((logging.getLogger(logger_name), sampling_filter))
+
+        if not self.use_queue:
+            return
+
+        queue_handlers: dict[logging.Handler, InProcessQueueHandler] = {}
+        for logger in self._configured_loggers():
+            for handler in list(logger.handlers):
+                if isinstance(handler, QueueHandler):
+                    continue
+
+                if handler not in queue_handlers:
+                    records: SimpleQueue[logging.LogRecord] = SimpleQueue()
+                    listener: QueueListener = QueueListener(records, handler, respect_handler_level=True)
+                    listener.start()
+
+                    self._listeners.append(listener)
+                    queue_handlers[handler] = InProcessQueueHandler(records)
+
+                logger.removeHandler(handler)
+                logger.addHandler(queue_handlers[handler])
+                self._replaced_handlers.append((logger, handler, queue_handlers[handler]))
+
+    def stop(self) -> None:
+        """
+        Writes all queued records and returns original handlers to loggers.
+
+        :return: Nothing.
+        """
+        for logger, handler, queue_handler in self._replaced_handlers:
+            logger.removeHandler(queue_handler)
+            logger.addHandler(handler)
+
+        for listener in self._listeners:
+            listener.stop()
+
+        for logger, sampling_filter in self._filters:
+            logger.removeFilter(sampling_filter)
+
+        self._replaced_handlers.clear()
+        self._listeners.clear()
+        self._filters.clear()
+
+    @staticmethod
+    def _configured_loggers() -> list[logging.Logger]:
+        """
+        Finds loggers that have handlers.
+
+        :return: Root logger and other existing loggers.
+        """
+        return [logging.getLogger()] + [
+            logger for logger in logging.Logger.manager.loggerDict.values()
+            if isinstance(logger, logging.Logger) and logger.handlers
+        ]
@@ -1,11 +1,84 @@
+import socket
 import tomllib
 from pathlib import Path
+from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from qna_server.custom_types import ReadMode
 
 
 class DbSettings(BaseModel):
     connection_string: str
+    storage: Literal["sqla", "memory"] = "sqla"
+    read_mode: ReadMode = ReadMode.ORM
+    pool_size: int = Field(default=5, ge=1)
+    max_overflow: int = Field(default=10, ge=0)
+    pool_timeout_seconds: float = Field(default=30.0, gt=0)
+    pool_recycle_seconds: int = Field(default=-1, ge=-1)
+    pool_pre_ping: bool = False
+    statement_cache_size: int = Field(default=100, ge=0)
+    replica_connection_strings: list[str] = []
+    replica_health_check_interval_seconds: float = Field(default=5.0, gt=0)
+    read_your_writes_seconds: float = Field(default=0.0, ge=0)
+
+    @property
+    def backend_name(self) -> str:
+        """
+        Name of database backend, without driver, taken from connection string.
+
+        Parsed without SQLAlchemy, so loading configuration does not import it.
+
+        :return: Backend name, like postgresql or sqlite.
+        """
+        return self.connection_string.partition(":")[0].partition("+")[0]
+
+
+class CacheSettings(BaseModel):
+    enabled: bool = False
+    max_size: int = Field(default=10_000, ge=1)
+    ttl_seconds: float = Field(default=5.0, gt=0)
+    negative_ttl_seconds: float = Field(default=1.0, gt=0)
+    invalidation_notifications: bool = False
+
+
+class ServerSettings(BaseModel):
+    workers: int = Field(default=1, ge=1)
+    loop: Literal["auto", "asyncio", "uvloop"] = "auto"
+    http: Literal["auto", "h11", "httptools"] = "auto"
+    reuse_port: bool = False
+
+    @field_validator("reuse_port")
+    @classmethod
+    def check_reuse_port_support(cls, reuse_port: bool) -> bool:
+        if reuse_port and not hasattr(socket, "SO_REUSEPORT"):
+            raise ValueError("SO_REUSEPORT is not supported on this platform")
+
+        return reuse_port
+
+
+class LoggingSettings(BaseModel):
+    background: bool = True
+    sampling: dict[str, int] = Field(default={"qna_logger.rows": 100})
+
+    @field_validator("sampling")
+    @classmethod
+    def check_sampling_rates(cls, sampling: dict[str, int]) -> dict[str, int]:
+        if any(every < 1 for every in sampling.values()):
+            raise ValueError("Sampling must keep one of at least one record")
+
+        return sampling
+
+
+class SlowQueriesSettings(BaseModel):
+    enabled: bool = True
+    threshold_seconds: float = Field(default=0.2, gt=0)
+    log_parameters: bool = False
+    explain_every: int = Field(default=0, ge=0)
+
+
+class MetricsSettings(BaseModel):
+    enabled: bool = True
 
 
 class AppConfig(BaseModel):
@@ -13,6 +86,28 @@ class AppConfig(BaseModel):
     port: int = Field(ge=1, le=65_535)
     db_settings: DbSettings
     allowed_cors_domains: list[str]
+    cache: CacheSettings = CacheSettings()
+    server: ServerSettings = ServerSettings()
+    logging: LoggingSettings = LoggingSettings()
+    metrics: MetricsSettings = MetricsSettings()
+    slow_queries: SlowQueriesSettings = SlowQueriesSettings()
+
+    @model_validator(mode="after")
+    def check_notifications_support(self) -> "AppConfig":
+        if (
+            self.cache.invalidation_notifications
+            and self.db_settings.backend_name != "postgresql"
+        ):
+            raise ValueError("Cache invalidation notifications need PostgreSQL database")
+
+        return self
+
+    @model_validator(mode="after")
+    def check_memory_storage_workers(self) -> "AppConfig":
+        if self.db_settings.storage == "memory" and self.server.workers > 1:
+            raise ValueError("In-memory storage is not shared between worker processes")
+
+        return self
 
 
 def load_config(path: Path) -> AppConfig:
@@ -0,0 +1,119 @@
+from typing import Any
+
+from sqlalchemy import URL, Connection, event, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from qna_server.storage.sqla_implementation import InstrumentedAsyncQueuePool
+from qna_server.utils.config_schema import DbSettings
+
+SQLITE_PRAGMAS: dict[str, str | int] = {
+    # Readers do not block the writer and the writer does not block readers
+    "journal_mode": "WAL",
+    # Safe with WAL, loses only the latest transactions on power loss instead of corrupting database
+    "synchronous": "NORMAL",
+    # Off by default in SQLite, while answers are deleted together with questions by foreign key
+    "foreign_keys": "ON",
+    "temp_store": "MEMORY",
+    # Negative size is in KiB, so it is 64 MiB
+    "cache_size": -65_536,
+    "mmap_size": 256 * 1024 * 1024,
+}
+
+
+def _configure_sqlite(engine: AsyncEngine, busy_timeout_ms: int, single_writer: bool) -> None:
+    """
+    Sets pragmas of every new SQLite connection and makes engine begin transactions itself.
+
+    :param engine: Engine connected to SQLite database.
+    :param busy_timeout_ms: Time to wait for lock of database held by other connection.
+    :param single_writer: Whether transactions take write lock when they begin,
+        so that a transaction never fails upgrading its read lock when another process writes.
+        Connections of other engines are only used for reads, so they are made read only.
+    :return: Nothing.
+    """
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        # Driver would begin transactions only before writes, which breaks isolation of reads
+        dbapi_connection.isolation_level = None
+        cursor: Any = dbapi_connection.cursor()
+        pragmas: tuple[tuple[str, str | int], ...] = (
+            *SQLITE_PRAGMAS.items(),
+            ("busy_timeout", busy_timeout_ms),
+            ("query_only", "OFF" if single_writer else "ON")
+        )
+        for name, value in pragmas:
+            cursor.execute(f"PRAGMA {name} = {value}")
+
+        cursor.close()
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def begin_transaction(connection: Connection) -> None:
+        connection.exec_driver_sql("BEGIN IMMEDIATE" if single_writer else "BEGIN")
+
+
+def create_engine_from_settings(
+    db_settings: DbSettings,
+    connection_string: str | None = None
+) -> AsyncEngine:
+    """
+    Creates database engine with connection pool configured from settings.
+
+    SQLite engine of primary database has a single connection, since SQLite allows one writer at a time,
+    and engines of other SQLite databases (such as the same file opened for reads) use configured pool.
+
+    :param db_settings: Database settings from configuration.
+    :param connection_string: Connection string of a database other than primary one,
+        such as read replica, that uses the same settings.
+    :return: Engine with instrumented connection pool.
+    """
+    url: URL = make_url(connection_string or db_settings.connection_string)
+    connect_args: dict[str, int] = {}
+    pool_size: int = db_settings.pool_size
+    max_overflow: int = db_settings.max_overflow
+
+    if url.get_backend_name() == "postgresql" and url.get_driver_name() == "asyncpg":
+        # Caches of asyncpg itself and of SQLAlchemy dialect over it are both sized,
+        # so that prepared statements can be disabled entirely (e.g. behind pgbouncer)
+        connect_args["statement_cache_size"] = db_settings.statement_cache_size
+        url = url.update_query_dict(
+            {"prepared_statement_cache_size": str(db_settings.statement_cache_size)}
+        )
+
+    single_writer: bool = url.get_backend_name() == "sqlite" and connection_string is None
+    if single_writer:
+        pool_size, max_overflow = 1, 0
+
+    engine: AsyncEngine = create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=db_settings.pool_timeout_seconds,
+        pool_recycle=db_settings.pool_recycle_seconds,
+        pool_pre_ping=db_settings.pool_pre_ping,
+        connect_args=connect_args
+    )
+    if url.get_backend_name() == "sqlite":
+        _configure_sqlite(engine, int(db_settings.pool_timeout_seconds * 1000), single_writer)
+
+    return engine
+
+
+def create_read_engine_from_settings(db_settings: DbSettings) -> AsyncEngine | None:
+    """
+    Creates engine for read only transactions of primary database, if they need one.
+
+    Primary SQLite engine has a single connection taking write lock for every transaction,
+    so reads use a pool of their own connections to the same file.
+    In WAL mode they see every committed write and are not blocked by the writer.
+
+    :param db_settings: Database settings from configuration.
+    :return: Engine with instrumented connection pool,
+        or None if reads use engine of primary database.
+    """
+    url: URL = make_url(db_settings.connection_string)
+    # Every connection to in-memory database opens a database of its own
+    if url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:"):
+        return None
+
+    return create_engine_from_settings(db_settings, db_settings.connection_string)
@@ -1,13 +1,21 @@
-from dishka import Provider, Scope, provide
+from dishka import AnyOf, Provider, Scope, provide
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
+from qna_server.custom_types import ReadMode
+from qna_server.metrics import AppMetrics
+from qna_server.storage.cache import CachedAnswersRepository, CachedQuestionsRepository, QuestionsCache
+from qna_server.storage.memory_implementation import (
+    AnswerRepositoryMemory,
+    MemoryStorage,
+    QuestionsRepositoryMemory,
+)
 from qna_server.storage.protocol import AnswersRepository, QuestionsRepository
 from qna_server.storage.sqla_implementation import (
     AnswerRepositorySQLA,
     QuestionsRepositorySQLA,
+    ReplicaRouter,
     TransactionManagerSQLA,
 )
-from qna_server.custom_types import ContextID, generate_context_id
 from qna_server.use_cases.answers_use_cases import AnswersUseCases
 from qna_server.use_cases.questions_use_cases import QuestionsUseCases
 from qna_server.utils.config_schema import AppConfig
@@ -22,62 +30,142 @@ class AppConfigProvider(Provider):
         super().__init__()
         self.app_config: AppConfig = app_config
 
-    @provide(scope=Scope.REQUEST)
+    @provide(scope=Scope.APP)
     def get_app_config(self) -> AppConfig:
         return self.app_config
 
 
-class RequestContextIdentifierProvider(Provider):
-    @provide(scope=Scope.REQUEST)
-    def provide_request_id(self) -> ContextID:
-        return generate_context_id()
+class QuestionsCacheProvider(Provider):
+    """
+    Provides cache of questions shared by all requests
+    """
+
+    def __init__(self, questions_cache: QuestionsCache):
+        super().__init__()
+        self.questions_cache: QuestionsCache = questions_cache
+
+    @provide(scope=Scope.APP)
+    def get_questions_cache(self) -> QuestionsCache:
+        return self.questions_cache
+
+
+class MetricsProvider(Provider):
+    """
+    Provides metrics of server process
+    """
+
+    def __init__(self, metrics: AppMetrics):
+        super().__init__()
+        self.metrics: AppMetrics = metrics
+
+    @provide(scope=Scope.APP)
+    def get_metrics(self) -> AppMetrics:
+        return self.metrics
 
 
 class DatabaseSQLAReposProvider(Provider):
-    def __init__(self, engine: AsyncEngine):
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        read_mode: ReadMode = ReadMode.ORM,
+        questions_cache: QuestionsCache | None = None,
+        emit_change_notifications: bool = False,
+        replica_router: ReplicaRouter | None = None,
+        read_engine: AsyncEngine | None = None
+    ):
         super().__init__()
         self.engine: AsyncEngine = engine
+        self.replica_router: ReplicaRouter | None = replica_router
+        self.read_mode: ReadMode = read_mode
+        self.questions_cache: QuestionsCache | None = questions_cache
+        self.emit_change_notifications: bool = emit_change_notifications
         self.session_maker: async_sessionmaker[
             AsyncSession
         ] = async_sessionmaker(
             self.engine,
             expire_on_commit=False
         )
+        self.read_session_maker: async_sessionmaker[AsyncSession] | None = (
+            async_sessionmaker(read_engine, expire_on_commit=False) if read_engine is not None else None
+        )
+
+    # Also provided as optional, for consumers that work with in-memory storage as well
+    @provide(scope=Scope.APP, provides=AnyOf[AsyncEngine, AsyncEngine | None])
+    def get_engine(self) -> AsyncEngine:
+        return self.engine
 
     @provide(scope=Scope.REQUEST)
     def _get_transaction_manager(self) -> TransactionManagerSQLA:
-        return TransactionManagerSQLA(self.session_maker)
+        return TransactionManagerSQLA(self.session_maker, self.replica_router, self.read_session_maker)
 
     @provide(scope=Scope.REQUEST)
     def get_questions_repository(
         self,
-        transaction: TransactionManagerSQLA,
-        context_id: ContextID
+        transaction: TransactionManagerSQLA
     ) -> QuestionsRepository:
-        return QuestionsRepositorySQLA(transaction, context_id)
+        repository: QuestionsRepository = QuestionsRepositorySQLA(
+            transaction, self.read_mode, self.emit_change_notifications
+        )
+
+        if self.questions_cache is not None:
+            return CachedQuestionsRepository(repository, self.questions_cache)
+
+        return repository
 
     @provide(scope=Scope.REQUEST)
     def get_answers_repository(
         self,
-        transaction: TransactionManagerSQLA,
-        context_id: ContextID
+        transaction: TransactionManagerSQLA
     ) -> AnswersRepository:
-        return AnswerRepositorySQLA(transaction, context_id)
+        repository: AnswersRepository = AnswerRepositorySQLA(
+            transaction, self.read_mode, self.emit_change_notifications
+        )
+
+        if self.questions_cache is not None:
+            return CachedAnswersRepository(repository, self.questions_cache)
+
+        return repository
+
+
+class MemoryReposProvider(Provider):
+    """
+    Provides repositories keeping data in memory of server process,
+    which leaves out database when measuring cost of API layer
+    """
+
+    def __init__(self, storage: MemoryStorage):
+        super().__init__()
+        self.storage: MemoryStorage = storage
+
+    @provide(scope=Scope.APP)
+    def get_storage(self) -> MemoryStorage:
+        return self.storage
+
+    @provide(scope=Scope.APP)
+    def get_engine(self) -> AsyncEngine | None:
+        return None
+
+    # Repositories keep no state of their own, so they are shared by all requests
+    @provide(scope=Scope.APP)
+    def get_questions_repository(self, storage: MemoryStorage) -> QuestionsRepository:
+        return QuestionsRepositoryMemory(storage)
+
+    @provide(scope=Scope.APP)
+    def get_answers_repository(self, storage: MemoryStorage) -> AnswersRepository:
+        return AnswerRepositoryMemory(storage)
 
 
 class UseCasesProvider(Provider):
     @provide(scope=Scope.REQUEST)
     def get_questions_use_cases(
         self,
-        questions_repo: QuestionsRepository,
-        context_id: ContextID
+        questions_repo: QuestionsRepository
     ) -> QuestionsUseCases:
-        return QuestionsUseCases(questions_repo, context_id)
+        return QuestionsUseCases(questions_repo)
 
     @provide(scope=Scope.REQUEST)
     def get_answers_use_cases(
         self,
-        answers_repo: AnswersRepository,
-        context_id: ContextID
+        answers_repo: AnswersRepository
     ) -> AnswersUseCases:
-        return AnswersUseCases(answers_repo, context_id)
+        return AnswersUseCases(answers_repo)
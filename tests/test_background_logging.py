@@ -0,0 +1,41 @@
+import logging
+import threading
+
+from qna_server.utils.background_logging import BackgroundLogging
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+        self.threads: set[int] = set()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+        self.threads.add(threading.get_ident())
+
+
+def test_records_are_written_in_background_and_sampled():
+    logger: logging.Logger = logging.getLogger("qna_test_background")
+    logger.propagate = False
+    handler: RecordingHandler = RecordingHandler()
+    logger.addHandler(handler)
+
+    background_logging: BackgroundLogging = BackgroundLogging(
+        sampling={"qna_test_background.rows": 3}
+    )
+    background_logging.start()
+    try:
+        assert handler not in logger.handlers
+        logger.warning("Started with %s", "arguments")
+        for row in range(9):
+            logging.getLogger("qna_test_background.rows").warning("Row %s", row)
+
+    finally:
+        background_logging.stop()
+
+    assert logger.handlers == [handler]
+    assert [record.getMessage() for record in handler.records] == [
+        "Started with arguments", "Row 0", "Row 3", "Row 6"
+    ]
+    assert threading.get_ident() not in handler.threads
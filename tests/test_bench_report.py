@@ -0,0 +1,83 @@
+import argparse
+from pathlib import Path
+
+import pytest
+
+from qna_server.bench.cli import add_bench_arguments, run_bench
+from qna_server.bench.report import BenchReport, summarize
+from qna_server.bench.workload import Operation, parse_mix
+from qna_server.storage.memory_implementation import QuestionsRepositoryMemory
+
+
+def test_mix_is_parsed_by_short_operation_names():
+    assert parse_mix("list=3, detail=1,create_answer=0") == {
+        Operation.LIST_QUESTIONS: 3,
+        Operation.FETCH_QUESTION: 1,
+        Operation.CREATE_ANSWER: 0
+    }
+
+    with pytest.raises(ValueError):
+        parse_mix("list=1,delete=1")
+
+    with pytest.raises(ValueError):
+        parse_mix("list=0")
+
+
+def test_percentiles_use_nearest_rank():
+    latencies: list[float] = [index / 1000 for index in range(100, 0, -1)]
+    report = summarize("GET /", latencies, errors=2, duration_seconds=4.0)
+
+    assert (report.requests, report.errors, report.throughput) == (100, 2, 25.0)
+    assert (report.p50_ms, report.p95_ms, report.p99_ms, report.max_ms) == pytest.approx(
+        (50.0, 95.0, 99.0, 100.0)
+    )
+    assert summarize("GET /", [], errors=0, duration_seconds=1.0).p99_ms == 0.0
+
+
+def test_bench_keeps_config_given_before_command():
+    parser: argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument("--config", type=Path, default=Path("config.toml"))
+    add_bench_arguments(parser.add_subparsers(dest="command").add_parser("bench"))
+
+    assert parser.parse_args(["--config", "bench.toml", "bench"]).config == Path("bench.toml")
+    assert parser.parse_args(["bench", "--config", "bench.toml"]).config == Path("bench.toml")
+    assert parser.parse_args(["bench"]).config == Path("config.toml")
+
+
+def test_in_process_run_counts_app_errors_and_keeps_parameters(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch
+):
+    async def fail(*args: object, **kwargs: object) -> None:
+        raise RuntimeError("Listing failed")
+
+    monkeypatch.setattr(QuestionsRepositoryMemory, "get_questions_page", fail)
+    config_path: Path = tmp_path / "bench.toml"
+    config_path.write_text(
+        (Path(__file__).parent / "test_config.toml").read_text()
+        + '\nstorage = "memory"\n'
+    )
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser()
+    add_bench_arguments(parser)
+    report_path: Path = tmp_path / "report.json"
+    run_bench(
+        parser.parse_args([
+            "--config", str(config_path),
+            "--concurrency", "2",
+            "--duration", "0.2",
+            "--warmup", "0",
+            "--mix", "list=1,detail=1",
+            "--questions", "5",
+            "--answers-distribution", "fixed",
+            "--seed", "7",
+            "--json", str(report_path),
+        ])
+    )
+    report: BenchReport = BenchReport.model_validate_json(report_path.read_text())
+
+    endpoints: dict[str, int] = {endpoint.endpoint: endpoint.errors for endpoint in report.endpoints}
+    assert endpoints[Operation.LIST_QUESTIONS] > 0
+    assert endpoints[Operation.FETCH_QUESTION] == 0
+    assert (report.seed, report.warmup_seconds, report.questions, report.answers) == (7, 0.0, 5, 25)
+    assert (report.answers_per_question, report.answers_distribution) == (5.0, "fixed")
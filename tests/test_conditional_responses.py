@@ -0,0 +1,67 @@
+from datetime import UTC, datetime
+
+from starlette.requests import Request
+
+from qna_server.api.endpoints.conditional_responses import is_not_modified, make_etag
+from qna_server.dto import ResourceVersion
+
+MODIFIED_AT: datetime = datetime(2024, 5, 1, 12, 30, 15, 500000, tzinfo=UTC)
+
+
+def make_request(**headers: str) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [
+            (name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()
+        ]
+    })
+
+
+def test_etag_depends_on_version_and_variant():
+    version: ResourceVersion = ResourceVersion(tag="1:2024")
+    etag: str = make_etag(version, 10)
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == make_etag(ResourceVersion(tag="1:2024", modified_at=MODIFIED_AT), 10)
+    assert etag != make_etag(version, 20)
+    assert etag != make_etag(ResourceVersion(tag="1:2025"), 10)
+
+
+def test_if_none_match_uses_weak_comparison():
+    etag: str = make_etag(ResourceVersion(tag="1"))
+
+    assert is_not_modified(make_request(if_none_match=etag), etag, None)
+    assert is_not_modified(make_request(if_none_match=f'"other", W/{etag}'), etag, None)
+    assert is_not_modified(make_request(if_none_match=" * "), etag, None)
+    assert not is_not_modified(make_request(if_none_match='"other"'), etag, None)
+
+
+def test_if_modified_since_is_ignored_with_if_none_match():
+    etag: str = make_etag(ResourceVersion(tag="1"))
+    request: Request = make_request(
+        if_none_match='"other"', if_modified_since="Wed, 01 May 2024 12:30:15 GMT"
+    )
+
+    assert not is_not_modified(request, etag, MODIFIED_AT)
+
+
+def test_if_modified_since_is_compared_to_the_second():
+    etag: str = make_etag(ResourceVersion(tag="1"))
+
+    def not_modified(since: str, modified_at: datetime | None = MODIFIED_AT) -> bool:
+        return is_not_modified(make_request(if_modified_since=since), etag, modified_at)
+
+    # Header has no fractions of a second, so the same second means not modified
+    assert not_modified("Wed, 01 May 2024 12:30:15 GMT")
+    assert not_modified("Wed, 01 May 2024 12:31:00 GMT")
+    assert not not_modified("Wed, 01 May 2024 12:30:14 GMT")
+    assert not not_modified("Wed, 01 May 2024 12:30:15 GMT", modified_at=None)
+
+
+def test_invalid_if_modified_since_is_ignored():
+    etag: str = make_etag(ResourceVersion(tag="1"))
+
+    for since in ("yesterday", "", "Wed, 01 May 2024 12:30:15 -0000"):
+        assert not is_not_modified(make_request(if_modified_since=since), etag, MODIFIED_AT)
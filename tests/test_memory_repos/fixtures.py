@@ -0,0 +1,48 @@
+import secrets
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+import pytest
+import pytest_asyncio  # noqa F401
+
+from qna_server.storage.memory_implementation import (
+    AnswerRepositoryMemory,
+    MemoryStorage,
+    QuestionsRepositoryMemory,
+)
+
+
+@pytest.fixture(scope="function")
+def clock() -> Callable[[], datetime]:
+    # Every record gets its own time, so orders do not depend on speed of tests
+    moments = (
+        datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=second)
+        for second in range(1_000_000)
+    )
+
+    return lambda: next(moments)
+
+
+@pytest.fixture(scope="function")
+def storage(clock: Callable[[], datetime]) -> MemoryStorage:
+    return MemoryStorage(clock)
+
+
+@pytest.fixture(scope="function")
+def question_repo(storage: MemoryStorage) -> QuestionsRepositoryMemory:
+    return QuestionsRepositoryMemory(storage)
+
+
+@pytest.fixture(scope="function")
+def answers_repo(storage: MemoryStorage) -> AnswerRepositoryMemory:
+    return AnswerRepositoryMemory(storage)
+
+
+@pytest.fixture(scope='function')
+def response_author() -> str:
+    return f"demo_email_{secrets.token_urlsafe(16)}@example.com"
+
+
+@pytest.fixture(scope='function')
+def test_question() -> str:
+    return f"Answer is: {secrets.token_urlsafe(16)}"
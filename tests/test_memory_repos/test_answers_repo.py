@@ -0,0 +1,111 @@
+import asyncio
+
+from .fixtures import *
+
+from qna_server.dto import Answer, AnswersBulkResult, CreateAnswer, CreateQuestion, Question, QuestionWithAnswers
+from qna_server.exceptions import DataIntegrityError, NotFoundError
+
+
+async def test_creating_and_fetching_answer(
+    test_question: str,
+    response_author: str,
+    question_repo: QuestionsRepositoryMemory,
+    answers_repo: AnswerRepositoryMemory
+):
+    created_question: Question = await question_repo.create_new_question(
+        CreateQuestion(text=test_question)
+    )
+    created_answer: Answer = await answers_repo.create_answer(
+        created_question.id,
+        CreateAnswer(text=test_question, user_id=response_author)
+    )
+
+    assert await answers_repo.fetch_answer_by_id(created_answer.id) == created_answer
+    assert await answers_repo.fetch_answer_by_id(1 << 31 - 1) is None
+
+    fetched_question_data: QuestionWithAnswers = await question_repo.fetch_specific_question(
+        created_question.id
+    )
+    assert fetched_question_data.answers == [created_answer]
+    assert fetched_question_data.last_answer_at == created_answer.created_at
+
+    with pytest.raises(DataIntegrityError):
+        await answers_repo.create_answer(
+            1 << 31 - 1,
+            CreateAnswer(text=test_question, user_id=response_author)
+        )
+
+
+async def test_creating_answers_in_bulk_reports_failures(
+    test_question: str,
+    response_author: str,
+    question_repo: QuestionsRepositoryMemory,
+    answers_repo: AnswerRepositoryMemory
+):
+    created_question: Question = await question_repo.create_new_question(
+        CreateQuestion(text=test_question)
+    )
+    answer_content: CreateAnswer = CreateAnswer(text=test_question, user_id=response_author)
+
+    result: AnswersBulkResult = await answers_repo.create_answers_bulk(
+        [(created_question.id, answer_content), (1 << 31 - 1, answer_content), (created_question.id, answer_content)]
+    )
+
+    assert len(result.created) == 2
+    assert [failure.index for failure in result.failed] == [1]
+    assert (await question_repo.fetch_specific_question(created_question.id)).answer_count == 2
+
+
+async def test_deleting_answer_restores_question_stats(
+    test_question: str,
+    response_author: str,
+    question_repo: QuestionsRepositoryMemory,
+    answers_repo: AnswerRepositoryMemory
+):
+    created_question: Question = await question_repo.create_new_question(
+        CreateQuestion(text=test_question)
+    )
+    first_answer, last_answer = (
+        await answers_repo.create_answers_bulk(
+            [(created_question.id, CreateAnswer(text=test_question, user_id=response_author))] * 2
+        )
+    ).created
+
+    assert await answers_repo.delete_answer(last_answer.id)
+    fetched_question_data: QuestionWithAnswers = await question_repo.fetch_specific_question(
+        created_question.id
+    )
+    assert fetched_question_data.answer_count == 1
+    assert fetched_question_data.last_answer_at == first_answer.created_at
+
+    await answers_repo.delete_answer(first_answer.id)
+    assert (await question_repo.fetch_specific_question(created_question.id)).last_answer_at is None
+
+    with pytest.raises(NotFoundError):
+        await answers_repo.delete_answer(first_answer.id)
+
+
+async def test_concurrent_answers_keep_stats_consistent(
+    test_question: str,
+    response_author: str,
+    question_repo: QuestionsRepositoryMemory,
+    answers_repo: AnswerRepositoryMemory
+):
+    created_question: Question = await question_repo.create_new_question(
+        CreateQuestion(text=test_question)
+    )
+    answer_content: CreateAnswer = CreateAnswer(text=test_question, user_id=response_author)
+
+    created_answers: list[Answer] = await asyncio.gather(
+        *(answers_repo.create_answer(created_question.id, answer_content) for _ in range(50))
+    )
+    await asyncio.gather(
+        *(answers_repo.delete_answer(answer.id) for answer in created_answers[::2])
+    )
+
+    fetched_question_data: QuestionWithAnswers = await question_repo.fetch_specific_question(
+        created_question.id
+    )
+    assert fetched_question_data.answers == created_answers[1::2]
+    assert fetched_question_data.answer_count == 25
+    assert fetched_question_data.last_answer_at == created_answers[-1].created_at
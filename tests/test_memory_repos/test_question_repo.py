@@ -0,0 +1,170 @@
+from .fixtures import *
+
+from qna_server.dto import (
+    Answer,
+    CreateAnswer,
+    CreateQuestion,
+    PageCursor,
+    Question,
+    QuestionsOrder,
+    QuestionsPage,
+    QuestionsPageCursor,
+    QuestionWithAnswers,
+    ResourceVersion,
+)
+from qna_server.exceptions import NotFoundError
+
+
+async def test_creating_and_fetching_questions(test_question: str, question_repo: QuestionsRepositoryMemory):
+    created_question: Question = await question_repo.create_new_question(
+        CreateQuestion(text=test_question)
+    )
+    created_in_bulk: list[Question] = await question_repo.create_questions_bulk(
+        [CreateQuestion(text=f"{test_question} {i}") for i in range(3)]
+    )
+    fetched_question_data: QuestionWithAnswers = await question_repo.fetch_specific_question(
+        created_question.id
+    )
+
+    assert created_question == Question(**fetched_question_data.model_dump())
+    assert await question_repo.get_all_questions() == [created_question, *created_in_bulk]
+    assert await question_repo.fetch_specific_question(1 << 31 - 1) is None
+
+
+async def test_pages_of_questions_follow_each_other(
+    test_question: str,
+    response_author: str,
+    question_repo: QuestionsRepositoryMemory,
+    answers_repo: AnswerRepositoryMemory
+):
+    created_questions: list[Question] = await question_repo.create_questions_bulk(
+        [CreateQuestion(text=test_question)] * 12
+    )
+    # Some questions are left without answers, to be listed last by time of the latest answer
+    for index, question in enumerate(created_questions[:8]):
+        await answers_repo.create_answers_bulk(
+            [(question.id, CreateAnswer(text=test_question, user_id=response_author))] * (index % 3)
+        )
+
+    for order in QuestionsOrder:
+        whole_page: QuestionsPage = await question_repo.get_questions_page(20, order=order)
+        questions: list[Question] = []
+        cursor: QuestionsPageCursor | None = None
+        for _ in range(3):
+            page: QuestionsPage = await question_repo.get_questions_page(5, cursor, order)
+            questions.extend(page.questions)
+            cursor = QuestionsPageCursor.decode(page.next_cursor) if page.next_cursor else None
+
+        assert questions == whole_page.questions
+        assert len(questions) == len(created_questions)
+
+    by_answer_count: list[Question] = (
+        await question_repo.get_questions_page(20, order=QuestionsOrder.ANSWER_COUNT)
+    ).questions
+    assert by_answer_count == sorted(
+        by_answer_count, key=lambda question: (question.answer_count, question.id), reverse=True
+    )
+
+    by_last_answer: list[Question] = (
+        await question_repo.get_questions_page(20, order=QuestionsOrder.LAST_ANSWER_AT)
+    ).questions
+    answered: list[Question] = [question for question in by_last_answer if question.last_answer_at]
+    assert by_last_answer[:len(answered)] == answered
+    assert answered == sorted(answered, key=lambda question: question.last_answer_at, reverse=True)
+
+
+async def test_streaming_questions_while_they_change(
+    test_question: str,
+    question_repo: QuestionsRepositoryMemory
+):
+    created_questions: list[Question] = await question_repo.create_questions_bulk(
+        [CreateQuestion(text=test_question)] * 5
+    )
+
+    streamed_questions: list[Question] = []
+    async for question in question_repo.stream_all_questions(batch_size=2):
+        streamed_questions.append(question)
+        if question.id == created_questions[0].id:
+            await question_repo.delete_question(created_questions[2].id)
+            await question_repo.delete_question(created_questions[3].id)
+
+    assert streamed_questions == [created_questions[0], created_questions[1], created_questions[4]]
+
+
+async def test_question_version_changes_with_answers(
+    test_question: str,
+    response_author: str,
+    question_repo: QuestionsRepositoryMemory,
+    answers_repo: AnswerRepositoryMemory
+):
+    created_question: Question = await question_repo.create_new_question(
+        CreateQuestion(text=test_question)
+    )
+    initial_version: ResourceVersion = await question_repo.get_question_version(created_question.id)
+    initial_page_version: ResourceVersion = await question_repo.get_questions_page_version(10)
+
+    created_answer: Answer = await answers_repo.create_answer(
+        created_question.id,
+        CreateAnswer(text=test_question, user_id=response_author)
+    )
+    answered_version: ResourceVersion = await question_repo.get_question_version(created_question.id)
+    assert answered_version.modified_at > initial_version.modified_at
+    assert await question_repo.get_questions_page_version(10) != initial_page_version
+
+    await answers_repo.delete_answer(created_answer.id)
+    assert (await question_repo.get_question_version(created_question.id)).tag not in {
+        initial_version.tag, answered_version.tag
+    }
+    assert await question_repo.get_question_version(1 << 31 - 1) is None
+
+
+async def test_fetching_pages_of_answers(
+    test_question: str,
+    response_author: str,
+    question_repo: QuestionsRepositoryMemory,
+    answers_repo: AnswerRepositoryMemory
+):
+    created_question: Question = await question_repo.create_new_question(
+        CreateQuestion(text=test_question)
+    )
+    created_answers: list[Answer] = (
+        await answers_repo.create_answers_bulk(
+            [(created_question.id, CreateAnswer(text=test_question, user_id=response_author))] * 3
+        )
+    ).created
+
+    first_page: QuestionWithAnswers = await question_repo.fetch_specific_question(
+        created_question.id, answers_limit=2
+    )
+    assert first_page.answers == created_answers[:2]
+    assert first_page.answers_total == 3
+
+    next_page: QuestionWithAnswers = await question_repo.fetch_specific_question(
+        created_question.id, 2, PageCursor.decode(first_page.answers_next_cursor)
+    )
+    assert next_page.answers == created_answers[2:]
+    assert next_page.answers_next_cursor is None
+
+
+async def test_deleting_question_with_answers(
+    test_question: str,
+    response_author: str,
+    storage: MemoryStorage,
+    question_repo: QuestionsRepositoryMemory,
+    answers_repo: AnswerRepositoryMemory
+):
+    created_question: Question = await question_repo.create_new_question(
+        CreateQuestion(text=test_question)
+    )
+    created_answer: Answer = await answers_repo.create_answer(
+        created_question.id,
+        CreateAnswer(text=test_question, user_id=response_author)
+    )
+
+    assert await question_repo.delete_question(created_question.id)
+    assert await question_repo.fetch_specific_question(created_question.id) is None
+    assert await answers_repo.fetch_answer_by_id(created_answer.id) is None
+    assert all(len(index) == 0 for index in storage.questions_indexes.values())
+
+    with pytest.raises(NotFoundError):
+        await question_repo.delete_question(created_question.id)
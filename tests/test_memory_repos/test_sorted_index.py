@@ -0,0 +1,45 @@
+from qna_server.storage.memory_implementation import SortedIndex
+
+
+def test_listing_keys_after_position():
+    index: SortedIndex[tuple[int, int]] = SortedIndex()
+    for key in [(3, 1), (1, 2), (2, 3), (5, 4)]:
+        index.add(key)
+
+    assert list(index.iter_after()) == [(1, 2), (2, 3), (3, 1), (5, 4)]
+    assert list(index.iter_after((2, 3))) == [(3, 1), (5, 4)]
+    assert list(index.iter_after((2, 0))) == [(2, 3), (3, 1), (5, 4)]
+    assert index.last() == (5, 4)
+
+
+def test_removed_keys_are_skipped_and_can_be_added_again():
+    index: SortedIndex[tuple[int]] = SortedIndex()
+    for value in range(10):
+        index.add((value,))
+
+    for value in range(0, 10, 3):
+        index.discard((value,))
+
+    assert list(index.iter_after()) == [(1,), (2,), (4,), (5,), (7,), (8,)]
+    assert index.last() == (8,)
+    assert len(index) == 6
+
+    index.add((9,))
+    index.add((3,))
+    assert list(index.iter_after((2,))) == [(3,), (4,), (5,), (7,), (8,), (9,)]
+
+
+def test_removing_most_keys_compacts_index():
+    index: SortedIndex[tuple[int]] = SortedIndex()
+    for value in range(10):
+        index.add((value,))
+
+    for value in range(8):
+        index.discard((value,))
+
+    assert list(index.iter_after()) == [(8,), (9,)]
+    assert len(index) == 2
+
+    index.discard((9,))
+    index.discard((8,))
+    assert index.last() is None
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from qna_server.api.server import setup_app
+from qna_server.metrics import AppMetrics, MetricsMiddleware
+from qna_server.utils.config_schema import AppConfig, load_config
+
+
+def test_requests_are_measured_by_route_template():
+    metrics: AppMetrics = AppMetrics()
+    app: FastAPI = FastAPI()
+    app.add_middleware(MetricsMiddleware, metrics=metrics)
+
+    @app.get("/questions/{question_id}")
+    async def get_question(question_id: int) -> dict[str, int]:
+        return {"id": question_id}
+
+    with TestClient(app) as client:
+        client.get("/questions/1")
+        client.get("/questions/2")
+        client.get("/questions/not-a-number")
+        client.get("/unknown/path")
+
+    def requests_count(route: str, status: str) -> float | None:
+        return metrics.registry.get_sample_value(
+            "qna_http_request_duration_seconds_count",
+            {"method": "GET", "route": route, "status": status}
+        )
+
+    assert requests_count("/questions/{question_id}", "200") == 2
+    assert requests_count("/questions/{question_id}", "422") == 1
+    assert requests_count("<unmatched>", "404") == 1
+    assert metrics.registry.get_sample_value(
+        "qna_http_requests_in_flight", {"method": "GET"}
+    ) == 0
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_internal_endpoints_are_mounted_with_metrics(enabled: bool):
+    config: AppConfig = load_config(Path(__file__).parent / "test_config.toml")
+    config.db_settings.storage = "memory"
+    config.metrics.enabled = enabled
+    expected_status: int = 200 if enabled else 404
+
+    with TestClient(setup_app(config)) as client:
+        assert client.get("/metrics").status_code == expected_status
+        assert client.get("/api/internal/cache").status_code == expected_status
+        # Data is kept in memory, so there is no pool to report
+        assert client.get("/api/internal/pool").status_code == 404
@@ -0,0 +1,73 @@
+import asyncio
+import logging
+import threading
+
+import httpx
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from qna_server.api.request_context import ContextIdMiddleware
+from qna_server.utils.background_logging import BackgroundLogging
+
+
+class FormattingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.setFormatter(logging.Formatter("%(context_id)s %(message)s"))
+        self.lines: list[str] = []
+        self.threads: set[int] = set()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.lines.append(self.format(record))
+        self.threads.add(threading.get_ident())
+
+
+async def test_concurrent_requests_log_their_own_context_id():
+    logger: logging.Logger = logging.getLogger("qna_test_context")
+    logger.propagate = False
+    handler: FormattingHandler = FormattingHandler()
+    logger.addHandler(handler)
+
+    started: list[str] = []
+    both_started: asyncio.Event = asyncio.Event()
+
+    async def endpoint(request: Request) -> PlainTextResponse:
+        name: str = request.path_params["name"]
+        logger.info("%s started", name)
+        started.append(name)
+        if len(started) == 2:
+            both_started.set()
+
+        # Each request logs again only after the other one has logged, so their records interleave
+        await both_started.wait()
+        logger.info("%s finished", name)
+        return PlainTextResponse(name)
+
+    app: Starlette = Starlette(routes=[Route("/{name}", endpoint)])
+    background_logging: BackgroundLogging = BackgroundLogging()
+    background_logging.start()
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=ContextIdMiddleware(app)), base_url="http://test"
+        ) as client:
+            await asyncio.gather(client.get("/first"), client.get("/second"))
+
+        logger.info("outside finished")
+
+    finally:
+        background_logging.stop()
+        logger.removeHandler(handler)
+
+    context_ids: dict[str, set[str]] = {}
+    for line in handler.lines:
+        context_id, name, _ = line.split()
+        context_ids.setdefault(name, set()).add(context_id)
+
+    assert len(context_ids["first"]) == len(context_ids["second"]) == 1
+    assert context_ids["first"] != context_ids["second"]
+    assert "-" not in context_ids["first"] | context_ids["second"]
+    assert context_ids["outside"] == {"-"}
+    # Records were formatted by listener thread, yet kept ids of tasks that logged them
+    assert threading.get_ident() not in handler.threads
@@ -0,0 +1,57 @@
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+from pydantic import BaseModel
+
+from qna_server.dto import Answer, Question, QuestionWithAnswers
+from qna_server.storage.row_mapping import (
+    answer_from_row,
+    question_from_row,
+    question_with_answers_from_row,
+)
+
+CREATED_AT: datetime = datetime(2024, 5, 1, 12, 30, tzinfo=UTC)
+
+
+def assert_same_as_validated(constructed: BaseModel, validated: BaseModel) -> None:
+    assert type(constructed) is type(validated)
+    assert constructed == validated
+    assert constructed.__dict__ == validated.__dict__
+    assert constructed.model_fields_set == validated.model_fields_set
+    assert constructed.__pydantic_extra__ == validated.__pydantic_extra__
+    assert constructed.__pydantic_private__ == validated.__pydantic_private__
+    assert constructed.model_dump_json() == validated.model_dump_json()
+
+
+def test_models_keep_state_in_attributes_set_by_row_mapping():
+    # Row mapping sets these attributes itself, so it has to be revised if pydantic changes them
+    assert BaseModel.__slots__ == (
+        "__dict__", "__pydantic_fields_set__", "__pydantic_extra__", "__pydantic_private__"
+    )
+
+
+def test_rows_are_mapped_the_same_as_validated_models():
+    question_row: SimpleNamespace = SimpleNamespace(
+        id=1, text="Question?", created_at=CREATED_AT, answer_count=1, last_answer_at=CREATED_AT
+    )
+    answer_row: SimpleNamespace = SimpleNamespace(
+        id=2, question_id=1, user_id="user", text="Answer", created_at=CREATED_AT
+    )
+
+    answer: Answer = answer_from_row(answer_row)
+    assert_same_as_validated(answer, Answer.model_validate(vars(answer_row)))
+    assert_same_as_validated(
+        question_from_row(question_row),
+        Question.model_validate(vars(question_row))
+    )
+    assert_same_as_validated(
+        question_with_answers_from_row(question_row, [answer], "cursor"),
+        QuestionWithAnswers.model_validate(
+            {
+                **vars(question_row),
+                "answers": [answer],
+                "answers_total": 1,
+                "answers_next_cursor": "cursor"
+            }
+        )
+    )
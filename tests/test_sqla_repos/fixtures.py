@@ -1,30 +1,62 @@
 import secrets
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, AsyncGenerator
 
 import pytest
 import pytest_asyncio  # noqa F401
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import make_url
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
+from qna_server.custom_types import ReadMode
 from qna_server.storage.sqla_implementation import (
     AnswerRepositorySQLA,
     QuestionsRepositorySQLA,
     TransactionManagerSQLA,
 )
 from qna_server.utils.config_schema import AppConfig, load_config
+from qna_server.utils.engine_factory import create_engine_from_settings
 
+PROJECT_ROOT: Path = Path(__file__).parent.parent.parent
 
-@pytest.fixture(scope="module")
-def config() -> AppConfig:
-    return load_config(Path(__file__).parent.parent / "test_config.toml")
+
+@pytest.fixture(scope="session")
+def sqlite_connection_string(tmp_path_factory: pytest.TempPathFactory) -> str:
+    connection_string: str = f"sqlite+aiosqlite:///{tmp_path_factory.mktemp('sqlite') / 'qna.db'}"
+
+    # Made without ini file, so that its logging configuration does not replace the one of tests
+    alembic_config: Config = Config()
+    alembic_config.set_main_option("script_location", str(PROJECT_ROOT / "migrations"))
+    alembic_config.set_main_option("sqlalchemy.url", connection_string)
+    # Migrations run their own event loop, so they are kept away from the loop of tests
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(command.upgrade, alembic_config, "head").result()
+
+    return connection_string
+
+
+@pytest.fixture(scope="module", params=["postgresql", "sqlite"])
+def config(request: pytest.FixtureRequest) -> AppConfig:
+    config: AppConfig = load_config(Path(__file__).parent.parent / "test_config.toml")
+    if request.param == "sqlite":
+        config.db_settings.connection_string = request.getfixturevalue("sqlite_connection_string")
+
+    return config
+
+
+@pytest.fixture(autouse=True)
+def skip_tests_of_other_backends(request: pytest.FixtureRequest, config: AppConfig) -> None:
+    backend: str = make_url(config.db_settings.connection_string).get_backend_name()
+    if request.node.get_closest_marker("postgresql_only") and backend != "postgresql":
+        pytest.skip("Test checks PostgreSQL specific behaviour")
 
 
 @pytest.fixture()
 async def engine(config: AppConfig) -> AsyncEngine:
-    engine: AsyncEngine = create_async_engine(
-        config.db_settings.connection_string,
-        echo=False
-    )
+    # Made the same way server does, so SQLite gets its pragmas
+    engine: AsyncEngine = create_engine_from_settings(config.db_settings)
 
     return engine
 
@@ -62,6 +94,16 @@ def answers_repo(transaction: TransactionManagerSQLA) -> AnswerRepositorySQLA:
     return AnswerRepositorySQLA(transaction)
 
 
+@pytest.fixture(scope="function")
+def core_question_repo(transaction: TransactionManagerSQLA) -> QuestionsRepositorySQLA:
+    return QuestionsRepositorySQLA(transaction, read_mode=ReadMode.CORE)
+
+
+@pytest.fixture(scope="function")
+def core_answers_repo(transaction: TransactionManagerSQLA) -> AnswerRepositorySQLA:
+    return AnswerRepositorySQLA(transaction, read_mode=ReadMode.CORE)
+
+
 @pytest.fixture(scope='function')
 def response_author() -> str:
     return f"demo_email_{secrets.token_urlsafe(16)}@example.com"
@@ -1,8 +1,21 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import update
+
 from qna_server.exceptions import DataIntegrityError, NotFoundError
 from .fixtures import *
 
-from qna_server.dto import Answer, CreateAnswer, CreateQuestion, Question, QuestionWithAnswers
+from qna_server.dto import (
+    Answer,
+    AnswersBulkResult,
+    CreateAnswer,
+    CreateQuestion,
+    PageCursor,
+    Question,
+    QuestionWithAnswers,
+)
 from qna_server.storage.sqla_implementation import QuestionsRepositorySQLA
+from qna_server.storage.sqla_implementation.tables import QuestionTable
 
 @pytest.fixture(scope="function")
 async def question(
@@ -64,6 +77,131 @@ async def test_creating_answer_to_non_existing_question(
         )
 
 
+async def test_creating_answers_in_bulk(
+    question: Question,
+    test_answer: str,
+    response_author: str,
+    answers_repo: AnswerRepositorySQLA
+):
+    answer_content: CreateAnswer = CreateAnswer(
+        text=test_answer,
+        user_id=response_author
+    )
+    result: AnswersBulkResult = await answers_repo.create_answers_bulk(
+        [
+            (question.id, answer_content),
+            (1<<31 - 1, answer_content),
+            (question.id, answer_content),
+        ]
+    )
+
+    assert len(result.created) == 2
+    assert all(created_answer.question_id == question.id for created_answer in result.created)
+    assert result.created[0].id < result.created[1].id
+    assert [(failure.index, failure.question_id) for failure in result.failed] == [(1, 1<<31 - 1)]
+
+    for created_answer in result.created:
+        assert created_answer == await answers_repo.fetch_answer_by_id(created_answer.id)
+
+
+async def test_fetching_question_answers_by_pages(
+    question: Question,
+    response_author: str,
+    answers_repo: AnswerRepositorySQLA,
+    question_repo: QuestionsRepositorySQLA
+):
+    created_answers: list[Answer] = (
+        await answers_repo.create_answers_bulk(
+            [
+                (question.id, CreateAnswer(text=f"Answer {i}", user_id=response_author))
+                for i in range(5)
+            ]
+        )
+    ).created
+
+    first_page: QuestionWithAnswers = await question_repo.fetch_specific_question(
+        question.id,
+        answers_limit=3
+    )
+    assert first_page.answers == created_answers[:3]
+    assert first_page.answers_total == 5
+    assert first_page.answers_next_cursor is not None
+
+    second_page: QuestionWithAnswers = await question_repo.fetch_specific_question(
+        question.id,
+        answers_limit=3,
+        answers_cursor=PageCursor.decode(first_page.answers_next_cursor)
+    )
+    assert second_page.answers == created_answers[3:]
+    assert second_page.answers_total == 5
+    assert second_page.answers_next_cursor is None
+
+    assert (await question_repo.fetch_specific_question(question.id)).answers == created_answers
+
+
+async def test_answer_statistics_of_question(
+    question: Question,
+    test_answer: str,
+    response_author: str,
+    question_repo: QuestionsRepositorySQLA,
+    answers_repo: AnswerRepositorySQLA
+):
+    first_answer: Answer = await answers_repo.create_answer(
+        question.id,
+        CreateAnswer(text=test_answer, user_id=response_author)
+    )
+    bulk_result: AnswersBulkResult = await answers_repo.create_answers_bulk(
+        [(question.id, CreateAnswer(text=test_answer, user_id=response_author))] * 2
+    )
+
+    fetched_question: QuestionWithAnswers = await question_repo.fetch_specific_question(question.id)
+    assert fetched_question.answer_count == fetched_question.answers_total == 3
+    assert fetched_question.last_answer_at == bulk_result.created[-1].created_at
+
+    for answer in bulk_result.created:
+        await answers_repo.delete_answer(answer.id)
+
+    fetched_question = await question_repo.fetch_specific_question(question.id)
+    assert fetched_question.answer_count == 1
+    assert fetched_question.last_answer_at == first_answer.created_at
+
+    await answers_repo.delete_answer(first_answer.id)
+    fetched_question = await question_repo.fetch_specific_question(question.id)
+    assert (fetched_question.answer_count, fetched_question.last_answer_at) == (0, None)
+
+
+async def test_question_update_time_never_goes_back(
+    question: Question,
+    test_answer: str,
+    response_author: str,
+    session: AsyncSession,
+    question_repo: QuestionsRepositorySQLA,
+    answers_repo: AnswerRepositorySQLA
+):
+    # Stands for time written by a transaction that started later but committed first
+    later_updated_at: datetime = datetime.now(timezone.utc) + timedelta(hours=1)
+    await session.execute(
+        update(QuestionTable)
+        .where(QuestionTable.id == question.id)
+        .values(updated_at=later_updated_at)
+    )
+    await session.commit()
+
+    versions: list[datetime] = [later_updated_at]
+    created_answer: Answer = await answers_repo.create_answer(
+        question.id, CreateAnswer(text=test_answer, user_id=response_author)
+    )
+    versions.append((await question_repo.get_question_version(question.id)).modified_at)
+    await answers_repo.create_answers_bulk(
+        [(question.id, CreateAnswer(text=test_answer, user_id=response_author))]
+    )
+    versions.append((await question_repo.get_question_version(question.id)).modified_at)
+    await answers_repo.delete_answer(created_answer.id)
+    versions.append((await question_repo.get_question_version(question.id)).modified_at)
+
+    assert versions == sorted(set(versions))
+
+
 async def test_fetching_answer_by_id(
     answer_data: Answer,
     answers_repo: AnswerRepositorySQLA
@@ -71,6 +209,20 @@ async def test_fetching_answer_by_id(
     assert answer_data == await answers_repo.fetch_answer_by_id(answer_data.id)
 
 
+async def test_fetching_answer_in_core_read_mode(
+    answer_data: Answer,
+    core_answers_repo: AnswerRepositorySQLA,
+    core_question_repo: QuestionsRepositorySQLA
+):
+    assert answer_data == await core_answers_repo.fetch_answer_by_id(answer_data.id)
+    assert await core_answers_repo.fetch_answer_by_id(1<<31 - 1) is None
+
+    question_data: QuestionWithAnswers = await core_question_repo.fetch_specific_question(
+        answer_data.question_id
+    )
+    assert question_data.answers == [answer_data]
+
+
 async def test_deleting_answer(
     answer_data: Answer,
     answers_repo: AnswerRepositorySQLA
@@ -0,0 +1,181 @@
+import asyncio
+
+from .fixtures import *
+
+from qna_server.dto import Answer, CacheStats, CreateAnswer, CreateQuestion, Question, QuestionWithAnswers
+from qna_server.storage.cache import (
+    CachedAnswersRepository,
+    CachedQuestionsRepository,
+    QuestionChangesListener,
+    QuestionsCache,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(scope="function")
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture(scope="function")
+def questions_cache(clock: FakeClock) -> QuestionsCache:
+    return QuestionsCache(max_size=100, ttl=10, negative_ttl=1, clock=clock)
+
+
+@pytest.fixture(scope="function")
+def cached_question_repo(
+    question_repo: QuestionsRepositorySQLA,
+    questions_cache: QuestionsCache
+) -> CachedQuestionsRepository:
+    return CachedQuestionsRepository(question_repo, questions_cache)
+
+
+@pytest.fixture(scope="function")
+def cached_answers_repo(
+    answers_repo: AnswerRepositorySQLA,
+    questions_cache: QuestionsCache
+) -> CachedAnswersRepository:
+    return CachedAnswersRepository(answers_repo, questions_cache)
+
+
+@pytest.fixture(scope="function")
+async def question(test_question: str, cached_question_repo: CachedQuestionsRepository) -> Question:
+    return await cached_question_repo.create_new_question(
+        CreateQuestion(text=test_question)
+    )
+
+
+async def test_question_served_from_cache(
+    question: Question,
+    cached_question_repo: CachedQuestionsRepository,
+    questions_cache: QuestionsCache
+):
+    first_fetch: QuestionWithAnswers = await cached_question_repo.fetch_specific_question(question.id)
+
+    assert first_fetch is await cached_question_repo.fetch_specific_question(question.id)
+    stats: CacheStats = questions_cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+
+async def test_missing_question_cached_with_negative_ttl(
+    cached_question_repo: CachedQuestionsRepository,
+    questions_cache: QuestionsCache,
+    clock: FakeClock
+):
+    assert await cached_question_repo.fetch_specific_question(1 << 31 - 1) is None
+    assert await cached_question_repo.fetch_specific_question(1 << 31 - 1) is None
+    assert questions_cache.stats().hits == 1
+
+    clock.now += 2
+    assert await cached_question_repo.fetch_specific_question(1 << 31 - 1) is None
+    assert questions_cache.stats().expirations == 1
+
+
+async def test_answer_changes_invalidate_question(
+    question: Question,
+    test_answer: str,
+    response_author: str,
+    cached_question_repo: CachedQuestionsRepository,
+    cached_answers_repo: CachedAnswersRepository
+):
+    assert (await cached_question_repo.fetch_specific_question(question.id)).answers == []
+
+    created_answer: Answer = await cached_answers_repo.create_answer(
+        question.id,
+        CreateAnswer(text=test_answer, user_id=response_author)
+    )
+    assert (await cached_question_repo.fetch_specific_question(question.id)).answers == [created_answer]
+
+    assert await cached_answers_repo.delete_answer(created_answer.id)
+    assert (await cached_question_repo.fetch_specific_question(question.id)).answers == []
+
+
+async def test_question_deletion_invalidates_question(
+    question: Question,
+    cached_question_repo: CachedQuestionsRepository
+):
+    assert await cached_question_repo.fetch_specific_question(question.id) is not None
+    assert await cached_question_repo.delete_question(question.id)
+    assert await cached_question_repo.fetch_specific_question(question.id) is None
+
+
+async def test_least_recently_used_entry_evicted(clock: FakeClock):
+    questions_cache: QuestionsCache = QuestionsCache(max_size=2, ttl=10, negative_ttl=1, clock=clock)
+
+    async def load() -> str:
+        return "value"
+
+    await questions_cache.get_or_load((1, None, None), load)
+    await questions_cache.get_or_load((2, None, None), load)
+    await questions_cache.get_or_load((1, None, None), load)
+    await questions_cache.get_or_load((3, None, None), load)
+    await questions_cache.get_or_load((1, None, None), load)
+
+    stats: CacheStats = questions_cache.stats()
+    assert (stats.size, stats.evictions, stats.hits) == (2, 1, 2)
+
+
+async def test_invalidation_skips_only_loads_of_the_same_question(clock: FakeClock):
+    questions_cache: QuestionsCache = QuestionsCache(max_size=10, ttl=10, negative_ttl=1, clock=clock)
+    loading: asyncio.Event = asyncio.Event()
+
+    async def slow_load() -> str:
+        await loading.wait()
+        return "value"
+
+    loads: asyncio.Future[list[str]] = asyncio.gather(
+        questions_cache.get_or_load((1, None, None), slow_load),
+        questions_cache.get_or_load((2, None, None), slow_load)
+    )
+    await asyncio.sleep(0)
+
+    # Question 1 changed while both were loading, so only its value may be outdated
+    questions_cache.invalidate(1)
+    loading.set()
+    await loads
+
+    assert questions_cache.stats().size == 1
+    assert await questions_cache.get_or_load((2, None, None), slow_load) == "value"
+    assert questions_cache.stats().hits == 1
+
+
+@pytest.mark.postgresql_only
+async def test_notifications_invalidate_question_in_listening_process(
+    engine: AsyncEngine,
+    question: Question,
+    test_answer: str,
+    response_author: str,
+    transaction: TransactionManagerSQLA,
+    cached_question_repo: CachedQuestionsRepository,
+    questions_cache: QuestionsCache
+):
+    listener: QuestionChangesListener = QuestionChangesListener(engine.url, questions_cache)
+    listener.start()
+    try:
+        await asyncio.wait_for(listener.connected.wait(), timeout=5)
+        assert (await cached_question_repo.fetch_specific_question(question.id)).answers == []
+
+        # Answer is created as if by another process, bypassing cache of this one
+        notifying_answers_repo: AnswerRepositorySQLA = AnswerRepositorySQLA(
+            transaction, emit_change_notifications=True
+        )
+        await notifying_answers_repo.create_answer(
+            question.id,
+            CreateAnswer(text=test_answer, user_id=response_author)
+        )
+
+        async with asyncio.timeout(5):
+            while questions_cache.stats().invalidations == 0:
+                await asyncio.sleep(0.01)
+
+        assert len((await cached_question_repo.fetch_specific_question(question.id)).answers) == 1
+
+    finally:
+        await listener.stop()
@@ -0,0 +1,52 @@
+import asyncio
+from typing import AsyncIterator
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from .fixtures import *
+
+from qna_server.dto import CreateQuestion, Question
+from qna_server.utils.engine_factory import create_read_engine_from_settings
+
+
+@pytest.fixture()
+async def read_engine(config: AppConfig) -> AsyncGenerator[AsyncEngine | None, Any]:
+    read_engine: AsyncEngine | None = create_read_engine_from_settings(config.db_settings)
+    yield read_engine
+
+    if read_engine is not None:
+        await read_engine.dispose()
+
+
+async def test_only_sqlite_reads_use_separate_engine(config: AppConfig, read_engine: AsyncEngine | None):
+    assert (read_engine is not None) == (config.db_settings.backend_name == "sqlite")
+
+
+async def test_sqlite_reads_do_not_block_writes(
+    test_question: str,
+    session_maker: async_sessionmaker[AsyncSession],
+    read_engine: AsyncEngine | None
+):
+    if read_engine is None:
+        pytest.skip("Reads use engine of primary database")
+
+    question_repo: QuestionsRepositorySQLA = QuestionsRepositorySQLA(
+        TransactionManagerSQLA(
+            session_maker,
+            read_sessionmaker=async_sessionmaker(read_engine, expire_on_commit=False)
+        )
+    )
+    await question_repo.create_questions_bulk([CreateQuestion(text=test_question)] * 2)
+
+    # Writer has the only connection of primary engine, while export keeps its read transaction open
+    streamed_questions: AsyncIterator[Question] = question_repo.stream_all_questions(batch_size=1)
+    await anext(streamed_questions)
+    created_question: Question = await asyncio.wait_for(
+        question_repo.create_new_question(CreateQuestion(text=test_question)), timeout=5
+    )
+    assert created_question.id not in [question.id async for question in streamed_questions]
+
+    async with read_engine.connect() as connection:
+        with pytest.raises(OperationalError, match="readonly"):
+            await connection.execute(text("DELETE FROM answer"))
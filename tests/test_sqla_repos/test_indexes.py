@@ -0,0 +1,82 @@
+from sqlalchemy import Select, delete, select, text, tuple_
+from sqlalchemy.dialects import postgresql
+
+from .fixtures import *
+
+from qna_server.storage.sqla_implementation.tables import AnswerTable, QuestionTable
+
+pytestmark = pytest.mark.postgresql_only
+
+
+async def explain(session: AsyncSession, statement: Any) -> str:
+    # Test tables are too small for planner to prefer indexes on its own,
+    # so sequential scans are discouraged to check that index is usable at all
+    await session.execute(text("SET LOCAL enable_seqscan = off"))
+    compiled_statement: str = str(
+        statement.compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={"literal_binds": True}
+        )
+    )
+    plan: list[str] = list(
+        (await session.execute(text(f"EXPLAIN {compiled_statement}"))).scalars()
+    )
+    await session.rollback()
+
+    return "\n".join(plan)
+
+
+async def test_answers_of_question_use_index(session: AsyncSession):
+    query: Select[tuple[AnswerTable]] = (
+        select(AnswerTable).where(AnswerTable.question_id.in_([1, 2]))
+    )
+
+    assert "ix_answer_question_id_created_at_id" in await explain(session, query)
+
+
+async def test_answers_cascade_deletion_uses_index(session: AsyncSession):
+    plan: str = await explain(
+        session,
+        delete(AnswerTable).where(AnswerTable.question_id == 1)
+    )
+
+    assert "ix_answer_question_id_created_at_id" in plan
+
+
+async def test_questions_page_uses_index(session: AsyncSession):
+    query: Select[tuple[QuestionTable]] = (
+        select(QuestionTable)
+        .where(tuple_(QuestionTable.created_at, QuestionTable.id) > tuple_(text("now()"), text("1")))
+        .order_by(QuestionTable.created_at, QuestionTable.id)
+        .limit(50)
+    )
+    plan: str = await explain(session, query)
+
+    assert "ix_question_created_at_id" in plan
+    assert "Sort" not in plan
+
+
+async def test_questions_ordered_by_answer_count_use_index(session: AsyncSession):
+    query: Select[tuple[QuestionTable]] = (
+        select(QuestionTable)
+        .where(tuple_(QuestionTable.answer_count, QuestionTable.id) < tuple_(text("10"), text("1")))
+        .order_by(QuestionTable.answer_count.desc(), QuestionTable.id.desc())
+        .limit(50)
+    )
+    plan: str = await explain(session, query)
+
+    assert "ix_question_answer_count_id" in plan
+    assert "Sort" not in plan
+
+
+async def test_questions_ordered_by_last_answer_use_index(session: AsyncSession):
+    query: Select[tuple[QuestionTable]] = (
+        select(QuestionTable)
+        .where(tuple_(QuestionTable.last_answer_at, QuestionTable.id) < tuple_(text("now()"), text("1")))
+        .order_by(QuestionTable.last_answer_at.desc().nulls_last(), QuestionTable.id.desc())
+        .limit(50)
+    )
+    plan: str = await explain(session, query)
+
+    assert "ix_question_last_answer_at_id" in plan
+    assert "Sort" not in plan
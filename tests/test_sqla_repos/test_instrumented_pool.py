@@ -0,0 +1,42 @@
+from sqlalchemy import exc, text
+
+from .fixtures import *
+
+from qna_server.dto import PoolStats
+from qna_server.utils.config_schema import DbSettings
+from qna_server.utils.engine_factory import create_engine_from_settings
+
+
+@pytest.fixture()
+async def small_pool_engine(config: AppConfig) -> AsyncGenerator[AsyncEngine, Any]:
+    engine: AsyncEngine = create_engine_from_settings(
+        DbSettings(
+            connection_string=config.db_settings.connection_string,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout_seconds=0.1,
+            statement_cache_size=0
+        )
+    )
+    yield engine
+
+    await engine.dispose()
+
+
+async def test_pool_counts_checkouts_and_timeouts(small_pool_engine: AsyncEngine):
+    async with small_pool_engine.connect() as connection:
+        assert (await connection.execute(text("SELECT 1"))).scalar_one() == 1
+
+        with pytest.raises(exc.TimeoutError):
+            await small_pool_engine.connect().start()
+
+        stats: PoolStats = small_pool_engine.pool.stats()
+        assert (stats.size, stats.checked_out, stats.overflow) == (1, 1, 0)
+        assert (stats.checkouts, stats.checkout_timeouts) == (1, 1)
+        assert stats.checkout_wait_seconds_max >= 0.1
+
+    async with small_pool_engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+    stats = small_pool_engine.pool.stats()
+    assert (stats.checked_out, stats.checked_in, stats.checkouts) == (0, 1, 2)
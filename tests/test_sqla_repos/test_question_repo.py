@@ -1,7 +1,20 @@
-from qna_server.exceptions import NotFoundError
+from datetime import datetime, timezone
+
+from qna_server.exceptions import InvalidCursorError, NotFoundError
 from .fixtures import *
 
-from qna_server.dto import CreateQuestion, Question, QuestionWithAnswers
+from qna_server.dto import (
+    Answer,
+    CreateAnswer,
+    CreateQuestion,
+    PageCursor,
+    Question,
+    QuestionsOrder,
+    QuestionsPage,
+    QuestionsPageCursor,
+    QuestionWithAnswers,
+    ResourceVersion,
+)
 from qna_server.storage.sqla_implementation import QuestionsRepositorySQLA
 
 
@@ -13,6 +26,22 @@ async def test_creating_question(test_question: str, question_repo: QuestionsRep
     assert new_question.text == test_question
 
 
+async def test_creating_questions_in_bulk(test_question: str, question_repo: QuestionsRepositorySQLA):
+    questions_content: list[CreateQuestion] = [
+        CreateQuestion(text=f"{test_question} {i}") for i in range(5)
+    ]
+    created_questions: list[Question] = await question_repo.create_questions_bulk(questions_content)
+
+    assert [question.text for question in created_questions] == [
+        question.text for question in questions_content
+    ]
+    for created_question in created_questions:
+        fetched_question_data: QuestionWithAnswers = await question_repo.fetch_specific_question(
+            created_question.id
+        )
+        assert created_question == Question(**fetched_question_data.model_dump())
+
+
 async def test_fetching_specific_question(test_question: str, question_repo: QuestionsRepositorySQLA):
     created_question: Question = await question_repo.create_new_question(
         CreateQuestion(text=test_question)
@@ -50,6 +79,228 @@ async def test_fetching_all_questions(test_question: str, question_repo: Questio
     )
 
 
+async def test_fetching_questions_page(test_question: str, question_repo: QuestionsRepositorySQLA):
+    first_question: Question = await question_repo.create_new_question(
+        CreateQuestion(text=test_question)
+    )
+    created_questions: list[Question] = [
+        await question_repo.create_new_question(
+            CreateQuestion(text=test_question)
+        ),
+        await question_repo.create_new_question(
+            CreateQuestion(text=test_question)
+        ),
+    ]
+
+    page: QuestionsPage = await question_repo.get_questions_page(
+        1,
+        QuestionsPageCursor(sort_value=first_question.created_at, id=first_question.id)
+    )
+    assert page.questions == created_questions[:1]
+    assert page.next_cursor is not None
+
+    next_page: QuestionsPage = await question_repo.get_questions_page(
+        10,
+        QuestionsPageCursor.decode(page.next_cursor)
+    )
+    assert next_page.questions == created_questions[1:]
+    assert next_page.next_cursor is None
+
+
+async def test_streaming_all_questions(test_question: str, question_repo: QuestionsRepositorySQLA):
+    created_questions: list[Question] = [
+        await question_repo.create_new_question(
+            CreateQuestion(text=test_question)
+        ),
+        await question_repo.create_new_question(
+            CreateQuestion(text=test_question)
+        ),
+    ]
+
+    streamed_questions: list[Question] = [
+        question async for question in question_repo.stream_all_questions(batch_size=1)
+    ]
+
+    assert streamed_questions[-2:] == created_questions
+
+
+async def test_core_read_mode_matches_orm(
+    test_question: str,
+    question_repo: QuestionsRepositorySQLA,
+    core_question_repo: QuestionsRepositorySQLA
+):
+    created_questions: list[Question] = await question_repo.create_questions_bulk(
+        [CreateQuestion(text=test_question), CreateQuestion(text=test_question)]
+    )
+    cursor: QuestionsPageCursor = QuestionsPageCursor(
+        sort_value=created_questions[0].created_at,
+        id=created_questions[0].id - 1
+    )
+
+    assert await core_question_repo.fetch_specific_question(
+        created_questions[0].id
+    ) == await question_repo.fetch_specific_question(created_questions[0].id)
+    assert await core_question_repo.fetch_specific_question(1 << 31 - 1) is None
+    assert (await core_question_repo.get_questions_page(10, cursor)).questions == created_questions
+    assert [
+        question async for question in core_question_repo.stream_all_questions()
+    ][-2:] == created_questions
+
+
+@pytest.mark.parametrize("repo_fixture", ["question_repo", "core_question_repo"])
+async def test_read_questions_match_validated_models(
+    request: pytest.FixtureRequest,
+    repo_fixture: str,
+    test_question: str,
+    test_answer: str,
+    response_author: str,
+    question_repo: QuestionsRepositorySQLA,
+    answers_repo: AnswerRepositorySQLA
+):
+    # Questions read from database are not validated, so they must be complete and equal to validated ones
+    repo: QuestionsRepositorySQLA = request.getfixturevalue(repo_fixture)
+    created_question: Question = await question_repo.create_new_question(
+        CreateQuestion(text=test_question)
+    )
+    await answers_repo.create_answer(
+        created_question.id, CreateAnswer(text=test_answer, user_id=response_author)
+    )
+
+    fetched_question_data: QuestionWithAnswers = await repo.fetch_specific_question(created_question.id)
+    read_models: list[Question | Answer] = [
+        fetched_question_data,
+        *fetched_question_data.answers,
+        *(await repo.get_questions_page(1, QuestionsPageCursor(
+            sort_value=created_question.created_at, id=created_question.id - 1
+        ))).questions
+    ]
+
+    for model in read_models:
+        assert model.model_fields_set == set(type(model).model_fields)
+        assert model == type(model).model_validate(model.model_dump())
+        assert model.model_dump_json() == type(model).model_validate(model.model_dump()).model_dump_json()
+
+
+async def test_question_version_changes_with_answers(
+    test_question: str,
+    test_answer: str,
+    response_author: str,
+    question_repo: QuestionsRepositorySQLA,
+    answers_repo: AnswerRepositorySQLA
+):
+    created_question: Question = await question_repo.create_new_question(
+        CreateQuestion(text=test_question)
+    )
+    initial_version: ResourceVersion = await question_repo.get_question_version(created_question.id)
+
+    assert initial_version == await question_repo.get_question_version(created_question.id)
+    assert initial_version.modified_at == created_question.created_at
+
+    created_answer: Answer = await answers_repo.create_answer(
+        created_question.id,
+        CreateAnswer(text=test_answer, user_id=response_author)
+    )
+    answered_version: ResourceVersion = await question_repo.get_question_version(created_question.id)
+    assert answered_version.tag != initial_version.tag
+    assert answered_version.modified_at > initial_version.modified_at
+
+    await answers_repo.delete_answer(created_answer.id)
+    assert (await question_repo.get_question_version(created_question.id)).tag not in {
+        initial_version.tag, answered_version.tag
+    }
+    assert await question_repo.get_question_version(1 << 31 - 1) is None
+
+
+async def test_questions_page_version_changes_with_questions(
+    test_question: str,
+    question_repo: QuestionsRepositorySQLA
+):
+    created_question: Question = await question_repo.create_new_question(
+        CreateQuestion(text=test_question)
+    )
+    cursor: QuestionsPageCursor = QuestionsPageCursor(
+        sort_value=created_question.created_at,
+        id=created_question.id - 1
+    )
+    initial_version: ResourceVersion = await question_repo.get_questions_page_version(10, cursor)
+
+    assert initial_version == await question_repo.get_questions_page_version(10, cursor)
+
+    await question_repo.create_new_question(CreateQuestion(text=test_question))
+    assert initial_version != await question_repo.get_questions_page_version(10, cursor)
+
+    await question_repo.delete_question(created_question.id)
+    assert initial_version != await question_repo.get_questions_page_version(10, cursor)
+
+
+@pytest.mark.parametrize("order", list(QuestionsOrder))
+async def test_pages_of_ordered_questions_follow_each_other(
+    order: QuestionsOrder,
+    question_repo: QuestionsRepositorySQLA
+):
+    whole_page: QuestionsPage = await question_repo.get_questions_page(15, order=order)
+
+    questions: list[Question] = []
+    cursor: QuestionsPageCursor | None = None
+    for _ in range(3):
+        page: QuestionsPage = await question_repo.get_questions_page(5, cursor, order)
+        questions.extend(page.questions)
+        cursor = QuestionsPageCursor.decode(page.next_cursor) if page.next_cursor else None
+
+        assert cursor is None or cursor.order is order
+
+    assert questions == whole_page.questions
+
+
+async def test_questions_ordered_by_answers(
+    test_question: str,
+    test_answer: str,
+    response_author: str,
+    question_repo: QuestionsRepositorySQLA,
+    answers_repo: AnswerRepositorySQLA
+):
+    answered_question: Question = await question_repo.create_new_question(
+        CreateQuestion(text=test_question)
+    )
+    await answers_repo.create_answers_bulk(
+        [(answered_question.id, CreateAnswer(text=test_answer, user_id=response_author))] * 3
+    )
+    unanswered_question: Question = await question_repo.create_new_question(
+        CreateQuestion(text=test_question)
+    )
+
+    by_answer_count: QuestionsPage = await question_repo.get_questions_page(
+        1,
+        QuestionsPageCursor(
+            order=QuestionsOrder.ANSWER_COUNT,
+            sort_value=3,
+            id=unanswered_question.id
+        ),
+        QuestionsOrder.ANSWER_COUNT
+    )
+    assert by_answer_count.questions[0].id == answered_question.id
+    assert by_answer_count.questions[0].answer_count == 3
+
+    # Cursor past all answered questions continues with unanswered ones
+    after_answered: QuestionsPage = await question_repo.get_questions_page(
+        1,
+        QuestionsPageCursor(
+            order=QuestionsOrder.LAST_ANSWER_AT,
+            sort_value=datetime.fromtimestamp(0, timezone.utc),
+            id=0
+        ),
+        QuestionsOrder.LAST_ANSWER_AT
+    )
+    assert after_answered.questions == [unanswered_question]
+    assert after_answered.next_cursor is not None
+    assert QuestionsPageCursor.decode(after_answered.next_cursor).sort_value is None
+
+
+def test_decoding_malformed_cursor():
+    with pytest.raises(InvalidCursorError):
+        PageCursor.decode("not a cursor")
+
+
 async def test_deleting_question(test_question: str, question_repo: QuestionsRepositorySQLA):
     created_question: Question = await question_repo.create_new_question(
         CreateQuestion(text=test_question)
@@ -0,0 +1,81 @@
+import logging
+
+from sqlalchemy import Subquery, column, exc, func, select, text
+
+from .fixtures import *
+
+from qna_server.storage.sqla_implementation import SlowQueryLog
+
+pytestmark = pytest.mark.postgresql_only
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+async def test_slow_statements_are_logged_with_plans(engine: AsyncEngine):
+    SlowQueryLog(threshold_seconds=0.05, explain_every=1).attach(engine)
+    handler: RecordingHandler = RecordingHandler()
+    logger: logging.Logger = logging.getLogger("qna_logger.slow_queries")
+    logger.addHandler(handler)
+
+    try:
+        async with engine.begin() as connection:
+            slow: Subquery = (
+                text("SELECT pg_sleep(:seconds) AS slept")
+                .columns(column("slept"))
+                .subquery("slow")
+            )
+            await connection.execute(text("SELECT 1"))
+            await connection.execute(select(slow.c.slept), {"seconds": 0.06})
+
+            # Plan is captured in a savepoint, so transaction stays usable
+            assert (await connection.execute(text("SELECT 2"))).scalar_one() == 2
+
+        with pytest.raises(exc.DBAPIError):
+            async with engine.begin() as connection:
+                await connection.execute(text("SET LOCAL statement_timeout = 60"))
+                await connection.execute(text("SELECT pg_sleep(1)"))
+
+    finally:
+        logger.removeHandler(handler)
+        await engine.dispose()
+
+    messages: list[str] = handler.messages
+    assert len(messages) == 2
+    assert "SELECT pg_sleep($1) AS slept" in messages[0]
+    assert "parameters: <redacted>" in messages[0]
+    assert "Plan:\nResult" in messages[0]
+    assert messages[1].startswith("Slow statement failed after")
+    assert "statement timeout" in messages[1]
+
+
+async def test_statements_with_side_effects_are_not_explained(engine: AsyncEngine):
+    SlowQueryLog(threshold_seconds=0.05, explain_every=1).attach(engine)
+    handler: RecordingHandler = RecordingHandler()
+    logger: logging.Logger = logging.getLogger("qna_logger.slow_queries")
+    logger.addHandler(handler)
+
+    try:
+        async with engine.begin() as connection:
+            # Running them again would send notifications twice
+            await connection.execute(
+                text("SELECT pg_notify(:channel, 'explained'), pg_sleep(:seconds)"),
+                {"channel": "qna_slow_query_test", "seconds": 0.06}
+            )
+            await connection.execute(
+                select(func.pg_notify("qna_slow_query_test", "explained"), func.pg_sleep(0.06))
+            )
+
+    finally:
+        logger.removeHandler(handler)
+        await engine.dispose()
+
+    messages: list[str] = handler.messages
+    assert len(messages) == 2
+    assert all("pg_notify" in message and "Plan:" not in message for message in messages)